@@ -5,6 +5,8 @@ from dotenv import load_dotenv
 import os
 import json
 
+from http_client import get_http_client, get_async_http_client
+
 # Load environment variables
 load_dotenv()
 
@@ -12,7 +14,9 @@ load_dotenv()
 llm = ChatGroq(
     model="llama-3.3-70b-versatile",
     api_key=os.getenv("GROQ_API_KEY"),
-    temperature=0.7
+    temperature=0.7,
+    http_client=get_http_client(),
+    http_async_client=get_async_http_client()
 )
 
 def generate_quiz(topic: str) -> str:
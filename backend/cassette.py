@@ -0,0 +1,295 @@
+"""
+Record/Replay Cassettes for ResuMatch
+Captures outbound HTTP traffic (RemoteOK, YouTube, Groq) on disk and replays it offline
+"""
+
+import asyncio
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import threading
+import time
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import logging
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+# Query parameters never written to disk or used in cassette keys
+SECRET_PARAMS = {'key', 'api_key', 'apikey', 'access_token'}
+# Describe the original wire format; the stored body is already decoded
+DROPPED_HEADERS = {
+    'content-encoding', 'transfer-encoding', 'content-length', 'connection', 'set-cookie', 'content-location'
+}
+
+# googleapiclient batch bodies are multipart/mixed with a random boundary,
+# a uuid in every part's Content-ID and the API key in each inner request line
+MULTIPART_BOUNDARY_RE = re.compile(rb'\A--([^\r\n]+)\r?\n')
+CONTENT_ID_RE = re.compile(rb'^(Content-ID: <)[^>]*?( \+ )', re.IGNORECASE | re.MULTILINE)
+SECRET_PARAM_RE = re.compile(
+    rb'([?&])(?:' + b'|'.join(p.encode('ascii') for p in sorted(SECRET_PARAMS)) + rb')=[^&\s]*&?', re.IGNORECASE
+)
+
+
+class CassetteMissError(requests.ConnectionError):
+    """Replay mode was asked for a request that was never recorded."""
+
+
+class Cassette:
+    """
+    On-disk store of recorded HTTP interactions.
+
+    Interactions are keyed by method, URL (API keys stripped, query sorted)
+    and request body (see clean_body), so a replayed run sees exactly the responses of the
+    recorded one. In replay mode the recorded latency, a fixed synthetic
+    latency, or none at all is added to every response.
+    """
+
+    def __init__(self, directory: str, mode: str, latency: str = 'none'):
+        self.directory = directory
+        self.mode = mode  # 'record' or 'replay'
+        self.latency = latency  # 'none', 'recorded' or seconds
+        self._lock = threading.Lock()
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == 'replay'
+
+    @staticmethod
+    def clean_url(url: str) -> str:
+        parts = urlsplit(url)
+        query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k.lower() not in SECRET_PARAMS)
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ''))
+
+    @staticmethod
+    def clean_body(body: bytes) -> bytes:
+        """
+        Request body as used in cassette keys.
+
+        Multipart (batch) bodies lose their random boundary, the uuids in
+        their Content-IDs and any API keys of the inner requests, so the same
+        batch recorded once replays in any later run.
+        """
+        match = MULTIPART_BOUNDARY_RE.match(body)
+        if match is None:
+            return body
+        body = body.replace(match.group(1), b'BOUNDARY')
+        body = CONTENT_ID_RE.sub(rb'\1\2', body)
+        return SECRET_PARAM_RE.sub(rb'\1', body)
+
+    def _path(self, method: str, url: str, body) -> str:
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        key = f"{method.upper()} {self.clean_url(url)}\n".encode('utf-8') + self.clean_body(body or b'')
+        digest = hashlib.sha256(key).hexdigest()
+        host = urlsplit(url).netloc.replace(':', '_') or 'local'
+        return os.path.join(self.directory, host, f"{digest[:32]}.json")
+
+    def load(self, method: str, url: str, body=None) -> dict:
+        """
+        Recorded interaction for a request.
+
+        Raises:
+            CassetteMissError: If the request was never recorded
+        """
+        path = self._path(method, url, body)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                interaction = json.load(f)
+        except FileNotFoundError:
+            raise CassetteMissError(f"No cassette recorded for {method.upper()} {self.clean_url(url)}")
+        interaction['body'] = base64.b64decode(interaction['body'])
+        return interaction
+
+    def save(self, method: str, url: str, body, status: int, headers: dict, content: bytes, elapsed: float) -> dict:
+        interaction = {
+            'method': method.upper(),
+            'url': self.clean_url(url),
+            'status': status,
+            'headers': {k.lower(): v for k, v in headers.items() if k.lower() not in DROPPED_HEADERS},
+            'body': base64.b64encode(content).decode('ascii'),
+            'elapsed': round(elapsed, 4)
+        }
+        path = self._path(method, url, body)
+        with self._lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.tmp"
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(interaction, f, indent=1)
+            os.replace(tmp, path)
+        interaction['body'] = content
+        return interaction
+
+    def delay(self, interaction: dict) -> float:
+        """Seconds to wait before returning a replayed response."""
+        if self.latency == 'recorded':
+            return interaction.get('elapsed', 0.0)
+        try:
+            return max(0.0, float(self.latency))
+        except ValueError:
+            return 0.0
+
+
+_cassette = None
+_cassette_lock = threading.Lock()
+
+
+def get_cassette() -> Optional[Cassette]:
+    """The process-wide cassette, or None unless CASSETTE_MODE is 'record' or 'replay'."""
+    global _cassette
+    if Config.CASSETTE_MODE not in ('record', 'replay'):
+        return None
+    if _cassette is None:
+        with _cassette_lock:
+            if _cassette is None:
+                _cassette = Cassette(Config.CASSETTE_DIR, Config.CASSETTE_MODE, Config.CASSETTE_LATENCY)
+                logger.info(f"HTTP cassette mode '{Config.CASSETTE_MODE}' using {Config.CASSETTE_DIR}")
+    return _cassette
+
+
+# =============================================================================
+# requests
+# =============================================================================
+
+class CassetteAdapter(HTTPAdapter):
+    """HTTPAdapter that records responses to, or replays them from, a cassette."""
+
+    def __init__(self, cassette: Cassette, **kwargs):
+        self.cassette = cassette
+        super().__init__(**kwargs)
+
+    def send(self, request, **kwargs):
+        if self.cassette.replaying:
+            interaction = self.cassette.load(request.method, request.url, request.body)
+            time.sleep(self.cassette.delay(interaction))
+        else:
+            started = time.perf_counter()
+            response = super().send(request, **kwargs)
+            content = response.content
+            interaction = self.cassette.save(
+                request.method, request.url, request.body, response.status_code,
+                dict(response.headers), content, time.perf_counter() - started
+            )
+        return self._to_response(request, interaction)
+
+    @staticmethod
+    def _to_response(request, interaction: dict) -> requests.Response:
+        response = requests.Response()
+        response.status_code = interaction['status']
+        response.headers = CaseInsensitiveDict(interaction['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(interaction['body'])
+        response.url = request.url
+        response.request = request
+        return response
+
+
+# =============================================================================
+# httpx
+# =============================================================================
+
+def _httpx_response(request: httpx.Request, interaction: dict) -> httpx.Response:
+    return httpx.Response(
+        interaction['status'], headers=interaction['headers'], content=interaction['body'], request=request
+    )
+
+
+class CassetteTransport(httpx.BaseTransport):
+    """httpx transport that records or replays through a cassette."""
+
+    def __init__(self, transport: httpx.BaseTransport, cassette: Cassette):
+        self._transport = transport
+        self.cassette = cassette
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        body = request.read()
+        if self.cassette.replaying:
+            interaction = self.cassette.load(request.method, str(request.url), body)
+            time.sleep(self.cassette.delay(interaction))
+        else:
+            started = time.perf_counter()
+            response = self._transport.handle_request(request)
+            content = response.read()
+            response.close()
+            interaction = self.cassette.save(
+                request.method, str(request.url), body, response.status_code,
+                dict(response.headers), content, time.perf_counter() - started
+            )
+        return _httpx_response(request, interaction)
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+    """Asyncio counterpart of CassetteTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, cassette: Cassette):
+        self._transport = transport
+        self.cassette = cassette
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        if self.cassette.replaying:
+            interaction = self.cassette.load(request.method, str(request.url), body)
+            await asyncio.sleep(self.cassette.delay(interaction))
+        else:
+            started = time.perf_counter()
+            response = await self._transport.handle_async_request(request)
+            content = await response.aread()
+            await response.aclose()
+            interaction = self.cassette.save(
+                request.method, str(request.url), body, response.status_code,
+                dict(response.headers), content, time.perf_counter() - started
+            )
+        return _httpx_response(request, interaction)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+# =============================================================================
+# httplib2 (googleapiclient)
+# =============================================================================
+
+class CassetteHttp:
+    """Wraps an httplib2.Http so googleapiclient requests go through a cassette."""
+
+    def __init__(self, http, cassette: Cassette):
+        self.http = http
+        self.cassette = cassette
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5, connection_type=None):
+        import httplib2
+
+        if self.cassette.replaying:
+            interaction = self.cassette.load(method, uri, body)
+            time.sleep(self.cassette.delay(interaction))
+        else:
+            started = time.perf_counter()
+            response, content = self.http.request(
+                uri, method=method, body=body, headers=headers,
+                redirections=redirections, connection_type=connection_type
+            )
+            # httplib2 adds 'status' and '-x-...' pseudo headers
+            headers_out = {k: v for k, v in response.items() if k != 'status' and not k.startswith('-')}
+            interaction = self.cassette.save(
+                method, uri, body, response.status, headers_out, content, time.perf_counter() - started
+            )
+        info = dict(interaction['headers'])
+        info['status'] = str(interaction['status'])
+        return httplib2.Response(info), interaction['body']
+
+    def __getattr__(self, name):
+        return getattr(self.http, name)
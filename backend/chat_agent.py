@@ -11,6 +11,7 @@ from langgraph.checkpoint.memory import MemorySaver
 # Import tools
 from agent_tools.quiz_master import generate_quiz
 from agent_tools.project_architect import generate_project_idea
+from http_client import get_http_client, get_async_http_client
 
 # Define State
 class ChatState(TypedDict):
@@ -21,7 +22,9 @@ class ChatState(TypedDict):
 llm = ChatGroq(
     model="llama-3.3-70b-versatile",
     api_key=os.getenv("GROQ_API_KEY"),
-    temperature=0.7
+    temperature=0.7,
+    http_client=get_http_client(),
+    http_async_client=get_async_http_client()
 )
 
 # System Prompt - Enhanced to handle quiz and project requests
@@ -48,6 +48,35 @@ class Config:
     DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///resumatch.db")
     REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379")
     CACHE_TTL = int(os.getenv("CACHE_TTL", 3600))
+    HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", 30))
+    HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 5))
+    HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+    HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("HTTP_MAX_CONNECTIONS_PER_HOST", 20))
+    HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 60))
+    JOB_SOURCES = [s.strip() for s in os.getenv("JOB_SOURCES", "remoteok").split(",") if s.strip()]
+    LOCAL_JOBS_DIR = os.getenv("LOCAL_JOBS_DIR", "")
+    JOB_SOURCE_DEADLINE = float(os.getenv("JOB_SOURCE_DEADLINE", 20))
+    CASSETTE_MODE = os.getenv("CASSETTE_MODE", "off").lower()
+    CASSETTE_DIR = os.getenv("CASSETTE_DIR", "cassettes")
+    CASSETTE_LATENCY = os.getenv("CASSETTE_LATENCY", "none").lower()
+    COURSE_CACHE_PATH = os.getenv(
+        "COURSE_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "courses.db")
+    )
+    COURSE_CACHE_TTL = int(os.getenv("COURSE_CACHE_TTL", 7 * 24 * 3600))
+    COURSE_CACHE_MAX_ENTRIES = int(os.getenv("COURSE_CACHE_MAX_ENTRIES", 5000))
+    COURSE_CACHE_REFRESH_AHEAD = int(os.getenv("COURSE_CACHE_REFRESH_AHEAD", 24 * 3600))
+    COURSE_CACHE_REFRESH_INTERVAL = int(os.getenv("COURSE_CACHE_REFRESH_INTERVAL", 3600))
+    COURSE_FETCH_WORKERS = int(os.getenv("COURSE_FETCH_WORKERS", 16))
+    COURSE_STAGE_DEADLINE = float(os.getenv("COURSE_STAGE_DEADLINE", 10))
+    WORKFLOW_NODE_WORKERS = int(os.getenv("WORKFLOW_NODE_WORKERS", 32))
+    ROLE_VIEW_MAX_ENTRIES = int(os.getenv("ROLE_VIEW_MAX_ENTRIES", 5000))
+    MARKET_PREFETCH_ENABLED = os.getenv("MARKET_PREFETCH_ENABLED", "True").lower() == "true"
+    MARKET_PREFETCH_ROLES = int(os.getenv("MARKET_PREFETCH_ROLES", 2))
+    COURSE_CATALOG_PATH = os.getenv("COURSE_CATALOG_PATH", "")
+    YOUTUBE_QUOTA_PATH = os.getenv("YOUTUBE_QUOTA_PATH", COURSE_CACHE_PATH)
+    YOUTUBE_DAILY_BUDGET = int(os.getenv("YOUTUBE_DAILY_BUDGET", 10000))
+    YOUTUBE_SEARCH_COST = int(os.getenv("YOUTUBE_SEARCH_COST", 100))
+    YOUTUBE_REFRESH_RESERVE = int(os.getenv("YOUTUBE_REFRESH_RESERVE", 2000))
     @classmethod
     def get_model_config(cls) -> Dict[str, Any]:
         return {
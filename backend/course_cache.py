@@ -0,0 +1,162 @@
+"""
+Persistent Course Search Cache for ResuMatch
+YouTube search results keyed by normalized skill, kept in SQLite with an in-memory LRU front
+"""
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterator, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS course_searches (
+    skill_key TEXT NOT NULL,
+    max_results INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    courses TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_used REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (skill_key, max_results)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS course_searches_last_used ON course_searches (last_used);
+"""
+
+SKILL_KEY_RE = re.compile(r'[^a-z0-9+#.]+')
+
+# Entries held in process memory in front of SQLite
+MEMORY_ENTRIES = 512
+
+
+def skill_key(skill: str) -> str:
+    """Normalize a skill so "Docker ", "docker" and "DOCKER!" share one entry."""
+    return ' '.join(SKILL_KEY_RE.sub(' ', skill.lower()).split())
+
+
+class CourseCache:
+    """
+    Course search results with a TTL and an LRU size limit.
+
+    Hits are served from an in-process LRU dict; misses fall through to a
+    SQLite table shared by all workers. Entries past their TTL are not
+    returned by get() but stay available through get_stale() (e.g. when the
+    API is out of quota) until evicted as least recently used.
+    """
+
+    def __init__(self, path: str, ttl: float, max_entries: int):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._memory = OrderedDict()  # (skill_key, max_results) -> (fetched_at, courses)
+        self._memory_lock = threading.Lock()
+        self._pending_hits = {}  # (skill_key, max_results) -> hits not yet written
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def lookup(self, skill: str, max_results: int) -> Optional[Tuple[float, List[dict]]]:
+        """(fetched_at, courses) for a skill regardless of age, or None."""
+        key = (skill_key(skill), max_results)
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+        if entry is None:
+            row = self._connect().execute(
+                "SELECT fetched_at, courses FROM course_searches WHERE skill_key = ? AND max_results = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+            entry = (row['fetched_at'], json.loads(row['courses']))
+            self._remember(key, entry)
+        # Usage is written back in batches so memory hits never touch SQLite
+        with self._memory_lock:
+            self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+        return entry
+
+    def flush_hits(self) -> None:
+        """Write accumulated hit counts and last-used times to SQLite."""
+        with self._memory_lock:
+            pending, self._pending_hits = self._pending_hits, {}
+        if pending:
+            now = time.time()
+            self._connect().executemany(
+                "UPDATE course_searches SET hits = hits + ?, last_used = ? WHERE skill_key = ? AND max_results = ?",
+                [(hits, now, *key) for key, hits in pending.items()]
+            )
+
+    def get(self, skill: str, max_results: int) -> Optional[List[dict]]:
+        """Cached courses if they are younger than the TTL."""
+        entry = self.lookup(skill, max_results)
+        if entry is None or time.time() - entry[0] > self.ttl:
+            return None
+        return entry[1]
+
+    def get_stale(self, skill: str, max_results: int) -> Optional[List[dict]]:
+        """Cached courses of any age."""
+        entry = self.lookup(skill, max_results)
+        return entry[1] if entry else None
+
+    def put(self, skill: str, max_results: int, courses: List[dict]) -> None:
+        key = (skill_key(skill), max_results)
+        self.flush_hits()
+        now = time.time()
+        conn = self._connect()
+        conn.execute(
+            "INSERT INTO course_searches (skill_key, max_results, skill, courses, fetched_at, last_used, hits) "
+            "VALUES (?, ?, ?, ?, ?, ?, 0) "
+            "ON CONFLICT(skill_key, max_results) DO UPDATE SET "
+            "skill = excluded.skill, courses = excluded.courses, fetched_at = excluded.fetched_at",
+            (key[0], max_results, skill, json.dumps(courses), now, now)
+        )
+        # LRU eviction beyond the size limit
+        conn.execute(
+            "DELETE FROM course_searches WHERE (skill_key, max_results) IN ("
+            "SELECT skill_key, max_results FROM course_searches ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_entries,)
+        )
+        self._remember(key, (now, courses))
+
+    def _remember(self, key: tuple, entry: tuple) -> None:
+        with self._memory_lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > min(MEMORY_ENTRIES, self.max_entries):
+                self._memory.popitem(last=False)
+
+    def searches(self) -> Iterator[Tuple[str, List[dict]]]:
+        """(skill, courses) of every cached search, any age."""
+        cursor = self._connect().execute("SELECT skill, courses FROM course_searches")
+        for row in cursor:
+            yield row['skill'], json.loads(row['courses'])
+
+    def due_for_refresh(self, limit: int, ahead: float) -> List[Tuple[str, int]]:
+        """
+        (skill, max_results) of the most used entries that expire within `ahead` seconds.
+
+        Used to re-fetch hot skills before they go stale.
+        """
+        self.flush_hits()
+        rows = self._connect().execute(
+            "SELECT skill, max_results FROM course_searches WHERE fetched_at < ? "
+            "ORDER BY hits DESC LIMIT ?",
+            (time.time() - self.ttl + ahead, limit)
+        ).fetchall()
+        return [(row['skill'], row['max_results']) for row in rows]
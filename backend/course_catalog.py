@@ -0,0 +1,166 @@
+"""
+Local Course Catalog for ResuMatch
+Courses from past YouTube searches and a curated file, searchable offline with an in-memory BM25 index
+"""
+
+import json
+import math
+import threading
+from collections import defaultdict
+from typing import Dict, Iterable, List
+import logging
+
+from job_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Fields indexed per course and the weight of one occurrence in each.
+# 'skills' holds the skill searches that returned the course (or the
+# curated file's tags), the strongest signal of what a course teaches.
+FIELD_WEIGHTS = {'title': 3.0, 'skills': 3.0, 'channel': 1.5, 'description': 1.0}
+
+# Words every course query/title is full of; they never narrow a search
+CATALOG_STOPWORDS = {'course', 'courses', 'tutorial', 'tutorials', 'full', 'learn', 'for', 'beginners', 'complete', 'and', 'the', 'a', 'to', 'in', 'of'}
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Keys every course dict handed to the LLM context must have
+COURSE_DEFAULTS = {'video_id': None, 'description': '', 'thumbnail': '', 'channel': 'Unknown', 'is_educational': True}
+
+
+def course_id(course: dict) -> str:
+    return course.get('video_id') or course.get('url', '')
+
+
+def query_terms(text: str) -> List[str]:
+    return list(dict.fromkeys(t for t in tokenize(text) if t not in CATALOG_STOPWORDS))
+
+
+class CourseCatalog:
+    """
+    In-memory ranked text index over known courses.
+
+    A course matches a query when every query term occurs in one of its
+    fields; matches are ranked with BM25 over field-weighted term
+    frequencies. Courses are only ever added, so an index for a few tens
+    of thousands of courses stays small and is rebuilt on each start.
+    """
+
+    def __init__(self):
+        self._courses = []  # doc -> course dict
+        self._docs = {}  # course_id -> doc
+        self._postings = defaultdict(dict)  # term -> {doc: weighted tf}
+        self._lengths = []  # doc -> weighted length
+        self._total_length = 0.0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._courses)
+
+    def add(self, course: dict, skills: Iterable[str] = ()) -> bool:
+        """
+        Index a course unless it is already known; a known course only gains the new skills.
+
+        Returns:
+            True if the course was new
+        """
+        key = course_id(course)
+        if not key or not course.get('title') or not course.get('url'):
+            return False
+        skills = ' '.join(skills)
+        with self._lock:
+            doc = self._docs.get(key)
+            if doc is not None:
+                if skills:
+                    self._index(doc, {'skills': skills})
+                return False
+            doc = len(self._courses)
+            self._courses.append({**COURSE_DEFAULTS, **{k: v for k, v in course.items() if k != 'skills'}})
+            self._docs[key] = doc
+            self._lengths.append(0.0)
+            self._index(doc, {
+                'title': course.get('title', ''),
+                'skills': skills,
+                'channel': course.get('channel', ''),
+                'description': course.get('description', '')
+            })
+            return True
+
+    def _index(self, doc: int, fields: Dict[str, str]) -> None:
+        length = 0.0
+        for field, text in fields.items():
+            weight = FIELD_WEIGHTS[field]
+            for term in tokenize(text or ''):
+                postings = self._postings[term]
+                postings[doc] = postings.get(doc, 0.0) + weight
+                length += weight
+        self._lengths[doc] += length
+        self._total_length += length
+
+    def add_many(self, courses: Iterable[dict], skill: str = '') -> int:
+        """Index several courses returned for one skill; returns how many were new."""
+        skills = [skill] if skill else []
+        return sum(1 for course in courses if self.add(course, skills))
+
+    def load_jsonl(self, path: str) -> int:
+        """
+        Add a curated catalog: one course per line, in the search result shape,
+        with an optional "skills" list of what the course teaches.
+
+        Returns:
+            Number of courses added
+        """
+        added = 0
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    course = json.loads(line)
+                except json.JSONDecodeError as e:
+                    logger.warning(f"Skipping malformed catalog line {line_no} in {path}: {e}")
+                    continue
+                if not isinstance(course, dict):
+                    continue
+                added += self.add(course, course.get('skills') or [])
+        logger.info(f"Loaded {added} curated courses from {path}")
+        return added
+
+    def search(self, query: str, limit: int = 5) -> List[dict]:
+        """
+        Courses matching every term of the query, best first.
+
+        Args:
+            query: A skill such as "Machine Learning" or "C++"
+            limit: Maximum courses returned
+
+        Returns:
+            Course dicts (copies), at most limit
+        """
+        terms = query_terms(query)
+        if not terms:
+            return []
+        with self._lock:
+            postings = [self._postings.get(term) for term in terms]
+            if not all(postings):
+                return []
+            postings.sort(key=len)
+            docs = set(postings[0])
+            for term_postings in postings[1:]:
+                docs.intersection_update(term_postings)
+            if not docs:
+                return []
+
+            n_docs = len(self._courses)
+            avg_length = self._total_length / n_docs
+            scores = dict.fromkeys(docs, 0.0)
+            for term_postings in postings:
+                idf = math.log(1 + (n_docs - len(term_postings) + 0.5) / (len(term_postings) + 0.5))
+                for doc in docs:
+                    tf = term_postings[doc]
+                    norm = BM25_K1 * (1 - BM25_B + BM25_B * self._lengths[doc] / avg_length)
+                    scores[doc] += idf * tf * (BM25_K1 + 1) / (tf + norm)
+            ranked = sorted(docs, key=lambda doc: (-scores[doc], doc))[:limit]
+            return [dict(self._courses[doc]) for doc in ranked]
@@ -1,16 +1,25 @@
-import requests
+import asyncio
 import json
 import os
-import re
-from collections import Counter
+import threading
+import time
 import logging
 
+from config import Config
+from job_index import tokenize_role
+from job_sources import acollect_jobs, collect_jobs, get_job_sources
+from job_store import JobStore
+from single_flight import SingleFlight
+from skill_extractor import SkillExtractor
+from term_matrix import TermMatrix
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
-OUTPUT_FILE = os.path.join(DATA_DIR, 'market_trends.json')
+# On-disk job store (SQLite + FTS5) shared by every worker process
+STORE_FILE = os.getenv("MARKET_DB_PATH", os.path.join(DATA_DIR, 'market.db'))
 
 # Common English stopwords and generic terms to exclude
 STOPWORDS = {
@@ -93,6 +102,480 @@ KNOWN_SKILLS = {
     'cassandra', 'hbase', 'neo4j', 'elasticsearch', 'opensearch', 'solr', 'lucene'
 }
 
+# Compiled once; shared by role queries, market trends and resume-side detection
+known_skills_extractor = SkillExtractor(KNOWN_SKILLS)
+
+
+# =============================================================================
+# Feed Snapshot Cache
+# =============================================================================
+
+class FeedSnapshot:
+    """An immutable copy of the merged job feeds as downloaded at one point in time."""
+
+    def __init__(self, records: list, fetched_at: float, date: str = None, failed_sources: list = ()):
+        # Normalized JobRecords keyed by job id (first occurrence wins)
+        self.records = {}
+        for record in records:
+            self.records.setdefault(record.id, record)
+        self.jobs = list(self.records.values())
+        self.fetched_at = fetched_at  # time.monotonic() of the download
+        self.date = date  # HTTP 'Date' header reported by RemoteOK
+        self.failed_sources = list(failed_sources)  # sources that did not answer this round
+
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+    def retains(self, job_id: str) -> bool:
+        """True if a job must be kept in the store although it is missing from this snapshot."""
+        return any(source.owns(job_id) for source in self.failed_sources)
+
+
+def download_feed(timeout: int = 10, previous: FeedSnapshot = None) -> FeedSnapshot:
+    """
+    Download every enabled job source (RemoteOK, local files, ...) and merge them.
+
+    Sources are queried concurrently, each under its own deadline. Bodies are
+    parsed as streams and each posting is normalized as soon as it arrives;
+    postings already present in the previous snapshot reuse its records, so
+    only new job ids are cleaned and tokenized.
+    """
+    results = collect_jobs(
+        get_job_sources(), timeout, previous.records if previous else None, known_skills_extractor
+    )
+    return FeedSnapshot(results.records, time.monotonic(), results.date, results.failed)
+
+
+async def adownload_feed(timeout: int = 10, previous: FeedSnapshot = None) -> FeedSnapshot:
+    """
+    Asyncio counterpart of download_feed on the shared non-blocking HTTP client.
+
+    The event loop keeps serving other requests while the sources respond.
+    """
+    results = await acollect_jobs(
+        get_job_sources(), timeout, previous.records if previous else None, known_skills_extractor
+    )
+    return FeedSnapshot(results.records, time.monotonic(), results.date, results.failed)
+
+
+class FeedCache:
+    """
+    Process-wide cache of the RemoteOK feed with stale-while-revalidate.
+
+    The first caller downloads the feed synchronously; concurrent cold callers
+    wait for that single download. Once a snapshot exists it is always served
+    immediately. When it is older than the TTL, exactly one background thread
+    refreshes it while callers keep reading the stale copy.
+
+    Listeners are called with every newly published snapshot (e.g. to sync
+    the on-disk job store).
+    """
+
+    def __init__(self, ttl: int = Config.CACHE_TTL, timeout: int = 10):
+        self.ttl = ttl
+        self.timeout = timeout
+        self.listeners = []
+        self._snapshot = None
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._retry_at = 0.0
+        self._cold_download = None  # asyncio task shared by concurrent aget() callers
+
+    def get(self) -> FeedSnapshot:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._lock:
+                # Another thread may have finished the cold download while we waited
+                if self._snapshot is None:
+                    self._publish(download_feed(self.timeout))
+                return self._snapshot
+
+        if snapshot.age() > self.ttl:
+            self.refresh_in_background()
+        return snapshot
+
+    async def aget(self) -> FeedSnapshot:
+        """Like get(), but a cold download is awaited instead of blocking the event loop."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            if self._cold_download is None:
+                self._cold_download = asyncio.ensure_future(self._adownload_cold())
+            # Shielded so one cancelled caller does not abort the download for the others
+            return await asyncio.shield(self._cold_download)
+
+        if snapshot.age() > self.ttl:
+            self.refresh_in_background()
+        return snapshot
+
+    async def _adownload_cold(self) -> FeedSnapshot:
+        try:
+            if self._snapshot is None:
+                snapshot = await adownload_feed(self.timeout)
+                # Listeners write to SQLite; keep that off the event loop
+                await asyncio.to_thread(self._publish, snapshot)
+            return self._snapshot
+        finally:
+            self._cold_download = None
+
+    def refresh(self, timeout: int = None) -> FeedSnapshot:
+        """Download a fresh snapshot now and publish it to every reader."""
+        snapshot = download_feed(timeout or self.timeout, previous=self._snapshot)
+        self._publish(snapshot)
+        return snapshot
+
+    def _publish(self, snapshot: FeedSnapshot) -> None:
+        self._snapshot = snapshot
+        for listener in self.listeners:
+            listener(snapshot)
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+
+    def refresh_in_background(self) -> None:
+        """Start a background refresh unless one is running or backing off."""
+        if time.monotonic() < self._retry_at:
+            return
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(target=self._background_refresh, name="remoteok-feed-refresh", daemon=True).start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            # Keep serving the stale snapshot and back off before trying again
+            self._retry_at = time.monotonic() + min(self.ttl, 60)
+            logger.warning(f"Background feed refresh failed, serving stale snapshot: {e}")
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+
+feed_cache = FeedCache()
+
+
+# =============================================================================
+# Job Store
+# =============================================================================
+
+_job_store = None
+_job_store_lock = threading.Lock()
+
+
+def get_job_store() -> JobStore:
+    """Open the on-disk job store once per process."""
+    global _job_store
+    if _job_store is None:
+        with _job_store_lock:
+            if _job_store is None:
+                _job_store = JobStore(STORE_FILE, Config.ROLE_VIEW_MAX_ENTRIES, POPULAR_ROLE_VIEWS)
+    return _job_store
+
+
+def _sync_job_store(snapshot: FeedSnapshot) -> None:
+    get_job_store().sync(snapshot.records, snapshot.date, retain=snapshot.retains)
+
+
+feed_cache.listeners.append(_sync_job_store)
+
+
+def _check_job_store() -> tuple:
+    """
+    Open the job store and start a background refresh if it is stale.
+
+    Returns:
+        Tuple of (store, whether it was never synced)
+    """
+    store = get_job_store()
+    synced_at = store.synced_at()
+    if synced_at is not None and time.time() - synced_at > feed_cache.ttl and store.claim_refresh(lease=60):
+        feed_cache.refresh_in_background()
+    return store, synced_at is None
+
+
+def _sync_cold_job_store(snapshot: FeedSnapshot) -> None:
+    # Another worker may have synced while this one was downloading
+    if get_job_store().synced_at() is None:
+        _sync_job_store(snapshot)
+
+
+def get_synced_job_store() -> JobStore:
+    """
+    Return the job store, making sure it holds a recent copy of the feed.
+
+    The store is shared by all workers, so a worker only downloads the feed
+    when nobody has synced it yet (blocking) or when the last sync is older
+    than the TTL (background refresh, claimed by a single worker).
+    """
+    store, cold = _check_job_store()
+    if cold:
+        _sync_cold_job_store(feed_cache.get())
+    return store
+
+
+async def aget_synced_job_store() -> JobStore:
+    """
+    Asyncio counterpart of get_synced_job_store; a cold store awaits the download.
+
+    Opening the store and claiming a refresh are SQLite calls that can wait
+    on another worker's write lock, so they run in a worker thread.
+    """
+    store, cold = await asyncio.to_thread(_check_job_store)
+    if cold:
+        snapshot = await feed_cache.aget()
+        await asyncio.to_thread(_sync_cold_job_store, snapshot)
+    return store
+
+
+# =============================================================================
+# Role Market Views
+# =============================================================================
+
+# Role views re-materialized after every feed change, most requested first
+POPULAR_ROLE_VIEWS = 50
+# Upper bound on role views held in process memory
+ROLE_VIEW_CACHE_SIZE = 1000
+
+# In-process copy of the materialized views: (role_key, max_jobs) -> (feed_version, result)
+_role_view_cache = {}
+
+
+def role_view_key(role: str) -> str:
+    """Normalize a role so "Senior Python Engineer" and "python engineer senior" share a view."""
+    return ' '.join(sorted(tokenize_role(role)))
+
+
+_term_matrix = None
+_term_matrix_lock = threading.Lock()
+
+
+def get_term_matrix(store: JobStore) -> TermMatrix:
+    """Job x term matrix for the store's current feed version, rebuilt only when the feed changed."""
+    global _term_matrix
+    version = store.feed_version()
+    matrix = _term_matrix
+    if matrix is None or matrix.feed_version != version:
+        with _term_matrix_lock:
+            matrix = _term_matrix
+            if matrix is None or matrix.feed_version != version:
+                matrix = _term_matrix = TermMatrix.from_store(store, STOPWORDS)
+    return matrix
+
+
+def _rebuild_term_matrix(snapshot: FeedSnapshot = None) -> None:
+    get_term_matrix(get_job_store())
+
+
+# Built at ingest, right after the store sync, so role queries never pay for it
+feed_cache.listeners.append(_rebuild_term_matrix)
+
+
+_title_terms = (None, frozenset())
+
+
+def get_title_terms(store: JobStore) -> frozenset:
+    """Words of the stored job titles at the store's current feed version."""
+    global _title_terms
+    version = store.feed_version()
+    if _title_terms[0] != version:
+        _title_terms = (version, frozenset(store.title_terms()))
+    return _title_terms[1]
+
+
+def rank_role_jobs(role: str, ranked: list) -> list:
+    """Matched jobs from a store.search() ranking, with the role-debug trace."""
+    # Convert role to keywords for matching
+    # Handle slashes like "AI Engineer/Data Scientist" -> "AI Engineer Data Scientist"
+    role_keywords = tokenize_role(role)
+    match_scores = [score for score, _ in ranked]
+    matched_jobs = [job for _, job in ranked]
+    
+    try:
+        with open("debug_role.txt", "a", encoding="utf-8") as f:
+            f.write(f"Keywords: {role_keywords}\n")
+            f.write(f"Matched Jobs after Generic Filter: {len(matched_jobs)}\n")
+            if len(matched_jobs) > 0:
+                f.write(f"Top Match: {matched_jobs[0]['title']} Score: {match_scores[0]}\n")
+    except:
+        pass
+    
+    logger.info(f"Found {len(matched_jobs)} jobs matching '{role}'")
+    return matched_jobs
+
+
+def build_role_view(role: str, matched_jobs: list, skill_frequencies: list) -> dict:
+    """Assemble the role market view returned by fetch_jobs_by_role."""
+    # Job entries were cleaned and truncated at ingest
+    clean_jobs = [
+        {
+            'id': job['id'],
+            'title': job['title'],
+            'company': job['company'],
+            'description': job['description'],
+            'url': job['url'],
+            'date': job['date'],
+            'tags': job['tags'],
+            'salary': job['salary']
+        }
+        for job in matched_jobs
+    ]
+    
+    return {
+        'role': role,
+        'jobs': clean_jobs,
+        'market_skills': [s['skill'] for s in skill_frequencies],
+        'skill_frequencies': skill_frequencies
+    }
+
+
+def compute_role_views(store: JobStore, roles: list) -> list:
+    """
+    Compute market views for several (role, max_jobs) pairs.
+
+    Jobs are ranked through the FTS5 index (BM25, title-weighted) with every
+    query reading the same store snapshot; a job must match at least one
+    specific term (not just "Engineer"). The market skills of all roles are
+    then scored together in one sparse matrix operation.
+    """
+    matrix = get_term_matrix(store)
+    matched = [rank_role_jobs(role, ranked) for (role, _), ranked in zip(roles, store.search_many(roles))]
+    # KNOWN_SKILLS first, then distinctive keywords; top 12 per role
+    skills = matrix.market_skills([[job['rowid'] for job in jobs] for jobs in matched])
+    return [
+        build_role_view(role, jobs, role_skills)
+        for (role, _), jobs, role_skills in zip(roles, matched, skills)
+    ]
+
+
+def compute_role_view(store: JobStore, role: str, max_jobs: int) -> dict:
+    """Rank jobs for a role and score its market skills against the whole feed."""
+    return compute_role_views(store, [(role, max_jobs)])[0]
+
+
+def get_role_view(store: JobStore, role: str, max_jobs: int, count_hit: bool = True) -> dict:
+    """
+    Materialized market view for a role at the store's current feed version.
+
+    Looks in the in-process cache, then the shared role_views table, and only
+    computes (and stores) the view when neither holds one for this feed version.
+    """
+    return get_role_views(store, [(role, max_jobs)], count_hit)[0]
+
+
+def get_role_views(store: JobStore, roles: list, count_hit: bool = True) -> list:
+    """
+    Materialized market views for several (role, max_jobs) pairs.
+
+    Cache and role_views lookups are batched, and all views missing for the
+    current feed version are computed together and stored in one transaction.
+    Every lookup counts as a request for its views, wherever it was served
+    from, unless count_hit=False (speculative warm-ups), so warm-ups never
+    make a view popular.
+    """
+    version = store.feed_version()
+    keys = [(role_view_key(role), max_jobs) for role, max_jobs in roles]
+    results = {}
+    
+    for key in keys:
+        cached = _role_view_cache.get(key)
+        if cached and cached[0] == version:
+            results[key] = cached[1]
+    
+    pending = [key for key in dict.fromkeys(keys) if key not in results]
+    if pending:
+        for key, (stored_version, result) in store.get_role_views(pending, count_hit=False).items():
+            if stored_version == version:
+                results[key] = result
+    
+    # One representative role string per missing view
+    missing = {}
+    for (role, max_jobs), key in zip(roles, keys):
+        if key not in results:
+            missing.setdefault(key, (role, max_jobs))
+    if missing:
+        computed = compute_role_views(store, list(missing.values()))
+        store.put_role_views([
+            (key[0], key[1], role, version, result)
+            for (key, (role, _)), result in zip(missing.items(), computed)
+        ], hits=0)
+        results.update(zip(missing, computed))
+    
+    for key in keys:
+        if _role_view_cache.get(key, (None,))[0] != version:
+            if len(_role_view_cache) >= ROLE_VIEW_CACHE_SIZE:
+                _role_view_cache.clear()
+            _role_view_cache[key] = (version, results[key])
+    if count_hit:
+        store.count_role_view_hits(keys)
+    return [results[key] for key in keys]
+
+
+def refresh_role_views(snapshot: FeedSnapshot = None) -> int:
+    """Re-materialize the most requested role views after the feed changed."""
+    store = get_job_store()
+    version = store.feed_version()
+    stale = []
+    for role, max_jobs in store.popular_role_views(POPULAR_ROLE_VIEWS):
+        stored = store.get_role_view(role_view_key(role), max_jobs, count_hit=False)
+        if not (stored and stored[0] == version):
+            stale.append((role, max_jobs))
+    if not stale:
+        return 0
+    
+    try:
+        views = compute_role_views(store, stale)
+    except Exception as e:
+        logger.warning(f"Failed to refresh role market views: {e}")
+        return 0
+    store.put_role_views([
+        (role_view_key(role), max_jobs, role, version, view)
+        for (role, max_jobs), view in zip(stale, views)
+    ])
+    logger.info(f"Refreshed {len(stale)} role market views for feed version {version}")
+    return len(stale)
+
+
+feed_cache.listeners.append(refresh_role_views)
+
+
+# In-flight role lookups, keyed by (role_view_key, max_jobs)
+role_flights = SingleFlight("role-market-view")
+
+
+def _load_role_view(role: str, max_jobs: int) -> dict:
+    # Served from the shared on-disk job store; only a cold store hits the network
+    store = get_synced_job_store()
+    # Common roles come straight from the materialized view. Hits are
+    # counted per caller, not per flight, so requests that join count too.
+    return get_role_view(store, role, max_jobs, count_hit=False)
+
+
+async def _aload_role_view(role: str, max_jobs: int) -> dict:
+    store = await aget_synced_job_store()
+    return await asyncio.to_thread(get_role_view, store, role, max_jobs, False)
+
+
+async def awarm_role_view(role: str, max_jobs: int) -> None:
+    """
+    Build a role's market view ahead of a request for it.
+
+    Shares role_flights with afetch_jobs_by_role, so a request arriving
+    mid-build joins it. The warm-up itself is not counted as a request for
+    the view; the requests that use it are.
+    """
+    await role_flights.ado((role_view_key(role), max_jobs), _aload_role_view, role, max_jobs)
+
+
+def _empty_role_result(role: str) -> dict:
+    return {
+        'role': role,
+        'jobs': [],
+        'market_skills': [],
+        'skill_frequencies': []
+    }
+
 
 def fetch_jobs_by_role(role: str, max_jobs: int = 20) -> dict:
     """
@@ -106,7 +589,6 @@ def fetch_jobs_by_role(role: str, max_jobs: int = 20) -> dict:
     Returns:
         dict with 'jobs' list and 'market_skills' (top required skills)
     """
-    url = "https://remoteok.com/api"
     logger.info(f"Fetching jobs for role: {role}")
     
     # Debug logging to file since debug.log is empty
@@ -117,241 +599,124 @@ def fetch_jobs_by_role(role: str, max_jobs: int = 20) -> dict:
         pass
     
     try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) ResuMatch/1.0'}
-        # Reduced timeout to 10s to prevent hanging
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
+        # Concurrent requests for the same role share one lookup
+        key = (role_view_key(role), max_jobs)
+        view = role_flights.do(key, _load_role_view, role, max_jobs)
+        get_job_store().count_role_view_hits([key])
+        return {**view, 'role': role}
         
-        try:
-            with open("debug_role.txt", "a", encoding="utf-8") as f:
-                f.write(f"API Response received: {len(data)} items\n")
-        except:
-            pass
+    except Exception as e:
+        logger.error(f"Failed to fetch jobs for role {role}: {str(e)}")
+        return _empty_role_result(role)
 
-        jobs = [item for item in data if isinstance(item, dict) and 'description' in item]
-        
-        # Convert role to keywords for matching
-        # Handle slashes like "AI Engineer/Data Scientist" -> "AI Engineer Data Scientist"
-        clean_role = role.replace('/', ' ')
-        role_keywords = clean_role.lower().split()
-        
-        try:
-            with open("debug_role.txt", "a", encoding="utf-8") as f:
-                f.write(f"Keywords: {role_keywords}\n")
-        except:
-            pass
-        
-        # Filter jobs by role keywords (STRICT weighted matching)
-        GENERIC_TERMS = {'engineer', 'developer', 'consultant', 'manager', 'lead', 'senior', 'junior', 'staff', 'intern', 'analyst'}
-        
-        matched_jobs = []
-        for job in jobs:
-            title = job.get('position', '').lower()
-            description = job.get('description', '').lower()
-            tags = ' '.join(job.get('tags', [])).lower()
-            
-            # Calculate match score with weights
-            score = 0
-            found_specific_term = False
-            
-            for kw in role_keywords:
-                if kw in GENERIC_TERMS:
-                    # Generic terms only give a tiny boost (0.1)
-                    if kw in title:
-                        score += 0.1
-                else:
-                    # Specific terms (e.g. "AI", "Machine Learning", "Metallurgical") give full points (1.0)
-                    if kw in title:
-                        score += 10.0 # Huge boost if in title
-                        found_specific_term = True
-                    elif kw in description or kw in tags:
-                        score += 1.0
-                        found_specific_term = True
-            
-            # STRICT FILTER: Job MUST match at least one specific term (not just "Engineer")
-            if score > 0 and found_specific_term:
-                job['_match_score'] = score
-                matched_jobs.append(job)
-        
-        # Sort by match score and take top jobs
-        matched_jobs.sort(key=lambda x: x.get('_match_score', 0), reverse=True)
-        matched_jobs = matched_jobs[:max_jobs]
-        
-        try:
-            with open("debug_role.txt", "a", encoding="utf-8") as f:
-                f.write(f"Matched Jobs after Generic Filter: {len(matched_jobs)}\n")
-                if len(matched_jobs) > 0:
-                    f.write(f"Top Match: {matched_jobs[0]['position']} Score: {matched_jobs[0]['_match_score']}\n")
-        except:
-            pass
-        
-        logger.info(f"Found {len(matched_jobs)} jobs matching '{role}'")
-        
-        # Extract skills from matched jobs
-        all_text = ""
-        for job in matched_jobs:
-            text = job.get('position', '') + " " + job.get('description', '') + " " + " ".join(job.get('tags', []))
-            all_text += " " + text
-        
-        # Clean HTML and extract words
-        all_text = re.sub(r'<[^>]+>', ' ', all_text).lower()
-        
-        # Extract skills (multi-word and single-word)
-        found_skills = []
-        for skill in KNOWN_SKILLS:
-            if skill in all_text:
-                count = all_text.count(skill)
-                # Boost KNOWN_SKILLS count significantly to prioritize them
-                found_skills.append({'skill': skill.title(), 'count': count + 100})
-        
-        # Also extract single-word technical terms
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', all_text)
-        word_counter = Counter(words)
+async def afetch_jobs_by_role(role: str, max_jobs: int = 20) -> dict:
+    """
+    Asyncio counterpart of fetch_jobs_by_role for the request path.
+
+    A cold feed is downloaded on the non-blocking HTTP client and job store
+    queries run in a worker thread, so the event loop is never held up.
+    
+    Args:
+        role: The target role (e.g., "Metallurgical Engineer", "Software Engineer")
+        max_jobs: Maximum number of jobs to return
         
-        # Filter for technical terms (not in stopwords, appear multiple times)
-        tech_words = [(w.title(), c) for w, c in word_counter.most_common(100) 
-                      if w not in STOPWORDS and c >= 2]
+    Returns:
+        dict with 'jobs' list and 'market_skills' (top required skills)
+    """
+    logger.info(f"Fetching jobs for role: {role}")
+    
+    try:
+        key = (role_view_key(role), max_jobs)
+        view = await role_flights.ado(key, _aload_role_view, role, max_jobs)
+        store = get_job_store()
+        if store.count_role_view_hits([key], flush=False):
+            await asyncio.to_thread(store.flush_role_view_hits)
+        return {**view, 'role': role}
         
-        # Combine and deduplicate
-        skill_set = {s['skill'].lower(): s for s in found_skills}
-        for word, count in tech_words[:20]:
-            if word.lower() not in skill_set:
-                skill_set[word.lower()] = {'skill': word, 'count': count}
+    except Exception as e:
+        logger.error(f"Failed to fetch jobs for role {role}: {str(e)}")
+        return _empty_role_result(role)
+
+def fetch_jobs_by_roles(queries: list, max_jobs: int = 20) -> dict:
+    """
+    Fetch jobs for several role/skill queries at once.
+
+    All queries share one store sync check, one batched view lookup and one
+    matrix pass for the views not yet materialized, so the cost of a
+    multi-query retrieval step barely grows with the number of queries.
+    
+    Args:
+        queries: Role or skill queries (e.g., ["Python Data Scientist", "SQL Data Scientist"])
+        max_jobs: Maximum number of jobs to return per query
         
-        # Sort by frequency and take top 12 skills
-        market_skills = sorted(skill_set.values(), key=lambda x: x['count'], reverse=True)[:12]
+    Returns:
+        dict mapping each query to the same result fetch_jobs_by_role returns
+    """
+    logger.info(f"Fetching jobs for {len(queries)} queries")
+    
+    try:
+        store = get_synced_job_store()
+        views = get_role_views(store, [(query, max_jobs) for query in queries])
+        return {query: {**view, 'role': query} for query, view in zip(queries, views)}
         
-        # Clean up job entries
-        clean_jobs = []
-        for job in matched_jobs:
-            raw_desc = job.get('description', '')
-            clean_desc = re.sub(r'<[^>]+>', ' ', raw_desc)
-            clean_desc = re.sub(r'\s+', ' ', clean_desc).strip()[:500]  # Truncate long descriptions
-            
-            clean_jobs.append({
-                'id': job.get('id', ''),
-                'title': job.get('position', ''),
-                'company': job.get('company', ''),
-                'description': clean_desc,
-                'url': job.get('url', ''),
-                'date': job.get('date', ''),
-                'tags': job.get('tags', []),
-                'salary': job.get('salary', '')
-            })
+    except Exception as e:
+        logger.error(f"Failed to fetch jobs for queries {queries}: {str(e)}")
+        return {query: _empty_role_result(query) for query in queries}
+
+
+async def afetch_jobs_by_roles(queries: list, max_jobs: int = 20) -> dict:
+    """
+    Asyncio counterpart of fetch_jobs_by_roles.
+    
+    Args:
+        queries: Role or skill queries
+        max_jobs: Maximum number of jobs to return per query
         
-        return {
-            'role': role,
-            'jobs': clean_jobs,
-            'market_skills': [s['skill'] for s in market_skills],
-            'skill_frequencies': market_skills
-        }
+    Returns:
+        dict mapping each query to the same result fetch_jobs_by_role returns
+    """
+    logger.info(f"Fetching jobs for {len(queries)} queries")
+    
+    try:
+        store = await aget_synced_job_store()
+        views = await asyncio.to_thread(get_role_views, store, [(query, max_jobs) for query in queries])
+        return {query: {**view, 'role': query} for query, view in zip(queries, views)}
         
     except Exception as e:
-        logger.error(f"Failed to fetch jobs for role {role}: {str(e)}")
-        return {
-            'role': role,
-            'jobs': [],
-            'market_skills': [],
-            'skill_frequencies': []
-        }
+        logger.error(f"Failed to fetch jobs for queries {queries}: {str(e)}")
+        return {query: _empty_role_result(query) for query in queries}
+
 
 def fetch_market_data():
-    url = "https://remoteok.com/api"
-    logger.info(f"Fetching data from {url}...")
+    logger.info(f"Fetching data from job sources {get_job_sources()}...")
     
     try:
-        # User-Agent is often required for scraping/API calls
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) ResuMatch/1.0'}
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        data = response.json()
-        logger.info(f"Retrieved {len(data)} items (including metadata)")
-        
-        # RemoteOK API returns metadata as the first item or mixed in? 
-        # Usually it's a list. Filter filtering for jobs.
-        jobs = [item for item in data if isinstance(item, dict) and 'description' in item]
+        # Force a fresh download (each source bounded by its deadline, JOB_SOURCE_DEADLINE);
+        # publishing it syncs new/expired jobs into the store
+        snapshot = feed_cache.refresh()
+        store = get_job_store()
+        logger.info(f"Retrieved {len(snapshot.jobs)} jobs, {store.count()} in store")
         
         # Filter for "Software Engineer" related roles
-        engineer_jobs = []
-        for job in jobs:
-            title = job.get('position', '').lower()
-            if 'software' in title and 'engineer' in title:
-                engineer_jobs.append(job)
-        
-        logger.info(f"Filtered down to {len(engineer_jobs)} Software Engineer jobs")
+        engineer_rowids = store.title_rowids('software', 'engineer')
+        logger.info(f"Filtered down to {len(engineer_rowids)} Software Engineer jobs")
         
-        # Extract keywords
-        all_text = ""
-        for job in engineer_jobs:
-            # Combine title, description, and tags
-            text = job.get('position', '') + " " + job.get('description', '') + " " + " ".join(job.get('tags', []))
-            all_text += " " + text
-            
-        # Clean and tokenize
-        # remove html tags
-        all_text = re.sub(r'<[^>]+>', ' ', all_text)
-        # matches words with 3+ characters
-        words = re.findall(r'\b[a-zA-Z]{3,}\b', all_text.lower())
+        # Aggregate keywords with indexed queries over the store
+        word_counter, skill_counts = store.aggregate_counts(engineer_rowids)
         
         # Filter stopwords
-        filtered_words = [w for w in words if w not in STOPWORDS]
-        
-        # Count frequency
-        counter = Counter(filtered_words)
-        top_50 = counter.most_common(50)
+        top_50 = [(w, c) for w, c in word_counter.most_common() if w not in STOPWORDS][:50]
         
         # Structure the output for trends
         result = {
-            'timestamp': response.headers.get('Date'),
-            'job_count': len(engineer_jobs),
-            'top_keywords': [{'keyword': k, 'count': v} for k, v in top_50]
+            'timestamp': snapshot.date,
+            'job_count': len(engineer_rowids),
+            'top_keywords': [{'keyword': k, 'count': v} for k, v in top_50],
+            'top_skills': [{'skill': k, 'count': v} for k, v in skill_counts.most_common(30)]
         }
+        store.set_meta('market_trends', json.dumps(result))
         
-        # Structure the output for job matching (top 50 jobs)
-        # We need to save the details so we can match against them
-        jobs_output = []
-        raw_jobs_output = []
-        
-        for job in engineer_jobs[:50]:
-            # Clean description
-            raw_desc = job.get('description', '')
-            clean_desc = re.sub(r'<[^>]+>', ' ', raw_desc)
-            clean_desc = re.sub(r'\s+', ' ', clean_desc).strip()
-            
-            job_entry = {
-                'id': job.get('id', '') or str(hash(job.get('url', ''))),
-                'position': job.get('position', ''), # For existing backend compatibility
-                'title': job.get('position', ''),   # Requested "title" field
-                'company': job.get('company', ''),
-                'description': clean_desc,
-                'url': job.get('url', ''),
-                'date': job.get('date', ''),
-                'tags': job.get('tags', []),
-                'location': job.get('location', '')
-            }
-            jobs_output.append(job_entry)
-            raw_jobs_output.append(job_entry)
-            
-        # Ensure data directory exists
-        os.makedirs(DATA_DIR, exist_ok=True)
-        
-        with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2)
-            
-        jobs_file = os.path.join(DATA_DIR, 'market_jobs.json')
-        with open(jobs_file, 'w', encoding='utf-8') as f:
-            json.dump(jobs_output, f, indent=2)
-            
-        raw_jobs_file = os.path.join(DATA_DIR, 'raw_jobs.json')
-        with open(raw_jobs_file, 'w', encoding='utf-8') as f:
-            json.dump(raw_jobs_output, f, indent=2)
-            
-        logger.info(f"Saved market trends to {OUTPUT_FILE}")
-        logger.info(f"Saved {len(jobs_output)} jobs to {jobs_file}")
-        logger.info(f"Saved {len(raw_jobs_output)} raw jobs to {raw_jobs_file}")
+        logger.info(f"Saved market trends to {STORE_FILE}")
         return True
         
     except Exception as e:
@@ -0,0 +1,250 @@
+"""
+Shared Outbound HTTP Layer for ResuMatch
+Pooled keep-alive clients (sync and asyncio) for RemoteOK, YouTube and the LLM APIs
+
+Set CASSETTE_MODE=record to capture every response under CASSETTE_DIR, and
+CASSETTE_MODE=replay to serve them back without network access (optionally
+with CASSETTE_LATENCY=recorded or a fixed number of seconds per call).
+"""
+
+import asyncio
+import threading
+from typing import Dict
+import logging
+
+import httpx
+import requests
+from requests.adapters import HTTPAdapter
+
+from cassette import AsyncCassetteTransport, CassetteAdapter, CassetteHttp, CassetteTransport, get_cassette
+from config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def get_timeout() -> httpx.Timeout:
+    """Default timeouts for outbound calls; individual calls may pass their own."""
+    return httpx.Timeout(Config.HTTP_TIMEOUT, connect=Config.HTTP_CONNECT_TIMEOUT)
+
+
+def _host_key(url: httpx.URL) -> str:
+    return f"{url.scheme}://{url.host}:{url.port or ''}"
+
+
+class _PermitStream(httpx.SyncByteStream):
+    """Response body that gives its host permit back once the response is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release):
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            release, self._release = self._release, None
+            if release:
+                release()
+
+
+class _AsyncPermitStream(httpx.AsyncByteStream):
+    """Asyncio counterpart of _PermitStream."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release):
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            release, self._release = self._release, None
+            if release:
+                release()
+
+
+class HostLimitedTransport(httpx.BaseTransport):
+    """
+    Caps concurrent requests per host on top of httpx's global pool limits.
+
+    A request holds its host's permit until its response is closed, so a
+    streamed body (client.stream) counts for as long as it is being read.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport, per_host: int):
+        self._transport = transport
+        self._per_host = per_host
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self._per_host)
+            return self._semaphores[host]
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(_host_key(request.url))
+        semaphore.acquire()
+        try:
+            response = self._transport.handle_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            # Body already in memory; nothing more is transferred
+            semaphore.release()
+        else:
+            response.stream = _PermitStream(response.stream, semaphore.release)
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncHostLimitedTransport(httpx.AsyncBaseTransport):
+    """Asyncio counterpart of HostLimitedTransport."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, per_host: int):
+        self._transport = transport
+        self._per_host = per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = _host_key(request.url)
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self._per_host)
+        semaphore = self._semaphores[host]
+        await semaphore.acquire()
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            semaphore.release()
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            semaphore.release()
+        else:
+            response.stream = _AsyncPermitStream(response.stream, semaphore.release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=Config.HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=Config.HTTP_MAX_CONNECTIONS,
+        keepalive_expiry=Config.HTTP_KEEPALIVE_EXPIRY
+    )
+
+
+_lock = threading.Lock()
+_session = None
+_http_client = None
+_async_http_client = None
+_httplib2_local = threading.local()
+
+
+def get_session() -> requests.Session:
+    """
+    Process-wide requests.Session with a keep-alive connection pool.
+
+    Each host gets its own pool of HTTP_MAX_CONNECTIONS_PER_HOST connections;
+    extra concurrent callers wait for a free connection instead of opening more.
+    """
+    global _session
+    if _session is None:
+        with _lock:
+            if _session is None:
+                session = requests.Session()
+                pool = dict(
+                    pool_connections=Config.HTTP_MAX_CONNECTIONS,
+                    pool_maxsize=Config.HTTP_MAX_CONNECTIONS_PER_HOST,
+                    pool_block=True
+                )
+                cassette = get_cassette()
+                adapter = CassetteAdapter(cassette, **pool) if cassette else HTTPAdapter(**pool)
+                session.mount('https://', adapter)
+                session.mount('http://', adapter)
+                _session = session
+    return _session
+
+
+def get_http_client() -> httpx.Client:
+    """Process-wide pooled httpx.Client (used by the Groq LLM clients)."""
+    global _http_client
+    if _http_client is None:
+        with _lock:
+            if _http_client is None:
+                transport = HostLimitedTransport(httpx.HTTPTransport(limits=_limits()), Config.HTTP_MAX_CONNECTIONS_PER_HOST)
+                cassette = get_cassette()
+                if cassette:
+                    transport = CassetteTransport(transport, cassette)
+                _http_client = httpx.Client(
+                    transport=transport,
+                    timeout=get_timeout()
+                )
+    return _http_client
+
+
+def get_async_http_client() -> httpx.AsyncClient:
+    """
+    Process-wide pooled httpx.AsyncClient.
+
+    Bound to the event loop that first uses it, i.e. the uvicorn worker loop.
+    """
+    global _async_http_client
+    if _async_http_client is None:
+        with _lock:
+            if _async_http_client is None:
+                transport = AsyncHostLimitedTransport(
+                    httpx.AsyncHTTPTransport(limits=_limits()), Config.HTTP_MAX_CONNECTIONS_PER_HOST
+                )
+                cassette = get_cassette()
+                if cassette:
+                    transport = AsyncCassetteTransport(transport, cassette)
+                _async_http_client = httpx.AsyncClient(
+                    transport=transport,
+                    timeout=get_timeout()
+                )
+    return _async_http_client
+
+
+def get_httplib2_http():
+    """
+    Keep-alive httplib2.Http for googleapiclient, one per thread.
+
+    httplib2.Http objects are not thread-safe, so each worker thread reuses
+    its own instance (and its open connections) across YouTube calls.
+    """
+    http = getattr(_httplib2_local, 'http', None)
+    if http is None:
+        import httplib2
+        http = httplib2.Http(timeout=Config.HTTP_TIMEOUT)
+        cassette = get_cassette()
+        if cassette:
+            http = CassetteHttp(http, cassette)
+        _httplib2_local.http = http
+    return http
+
+
+async def aclose_clients() -> None:
+    """Close every pooled client; called on application shutdown."""
+    global _session, _http_client, _async_http_client
+    with _lock:
+        session, client, async_client = _session, _http_client, _async_http_client
+        _session = _http_client = _async_http_client = None
+    if session is not None:
+        session.close()
+    if client is not None:
+        client.close()
+    if async_client is not None:
+        await async_client.aclose()
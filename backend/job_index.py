@@ -0,0 +1,30 @@
+"""
+Job Search Tokenization and Weighting for ResuMatch
+Shared by job ingest, the FTS5 job store and the skill extractor
+"""
+
+import re
+from typing import List
+
+# Title words that say little about the actual role ("Senior", "Engineer", ...)
+GENERIC_TERMS = {'engineer', 'developer', 'consultant', 'manager', 'lead', 'senior', 'junior', 'staff', 'intern', 'analyst'}
+
+# Field boosts mirror the original substring matcher: a specific term in the
+# title is worth 10 points, in the description or tags 1 point, and a generic
+# term only counts (0.1) when it appears in the title.
+TITLE_WEIGHT = 10.0
+BODY_WEIGHT = 1.0
+GENERIC_WEIGHT = 0.1
+
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+TOKEN_RE = re.compile(r'[a-z0-9][a-z0-9+#]*')
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens; keeps '+' and '#' so 'c++' and 'c#' survive."""
+    return TOKEN_RE.findall(HTML_TAG_RE.sub(' ', text).lower())
+
+
+def tokenize_role(role: str) -> List[str]:
+    """Split a role query into keywords, e.g. "AI Engineer/Data Scientist"."""
+    return tokenize(role.replace('/', ' '))
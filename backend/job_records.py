@@ -0,0 +1,83 @@
+"""
+Normalized Job Records for ResuMatch
+Each feed posting is cleaned and tokenized exactly once, at ingest time
+"""
+
+import re
+from collections import Counter
+from typing import Optional
+
+from job_index import HTML_TAG_RE, tokenize
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Length of the description kept for API responses and LLM prompts
+SUMMARY_LENGTH = 500
+
+
+class JobRecord:
+    """
+    Compact, pre-processed view of one job posting.
+
+    Holds the cleaned description (full and truncated) plus the token counts
+    that role search and market-skill aggregation need, so per-request work
+    only sums counters instead of re-parsing HTML.
+    """
+
+    __slots__ = (
+        'id', 'title', 'company', 'text', 'description', 'url', 'date', 'tags',
+        'salary', 'location', 'title_counts', 'body_counts', 'body_length', 'skill_counts',
+    )
+
+    def __init__(self, job: dict, skill_extractor=None):
+        title = job.get('position', '') or job.get('title', '')
+        tags = job.get('tags', []) or []
+        text = WHITESPACE_RE.sub(' ', HTML_TAG_RE.sub(' ', job.get('description', '') or '')).strip()
+
+        self.id = str(job.get('id', '') or job.get('url', ''))
+        self.title = title
+        self.company = job.get('company', '')
+        self.text = text
+        self.description = text[:SUMMARY_LENGTH]
+        self.url = job.get('url', '')
+        self.date = job.get('date', '')
+        self.tags = tags
+        self.salary = job.get('salary', '')
+        self.location = job.get('location', '')
+
+        title_tokens = tokenize(title)
+        text_tokens = tokenize(text)
+        tag_tokens = [tokenize(str(tag)) for tag in tags]
+        body_tokens = text_tokens + [token for tokens in tag_tokens for token in tokens]
+        self.title_counts = Counter(title_tokens)
+        self.body_counts = Counter(body_tokens)
+        self.body_length = len(body_tokens)
+        # Title, description and each tag are matched on their own so no skill phrase spans two of them
+        self.skill_counts = Counter()
+        if skill_extractor:
+            for tokens in [title_tokens, text_tokens] + tag_tokens:
+                self.skill_counts.update(skill_extractor.count_tokens(tokens))
+
+    def word_counts(self) -> Counter:
+        """All title, description and tag tokens of this posting."""
+        return self.title_counts + self.body_counts
+
+    def to_dict(self) -> dict:
+        """Job entry in the shape returned by fetch_jobs_by_role."""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'company': self.company,
+            'description': self.description,
+            'url': self.url,
+            'date': self.date,
+            'tags': self.tags,
+            'salary': self.salary
+        }
+
+
+def normalize_job(job: dict, skill_extractor=None) -> Optional[JobRecord]:
+    """Normalize a raw feed item, or return None if it is not a job posting."""
+    if not isinstance(job, dict) or 'description' not in job:
+        return None
+    return JobRecord(job, skill_extractor)
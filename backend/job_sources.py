@@ -0,0 +1,286 @@
+"""
+Job Source Adapters for ResuMatch
+RemoteOK and local JSON/JSONL feeds, queried concurrently and merged into one set of JobRecords
+"""
+
+import asyncio
+import glob
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+from config import Config
+from http_client import get_async_http_client, get_session
+from job_records import JobRecord, normalize_job
+from json_stream import JsonArrayParser, iter_json_array
+
+logger = logging.getLogger(__name__)
+
+REMOTEOK_URL = "https://remoteok.com/api"
+REQUEST_HEADERS = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) ResuMatch/1.0'}
+# Bytes read from the feed body per parsing step
+FEED_CHUNK_SIZE = 64 * 1024
+
+# Called with every raw posting a source reads
+Emit = Callable[[dict], None]
+
+
+class JobSource:
+    """
+    A feed of job postings.
+
+    Subclasses read their postings and pass each raw item (RemoteOK-shaped
+    dict: position/title, company, description, tags, url, ...) to emit();
+    normalization into JobRecords is done by the engine. Each source has its
+    own deadline; a source that misses it is skipped for that round.
+    """
+
+    name = 'source'
+
+    def __init__(self, deadline: float = None):
+        self.deadline = deadline or Config.JOB_SOURCE_DEADLINE
+
+    def fetch(self, timeout: float, emit: Emit) -> Optional[str]:
+        """
+        Read every posting, blocking.
+
+        Returns:
+            The feed's 'Date' if the source reports one
+        """
+        raise NotImplementedError
+
+    async def afetch(self, timeout: float, emit: Emit) -> Optional[str]:
+        """Asyncio variant of fetch(); runs fetch() in a worker thread unless overridden."""
+        return await asyncio.to_thread(self.fetch, timeout, emit)
+
+    def record_id(self, item: dict) -> str:
+        """Store-wide job id: namespaced by source so ids from different feeds never collide."""
+        return f"{self.name}:{item.get('id', '') or item.get('url', '')}"
+
+    def owns(self, job_id: str) -> bool:
+        return job_id.startswith(f"{self.name}:")
+
+    def __repr__(self) -> str:
+        return self.name
+
+
+class RemoteOKSource(JobSource):
+    """The public RemoteOK API (one JSON array, first element is a legal notice)."""
+
+    name = 'remoteok'
+
+    def fetch(self, timeout: float, emit: Emit) -> Optional[str]:
+        items = 0
+        with get_session().get(REMOTEOK_URL, headers=REQUEST_HEADERS, timeout=timeout, stream=True) as response:
+            response.raise_for_status()
+            date = response.headers.get('Date')
+            for item in iter_json_array(response.iter_content(chunk_size=FEED_CHUNK_SIZE)):
+                items += 1
+                emit(item)
+        logger.info(f"Downloaded RemoteOK feed: {items} items")
+        return date
+
+    async def afetch(self, timeout: float, emit: Emit) -> Optional[str]:
+        items = 0
+        parser = JsonArrayParser()
+        client = get_async_http_client()
+        async with client.stream('GET', REMOTEOK_URL, headers=REQUEST_HEADERS, timeout=timeout) as response:
+            response.raise_for_status()
+            date = response.headers.get('Date')
+            async for chunk in response.aiter_bytes(FEED_CHUNK_SIZE):
+                for item in parser.feed(chunk):
+                    items += 1
+                    emit(item)
+                if parser.done:
+                    break
+            if not parser.done:
+                for item in parser.close():
+                    items += 1
+                    emit(item)
+        logger.info(f"Downloaded RemoteOK feed: {items} items")
+        return date
+
+    # RemoteOK ids are stored un-prefixed, as before sources were pluggable
+    def record_id(self, item: dict) -> str:
+        return str(item.get('id', '') or item.get('url', ''))
+
+    def owns(self, job_id: str) -> bool:
+        return ':' not in job_id
+
+
+class LocalJobSource(JobSource):
+    """
+    Postings from *.json (array) and *.jsonl (one object per line) files in a directory.
+
+    Meant for offline deployments and tests; files use the RemoteOK item shape.
+    """
+
+    name = 'local'
+
+    def __init__(self, directory: str, deadline: float = None):
+        super().__init__(deadline)
+        self.directory = directory
+
+    def fetch(self, timeout: float, emit: Emit) -> Optional[str]:
+        files = sorted(
+            glob.glob(os.path.join(self.directory, '*.json')) + glob.glob(os.path.join(self.directory, '*.jsonl'))
+        )
+        items = 0
+        for path in files:
+            with open(path, 'rb') as f:
+                if path.endswith('.jsonl'):
+                    for line in f:
+                        if line.strip():
+                            emit(json.loads(line))
+                            items += 1
+                else:
+                    for item in iter_json_array(iter(lambda: f.read(FEED_CHUNK_SIZE), b'')):
+                        emit(item)
+                        items += 1
+        logger.info(f"Read local job feed: {items} items from {len(files)} files in {self.directory}")
+        return None
+
+
+_sources = None
+
+
+def get_job_sources() -> List[JobSource]:
+    """The job sources enabled by Config.JOB_SOURCES, created once per process."""
+    global _sources
+    if _sources is None:
+        sources = []
+        for name in Config.JOB_SOURCES:
+            if name == RemoteOKSource.name:
+                sources.append(RemoteOKSource())
+            elif name == LocalJobSource.name:
+                if Config.LOCAL_JOBS_DIR:
+                    sources.append(LocalJobSource(Config.LOCAL_JOBS_DIR))
+                else:
+                    logger.warning("Local job source enabled but LOCAL_JOBS_DIR is not set; skipping it")
+            else:
+                logger.warning(f"Unknown job source '{name}' in JOB_SOURCES; skipping it")
+        _sources = sources
+    return _sources
+
+
+# =============================================================================
+# Fan-out and merge
+# =============================================================================
+
+class SourceResults:
+    """Merged records of one fan-out, plus the sources that did not answer in time."""
+
+    def __init__(self, records: List[JobRecord], date: Optional[str], failed: List[JobSource]):
+        self.records = records
+        self.date = date
+        self.failed = failed
+
+
+def _collector(source: JobSource, previous: Dict[str, JobRecord], skill_extractor) -> Tuple[list, Emit]:
+    records = []
+
+    def emit(item) -> None:
+        if not isinstance(item, dict):
+            return
+        job_id = source.record_id(item)
+        # Postings seen in the previous round keep their already-normalized record
+        record = previous.get(job_id)
+        if record is None:
+            record = normalize_job(item, skill_extractor)
+            if record:
+                record.id = job_id
+        if record:
+            records.append(record)
+
+    return records, emit
+
+
+def _merge(sources: List[JobSource], outcomes: list, previous: Dict[str, JobRecord]) -> SourceResults:
+    records = []
+    date = None
+    failed = []
+    for source, outcome in zip(sources, outcomes):
+        if isinstance(outcome, BaseException):
+            reason = 'timed out' if isinstance(outcome, (FutureTimeoutError, asyncio.TimeoutError)) else str(outcome)
+            logger.warning(f"Job source {source} failed ({reason}); keeping its previous postings")
+            failed.append(source)
+            records.extend(record for job_id, record in previous.items() if source.owns(job_id))
+            continue
+        source_records, source_date = outcome
+        records.extend(source_records)
+        date = date or source_date
+
+    if failed and len(failed) == len(sources):
+        first = next(outcome for outcome in outcomes if isinstance(outcome, BaseException))
+        raise RuntimeError(f"All job sources failed: {', '.join(map(str, failed))}") from first
+
+    # The same posting listed by two sources is kept once (first source wins)
+    merged = []
+    seen_urls = set()
+    for record in records:
+        if record.url and record.url in seen_urls:
+            continue
+        seen_urls.add(record.url)
+        merged.append(record)
+
+    logger.info(f"Collected {len(merged)} jobs from {len(sources) - len(failed)}/{len(sources)} sources")
+    return SourceResults(merged, date, failed)
+
+
+def collect_jobs(sources: List[JobSource], timeout: float, previous: Dict[str, JobRecord] = None,
+                 skill_extractor=None) -> SourceResults:
+    """
+    Query every source concurrently and merge their postings.
+
+    Each source runs in its own thread and is given up on at its deadline,
+    so the wall time is bounded by the slowest deadline rather than the sum.
+
+    Raises:
+        RuntimeError: If no source answered
+    """
+    previous = previous or {}
+    if not sources:
+        raise RuntimeError("No job sources are enabled")
+
+    started = time.monotonic()
+    executor = ThreadPoolExecutor(max_workers=len(sources), thread_name_prefix="job-source")
+    futures = []
+    for source in sources:
+        records, emit = _collector(source, previous, skill_extractor)
+        future = executor.submit(source.fetch, timeout, emit)
+        futures.append((future, records))
+    # Do not wait for sources that overran their deadline; their threads finish in the background
+    executor.shutdown(wait=False)
+
+    outcomes = []
+    for source, (future, records) in zip(sources, futures):
+        try:
+            date = future.result(timeout=max(0.0, started + source.deadline - time.monotonic()))
+            outcomes.append((records, date))
+        except Exception as e:
+            outcomes.append(e)
+    return _merge(sources, outcomes, previous)
+
+
+async def acollect_jobs(sources: List[JobSource], timeout: float, previous: Dict[str, JobRecord] = None,
+                        skill_extractor=None) -> SourceResults:
+    """
+    Asyncio counterpart of collect_jobs: sources are awaited together, each under its deadline.
+
+    Raises:
+        RuntimeError: If no source answered
+    """
+    previous = previous or {}
+    if not sources:
+        raise RuntimeError("No job sources are enabled")
+
+    async def run(source: JobSource):
+        records, emit = _collector(source, previous, skill_extractor)
+        date = await asyncio.wait_for(source.afetch(timeout, emit), source.deadline)
+        return records, date
+
+    outcomes = await asyncio.gather(*(run(source) for source in sources), return_exceptions=True)
+    return _merge(sources, list(outcomes), previous)
@@ -0,0 +1,535 @@
+"""
+SQLite Job Store for ResuMatch Market Data
+On-disk job table with an FTS5 index, shared by every worker process
+"""
+
+import heapq
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+from job_index import GENERIC_TERMS, GENERIC_WEIGHT, TITLE_WEIGHT, BODY_WEIGHT, tokenize, tokenize_role
+
+logger = logging.getLogger(__name__)
+
+# Best-scoring candidates per requested job that are loaded and re-ranked with the generic-term boost
+SEARCH_WINDOW = 4
+
+# Role view hits buffered in memory before they are written back in one batch
+ROLE_VIEW_HIT_FLUSH = 100
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    title TEXT NOT NULL,
+    company TEXT,
+    description TEXT,
+    text TEXT,
+    url TEXT,
+    date TEXT,
+    tags TEXT,
+    salary TEXT,
+    location TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, description, tags,
+    content='', tokenize="unicode61 tokenchars '+#'"
+);
+CREATE TABLE IF NOT EXISTS job_skills (
+    job_rowid INTEGER NOT NULL,
+    skill TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (job_rowid, skill)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS job_keywords (
+    job_rowid INTEGER NOT NULL,
+    keyword TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (job_rowid, keyword)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS role_views (
+    role_key TEXT NOT NULL,
+    max_jobs INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    feed_version INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (role_key, max_jobs)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+
+def _fts_phrase(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _idf_scale(n_rows: int, n_hits: int) -> float:
+    """
+    Factor turning an FTS5 bm25() score for one term into a positive-IDF score.
+
+    FTS5 uses log((N - n + 0.5) / (n + 0.5)) and floors it at 1e-6 for any
+    term in more than half the rows, which in a single-source feed flattens
+    common skills to ~0 and lets the generic-term boost outweigh a title
+    hit. BM25's usual log(1 + ...) form stays positive and keeps its scale.
+    """
+    if not n_hits:
+        return 0.0
+    fts_idf = max(math.log((n_rows - n_hits + 0.5) / (n_hits + 0.5)), 1e-6)
+    return math.log(1 + (n_rows - n_hits + 0.5) / (n_hits + 0.5)) / fts_idf
+
+
+class JobStore:
+    """
+    SQLite-backed job store with an FTS5 index over title, description and tags.
+
+    The feed is synced in by job id (new postings inserted, expired ones
+    deleted), and role queries and skill aggregations run as indexed queries.
+    The database runs in WAL mode so several uvicorn workers can read while
+    one of them syncs; each thread gets its own connection.
+
+    Args:
+        path: SQLite file
+        max_role_views: Materialized role views kept on disk
+        keep_role_views: Most requested role views that are never evicted
+    """
+
+    def __init__(self, path: str, max_role_views: int = 5000, keep_role_views: int = 50):
+        self.path = path
+        self.max_role_views = max_role_views
+        self.keep_role_views = keep_role_views
+        self._pending_hits = {}  # (role_key, max_jobs) -> hits not yet written
+        self._hits_lock = threading.Lock()
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            # Autocommit mode; writes open their own transactions explicitly
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # -------------------------------------------------------------------------
+    # Metadata
+    # -------------------------------------------------------------------------
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._connect().execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row['value'] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        self._connect().execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def synced_at(self) -> Optional[float]:
+        """Wall-clock time of the last feed sync by any worker, or None if never synced."""
+        value = self.get_meta('synced_at')
+        return float(value) if value else None
+
+    def feed_version(self) -> int:
+        """Incremented by every sync that changed the stored jobs."""
+        return int(self.get_meta('feed_version') or 0)
+
+    def claim_refresh(self, lease: float) -> bool:
+        """
+        Atomically claim the next feed refresh for this process.
+
+        Returns False while another worker holds an unexpired claim, so a stale
+        store triggers one download across all workers rather than one each.
+        """
+        now = time.time()
+        conn = self._connect()
+        conn.execute("INSERT OR IGNORE INTO meta (key, value) VALUES ('refresh_claim', '0')")
+        cursor = conn.execute(
+            "UPDATE meta SET value = ? WHERE key = 'refresh_claim' AND CAST(value AS REAL) < ?",
+            (str(now + lease), now)
+        )
+        return cursor.rowcount == 1
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def sync(self, records: Dict[str, object], feed_date: str = None,
+             retain: Callable[[str], bool] = None) -> Tuple[int, int]:
+        """
+        Bring the store in line with the current feed.
+
+        Args:
+            records: JobRecords currently in the feed, keyed by job id
+            feed_date: 'Date' header of the feed download
+            retain: Returns True for missing job ids that must not be expired
+                (postings of a source that failed this round)
+
+        Returns:
+            Tuple of (number of jobs added, number of jobs expired)
+        """
+        conn = self._connect()
+        # Take the write lock up front so concurrent workers diff against the same state
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            stored = {row['id']: row['rowid'] for row in conn.execute("SELECT id, rowid FROM jobs")}
+
+            added = 0
+            for job_id, record in records.items():
+                if job_id not in stored:
+                    self._insert(conn, record)
+                    added += 1
+
+            expired = [
+                rowid for job_id, rowid in stored.items()
+                if job_id not in records and not (retain and retain(job_id))
+            ]
+            for rowid in expired:
+                self._delete(conn, rowid)
+
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('synced_at', ?)", (str(time.time()),))
+            if feed_date:
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('feed_date', ?)", (feed_date,))
+            if added or expired:
+                conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('feed_version', '1') "
+                    "ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1"
+                )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        if added or expired:
+            logger.info(f"Job store sync: {added} new, {len(expired)} expired")
+        return added, len(expired)
+
+    def _insert(self, conn: sqlite3.Connection, record) -> None:
+        cursor = conn.execute(
+            "INSERT INTO jobs (id, title, company, description, text, url, date, tags, salary, location) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (record.id, record.title, record.company, record.description, record.text,
+             record.url, record.date, json.dumps(record.tags), record.salary, record.location)
+        )
+        rowid = cursor.lastrowid
+        conn.execute(
+            "INSERT INTO jobs_fts (rowid, title, description, tags) VALUES (?, ?, ?, ?)",
+            (rowid, record.title, record.text, ' '.join(record.tags))
+        )
+        conn.executemany(
+            "INSERT INTO job_skills (job_rowid, skill, count) VALUES (?, ?, ?)",
+            [(rowid, skill, count) for skill, count in record.skill_counts.items()]
+        )
+        conn.executemany(
+            "INSERT INTO job_keywords (job_rowid, keyword, count) VALUES (?, ?, ?)",
+            [(rowid, word, count) for word, count in record.word_counts().items()
+             if len(word) >= 3 and word.isalpha()]
+        )
+
+    def _delete(self, conn: sqlite3.Connection, rowid: int) -> None:
+        # Contentless FTS5 tables need the original values to delete a row
+        row = conn.execute("SELECT title, text, tags FROM jobs WHERE rowid = ?", (rowid,)).fetchone()
+        conn.execute(
+            "INSERT INTO jobs_fts (jobs_fts, rowid, title, description, tags) VALUES ('delete', ?, ?, ?, ?)",
+            (rowid, row['title'], row['text'], ' '.join(json.loads(row['tags'] or '[]')))
+        )
+        conn.execute("DELETE FROM job_skills WHERE job_rowid = ?", (rowid,))
+        conn.execute("DELETE FROM job_keywords WHERE job_rowid = ?", (rowid,))
+        conn.execute("DELETE FROM jobs WHERE rowid = ?", (rowid,))
+
+    # -------------------------------------------------------------------------
+    # Materialized role views
+    # -------------------------------------------------------------------------
+
+    def get_role_view(self, role_key: str, max_jobs: int, count_hit: bool = True) -> Optional[Tuple[int, dict]]:
+        """Stored (feed_version, result) for a role query, or None if never computed."""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT feed_version, result FROM role_views WHERE role_key = ? AND max_jobs = ?",
+            (role_key, max_jobs)
+        ).fetchone()
+        if row is None:
+            return None
+        if count_hit:
+            self.count_role_view_hits([(role_key, max_jobs)])
+        return row['feed_version'], json.loads(row['result'])
+
+    def get_role_views(self, keys: List[Tuple[str, int]], count_hit: bool = True) -> Dict[Tuple[str, int], Tuple[int, dict]]:
+        """Stored (feed_version, result) for several (role_key, max_jobs) pairs in one query."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        conn = self._connect()
+        placeholders = ','.join('?' * len(keys))
+        rows = conn.execute(
+            f"SELECT role_key, max_jobs, feed_version, result FROM role_views WHERE role_key IN ({placeholders})",
+            [role_key for role_key, _ in keys]
+        ).fetchall()
+        wanted = set(keys)
+        found = {
+            (row['role_key'], row['max_jobs']): (row['feed_version'], json.loads(row['result']))
+            for row in rows if (row['role_key'], row['max_jobs']) in wanted
+        }
+        if count_hit and found:
+            self.count_role_view_hits(found)
+        return found
+
+    def count_role_view_hits(self, keys, flush: bool = True) -> bool:
+        """
+        Count one request for each (role_key, max_jobs) view.
+
+        Hits are buffered in memory, so views served from a process cache
+        still count without a write per request, and written back once
+        ROLE_VIEW_HIT_FLUSH have accumulated (or by flush_role_view_hits).
+
+        Args:
+            keys: (role_key, max_jobs) of the requested views
+            flush: Write due hits back right away; event loop callers pass
+                False and run flush_role_view_hits in a thread instead
+
+        Returns:
+            True if the buffered hits are due to be written back
+        """
+        with self._hits_lock:
+            for key in keys:
+                self._pending_hits[key] = self._pending_hits.get(key, 0) + 1
+            due = sum(self._pending_hits.values()) >= ROLE_VIEW_HIT_FLUSH
+        if due and flush:
+            self.flush_role_view_hits()
+        return due
+
+    def flush_role_view_hits(self) -> None:
+        """Write buffered role view hits to SQLite."""
+        with self._hits_lock:
+            pending, self._pending_hits = self._pending_hits, {}
+        if pending:
+            self._connect().executemany(
+                "UPDATE role_views SET hits = hits + ? WHERE role_key = ? AND max_jobs = ?",
+                [(hits, role_key, max_jobs) for (role_key, max_jobs), hits in pending.items()]
+            )
+
+    def put_role_view(self, role_key: str, max_jobs: int, role: str, feed_version: int, result: dict) -> None:
+        self.put_role_views([(role_key, max_jobs, role, feed_version, result)])
+
+    def put_role_views(self, views: List[Tuple[str, int, str, int, dict]], hits: int = 1) -> None:
+        """
+        Store several (role_key, max_jobs, role, feed_version, result) views in one transaction.
+
+        Args:
+            views: Views to insert or replace
+            hits: Request count of newly inserted views (0 for speculative warm-ups)
+        """
+        if not views:
+            return
+        # Eviction ranks views by hits, so it must see the buffered ones
+        self.flush_role_view_hits()
+        now = time.time()
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT INTO role_views (role_key, max_jobs, role, feed_version, result, hits, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(role_key, max_jobs) DO UPDATE SET "
+                "role = excluded.role, feed_version = excluded.feed_version, "
+                "result = excluded.result, updated_at = excluded.updated_at",
+                [(role_key, max_jobs, role, version, json.dumps(result), hits, now)
+                 for role_key, max_jobs, role, version, result in views]
+            )
+            self._evict_role_views(conn, max(version for _, _, _, version, _ in views))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict_role_views(self, conn: sqlite3.Connection, feed_version: int) -> None:
+        # Every distinct query leaves a row; only the most requested views
+        # outlive a feed change, and the least recently stored go beyond the cap
+        popular = "SELECT role_key, max_jobs FROM role_views ORDER BY hits DESC, updated_at DESC LIMIT ?"
+        conn.execute(
+            f"DELETE FROM role_views WHERE feed_version < ? AND (role_key, max_jobs) NOT IN ({popular})",
+            (feed_version, self.keep_role_views)
+        )
+        conn.execute(
+            "DELETE FROM role_views WHERE (role_key, max_jobs) IN ("
+            f"SELECT role_key, max_jobs FROM role_views WHERE (role_key, max_jobs) NOT IN ({popular}) "
+            "ORDER BY updated_at DESC LIMIT -1 OFFSET ?)",
+            (self.keep_role_views, max(0, self.max_role_views - self.keep_role_views))
+        )
+
+    def popular_role_views(self, limit: int) -> List[Tuple[str, int]]:
+        """(role, max_jobs) of the most requested role views."""
+        self.flush_role_view_hits()
+        rows = self._connect().execute(
+            "SELECT role, max_jobs FROM role_views ORDER BY hits DESC, updated_at DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return [(row['role'], row['max_jobs']) for row in rows]
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def search(self, role: str, max_jobs: int = 20) -> List[Tuple[float, dict]]:
+        """
+        Rank stored jobs for a role query with field-weighted BM25.
+
+        Title hits weigh 10x description/tag hits and at least one specific
+        (non-generic) keyword must match; generic keywords add a 0.1 boost
+        when they appear in the title. FTS5 finds and scores the title and
+        body matches of each keyword separately, and the scores are rescaled
+        to the positive IDF the in-memory index used (see _idf_scale).
+
+        Returns:
+            List of (score, job dict) tuples, best first
+        """
+        keywords = tokenize_role(role)
+        specific = [kw for kw in dict.fromkeys(keywords) if kw not in GENERIC_TERMS]
+        generic = [kw for kw in keywords if kw in GENERIC_TERMS]
+        if not specific or max_jobs <= 0:
+            return []
+
+        conn = self._connect()
+        total = self.count()
+        scores = {}
+        for kw in specific:
+            title_scores = self._term_scores(conn, f"title : {_fts_phrase(kw)}", (1.0, 0.0, 0.0), total)
+            body_scores = self._term_scores(conn, f"{{description tags}} : {_fts_phrase(kw)}", (0.0, 1.0, 1.0), total)
+            # A keyword scores once per job: in the title if it is there, else in the body
+            for rowid, score in body_scores.items():
+                if rowid not in title_scores:
+                    scores[rowid] = scores.get(rowid, 0.0) + BODY_WEIGHT * score
+            for rowid, score in title_scores.items():
+                scores[rowid] = scores.get(rowid, 0.0) + TITLE_WEIGHT * score
+        if not scores:
+            return []
+
+        candidates = heapq.nlargest(max_jobs * SEARCH_WINDOW, scores, key=lambda rowid: (scores[rowid], -rowid))
+        ranked = []
+        for job in self.get_jobs(candidates):
+            score = scores[job['rowid']]
+            if generic:
+                title_terms = set(tokenize(job['title']))
+                score += GENERIC_WEIGHT * sum(1 for kw in generic if kw in title_terms)
+            ranked.append((score, job))
+
+        ranked.sort(key=lambda item: (item[0], -item[1]['rowid']), reverse=True)
+        return ranked[:max_jobs]
+
+    @staticmethod
+    def _term_scores(conn: sqlite3.Connection, query: str, weights: Tuple[float, float, float],
+                     total: int) -> Dict[int, float]:
+        """BM25 score (positive IDF) of one column-filtered keyword query for every matching job."""
+        rows = conn.execute(
+            "SELECT rowid, bm25(jobs_fts, ?, ?, ?) FROM jobs_fts WHERE jobs_fts MATCH ?", (*weights, query)
+        ).fetchall()
+        scale = _idf_scale(total, len(rows))
+        # FTS5 bm25() is negative; lower is better
+        return {rowid: -rank * scale for rowid, rank in rows}
+
+    def search_many(self, queries: List[Tuple[str, int]]) -> List[List[Tuple[float, dict]]]:
+        """
+        Run search() for several (role, max_jobs) queries against one snapshot of the store.
+
+        Returns:
+            One ranked list per query, in the same order
+        """
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            return [self.search(role, max_jobs) for role, max_jobs in queries]
+        finally:
+            conn.execute("COMMIT")
+
+    def aggregate_counts(self, rowids: List[int]) -> Tuple[Counter, Counter]:
+        """
+        Sum keyword and skill counts over a set of jobs.
+
+        Returns:
+            Tuple of (word counts for 3+ letter words, KNOWN_SKILLS counts)
+        """
+        if not rowids:
+            return Counter(), Counter()
+        conn = self._connect()
+        placeholders = ','.join('?' * len(rowids))
+        words = Counter(dict(conn.execute(
+            f"SELECT keyword, SUM(count) FROM job_keywords WHERE job_rowid IN ({placeholders}) GROUP BY keyword",
+            rowids
+        ).fetchall()))
+        skills = Counter(dict(conn.execute(
+            f"SELECT skill, SUM(count) FROM job_skills WHERE job_rowid IN ({placeholders}) GROUP BY skill",
+            rowids
+        ).fetchall()))
+        return words, skills
+
+    def term_counts(self) -> Tuple[int, List[int], List[tuple], List[tuple]]:
+        """
+        Every job's skill and keyword counts, read from one consistent snapshot.
+
+        Returns:
+            Tuple of (feed version, job rowids, (rowid, skill, count) rows,
+            (rowid, keyword, count) rows)
+        """
+        conn = self._connect()
+        conn.execute("BEGIN")
+        try:
+            version = int(self.get_meta('feed_version') or 0)
+            rowids = [row[0] for row in conn.execute("SELECT rowid FROM jobs ORDER BY rowid")]
+            skills = conn.execute("SELECT job_rowid, skill, count FROM job_skills").fetchall()
+            keywords = conn.execute("SELECT job_rowid, keyword, count FROM job_keywords").fetchall()
+        finally:
+            conn.execute("COMMIT")
+        return version, rowids, skills, keywords
+
+    def title_terms(self) -> set:
+        """Every word that occurs in a stored job title."""
+        rows = self._connect().execute("SELECT title FROM jobs").fetchall()
+        return {term for row in rows for term in tokenize(row['title'])}
+
+    def title_rowids(self, *terms: str) -> List[int]:
+        """Rowids of jobs whose title contains every term (case-insensitive), newest first."""
+        where = ' AND '.join("title LIKE ?" for _ in terms) or '1'
+        rows = self._connect().execute(
+            f"SELECT rowid FROM jobs WHERE {where} ORDER BY date DESC",
+            [f"%{term}%" for term in terms]
+        ).fetchall()
+        return [row['rowid'] for row in rows]
+
+    def get_jobs(self, rowids: List[int]) -> List[dict]:
+        """Job dicts for the given rowids, in the same order."""
+        if not rowids:
+            return []
+        placeholders = ','.join('?' * len(rowids))
+        rows = self._connect().execute(f"SELECT * FROM jobs WHERE rowid IN ({placeholders})", rowids).fetchall()
+        by_rowid = {row['rowid']: self._row_to_job(row) for row in rows}
+        return [by_rowid[rowid] for rowid in rowids if rowid in by_rowid]
+
+    def count(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    @staticmethod
+    def _row_to_job(row: sqlite3.Row) -> dict:
+        return {
+            'rowid': row['rowid'],
+            'id': row['id'],
+            'title': row['title'],
+            'company': row['company'],
+            'description': row['description'],
+            'text': row['text'],
+            'url': row['url'],
+            'date': row['date'],
+            'tags': json.loads(row['tags'] or '[]'),
+            'salary': row['salary'],
+            'location': row['location']
+        }
@@ -0,0 +1,118 @@
+"""
+Streaming JSON Array Parser for ResuMatch
+Yields the elements of a top-level JSON array while the body is still downloading
+"""
+
+import codecs
+import json
+from typing import Any, Iterable, Iterator, List
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',]'
+
+# Parser states inside the array: right after '[', after ',', after an element
+_FIRST, _VALUE, _SEPARATOR = range(3)
+
+
+class JsonArrayParser:
+    """
+    Push parser for a JSON array: feed it byte chunks, get back finished elements.
+
+    Only the current partial element is buffered, so memory stays bounded by
+    the largest element rather than the whole payload. Works the same whether
+    the chunks come from a blocking or an asyncio response.
+    """
+
+    def __init__(self, encoding: str = 'utf-8'):
+        self._text_decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        self._buf = ''
+        self._started = False
+        self._expect = _FIRST  # what the array grammar allows next
+        self.done = False  # the closing ']' has been seen
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Add a chunk and return the elements it completed."""
+        self._buf += self._text_decoder.decode(chunk)
+        return self._drain(finished=False)
+
+    def close(self) -> List[Any]:
+        """
+        Signal end of input and return the remaining elements.
+
+        Raises:
+            ValueError: If the input is not a well-formed JSON array
+        """
+        self._buf += self._text_decoder.decode(b'', final=True)
+        items = self._drain(finished=True)
+        if not self.done:
+            raise ValueError("Unexpected end of JSON array")
+        return items
+
+    def _drain(self, finished: bool) -> List[Any]:
+        items = []
+        buf = self._buf
+        pos = 0
+
+        while not self.done:
+            # Skip whitespace between tokens
+            while pos < len(buf) and buf[pos] in _WHITESPACE:
+                pos += 1
+            if pos >= len(buf):
+                break
+            char = buf[pos]
+
+            if not self._started:
+                if char != '[':
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                pos += 1
+                continue
+            if self._expect == _SEPARATOR:
+                if char == ',':
+                    self._expect = _VALUE
+                elif char == ']':
+                    self.done = True
+                else:
+                    raise ValueError(f"Expected ',' or ']' in JSON array, got {char!r}")
+                pos += 1
+                continue
+            if char == ']' and self._expect == _FIRST:
+                self.done = True
+                pos += 1
+                break
+            if char in ',]':
+                # "[1,,2]", "[,1]" and "[1,]" have an empty element
+                raise ValueError(f"Expected a value in JSON array, got {char!r}")
+
+            try:
+                item, end = _decoder.raw_decode(buf, pos)
+            except ValueError:
+                if finished:
+                    raise
+                break
+            # A scalar is only complete once a delimiter follows it ("3.5" may be the start of "3.5e10")
+            if not (isinstance(item, (dict, list)) or finished or (end < len(buf) and buf[end] in _DELIMITERS)):
+                break
+            items.append(item)
+            self._expect = _SEPARATOR
+            pos = end
+
+        # Drop what was consumed; keep the partial element for the next chunk
+        self._buf = '' if self.done else buf[pos:]
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes], encoding: str = 'utf-8') -> Iterator[Any]:
+    """
+    Parse a JSON array incrementally from a stream of byte chunks.
+
+    Raises:
+        ValueError: If the stream is not a well-formed JSON array
+    """
+    parser = JsonArrayParser(encoding)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+        if parser.done:
+            return
+    yield from parser.close()
@@ -10,6 +10,8 @@ from contextvars import ContextVar
 
 # Context variable to hold the current log queue
 log_queue_var: ContextVar[asyncio.Queue] = ContextVar('log_queue', default=None)
+# Event loop that owns the current log queue; sync senders on worker threads hand messages to it
+log_loop_var: ContextVar[asyncio.AbstractEventLoop] = ContextVar('log_loop', default=None)
 
 
 def get_log_queue() -> asyncio.Queue:
@@ -21,8 +23,46 @@ def get_log_queue() -> asyncio.Queue:
 
 
 def set_log_queue(queue: asyncio.Queue) -> None:
-    """Set the log queue in context."""
+    """Set the log queue in context, bound to the running event loop (if any)."""
     log_queue_var.set(queue)
+    try:
+        log_loop_var.set(asyncio.get_running_loop() if queue is not None else None)
+    except RuntimeError:
+        log_loop_var.set(None)
+
+
+def _put_nowait(queue: asyncio.Queue, message) -> None:
+    try:
+        queue.put_nowait(message)
+    except asyncio.QueueFull:
+        pass  # Skip if queue is full
+
+
+def _running_loop():
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _deliver(queue: asyncio.Queue, *messages) -> None:
+    """
+    Put messages on the queue from any thread.
+
+    asyncio.Queue is not thread-safe: from a worker thread (a workflow node
+    running in an executor) the put is scheduled on the queue's event loop
+    so waiting consumers are woken up correctly.
+    """
+    loop = log_loop_var.get()
+    if loop is None or loop.is_closed() or _running_loop() is loop:
+        for message in messages:
+            _put_nowait(queue, message)
+        return
+    for message in messages:
+        try:
+            loop.call_soon_threadsafe(_put_nowait, queue, message)
+        except RuntimeError:
+            pass  # Loop closed while the node was still running
 
 
 async def log_message(content: str, log_type: str = "log", step: str = "") -> None:
@@ -45,8 +85,8 @@ async def log_message(content: str, log_type: str = "log", step: str = "") -> No
 
 def log_message_sync(content: str, log_type: str = "log", step: str = "") -> None:
     """
-    Synchronous version of log_message for use in sync functions.
-    Creates a new event loop task to put the message.
+    Synchronous version of log_message for use in sync functions,
+    including workflow nodes running on executor threads.
     
     Args:
         content: The log message content
@@ -59,11 +99,8 @@ def log_message_sync(content: str, log_type: str = "log", step: str = "") -> Non
         if step:
             data["step"] = step
         message = json.dumps(data)
-        try:
-            # Try to put without blocking
-            queue.put_nowait(message)
-        except asyncio.QueueFull:
-            pass  # Skip if queue is full
+        # Never blocks, safe from worker threads
+        _deliver(queue, message)
 
 
 async def send_node_status(node: str, status: str, message: str = "") -> None:
@@ -96,10 +133,7 @@ def send_node_status_sync(node: str, status: str, message: str = "") -> None:
             "status": status,
             "message": message
         })
-        try:
-            queue.put_nowait(data)
-        except asyncio.QueueFull:
-            pass
+        _deliver(queue, data)
 
 
 async def send_result(payload: dict) -> None:
@@ -128,11 +162,7 @@ def send_result_sync(payload: dict) -> None:
             "type": "result",
             "payload": payload
         })
-        try:
-            queue.put_nowait(data)
-            queue.put_nowait(None)  # Signal completion
-        except asyncio.QueueFull:
-            pass
+        _deliver(queue, data, None)  # None signals completion
 
 
 async def event_generator(queue: asyncio.Queue) -> AsyncGenerator[str, None]:
@@ -4,7 +4,7 @@ AI-powered resume analysis using LangGraph agents
 """
 
 from fastapi import FastAPI, File, UploadFile, Form, HTTPException
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 import uvicorn
@@ -28,11 +28,27 @@ logger = logging.getLogger(__name__)
 
 # Import RAG engine and workflow
 # Import RAG engine and workflow
-from workflow import app as langgraph_app, run_analysis_streaming
+from workflow import app as langgraph_app, run_analysis_streaming, MARKET_JOBS
+from market_prefetch import MarketPrefetch
+from http_client import aclose_clients
+from fetch_market import get_job_store
+from youtube_courses import get_quota_accountant, refresh_hot_course_searches, youtube_status
+from config import Config
 import asyncio
 import json as json_module
 
 
+async def refresh_hot_courses_periodically():
+    """Re-fetch the most used course searches before they expire, for the app's lifetime."""
+    while True:
+        try:
+            # Refreshes only spend quota above YOUTUBE_REFRESH_RESERVE
+            await asyncio.to_thread(refresh_hot_course_searches)
+        except Exception as e:
+            logger.warning(f"Hot course search refresh failed: {e}")
+        await asyncio.sleep(Config.COURSE_CACHE_REFRESH_INTERVAL)
+
+
 # Startup event handler
 @asynccontextmanager
 async def lifespan(app):
@@ -40,11 +56,21 @@ async def lifespan(app):
     # Startup: Ingest knowledge base
     logger.info("Starting ResuMatch with LangGraph backend...")
     logger.info("Using Live API for Job Search (RAG Engine removed)")
+    youtube = youtube_status()
+    if youtube["status"] != "ok":
+        logger.warning(f"YouTube courses unavailable: {youtube['detail']}")
+    course_refresh = None
+    if youtube["status"] != "unavailable" and Config.COURSE_CACHE_REFRESH_INTERVAL > 0:
+        course_refresh = asyncio.create_task(refresh_hot_courses_periodically())
     
     yield  # App runs here
     
     # Shutdown
     logger.info("Shutting down ResuMatch...")
+    if course_refresh:
+        course_refresh.cancel()
+    await asyncio.to_thread(get_job_store().flush_role_view_hits)
+    await aclose_clients()
 
 
 # Initialize FastAPI app with lifespan
@@ -108,10 +134,28 @@ async def health_check():
         "status": "healthy",
         "version": "2.0.0",
         "engine": "LangGraph",
+        "youtube": youtube_status(),
         "timestamp": datetime.now().isoformat()
     }
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Operational gauges in Prometheus text format"""
+    quota = get_quota_accountant().usage()
+    return (
+        "# HELP resumatch_youtube_quota_remaining YouTube API units left in today's budget\n"
+        "# TYPE resumatch_youtube_quota_remaining gauge\n"
+        f"resumatch_youtube_quota_remaining {quota['remaining']}\n"
+        "# HELP resumatch_youtube_quota_used YouTube API units spent today\n"
+        "# TYPE resumatch_youtube_quota_used gauge\n"
+        f"resumatch_youtube_quota_used {quota['used']}\n"
+        "# HELP resumatch_youtube_quota_budget Daily YouTube API unit budget\n"
+        "# TYPE resumatch_youtube_quota_budget gauge\n"
+        f"resumatch_youtube_quota_budget {quota['budget']}\n"
+    )
+
+
 @app.post("/analyze")
 async def analyze_resume(
     resume: UploadFile = File(...),
@@ -125,14 +169,17 @@ async def analyze_resume(
     3. Return structured analysis result
     """
     try:
+        # Start warming market data while the file is read and analyzed
+        prefetch = MarketPrefetch(max_jobs=MARKET_JOBS)
+        
         # Read resume file
         content = await resume.read()
         filename = resume.filename or "resume.pdf"
         
         logger.info(f"Received resume: {filename}")
         
-        # Extract text from file
-        pdf_text = extract_text_from_file(content, filename)
+        # Extract text from file (off the event loop, so the prefetch keeps running)
+        pdf_text = await asyncio.to_thread(extract_text_from_file, content, filename)
         
         if not pdf_text or len(pdf_text) < 50:
             raise HTTPException(
@@ -141,6 +188,7 @@ async def analyze_resume(
             )
         
         logger.info(f"Extracted {len(pdf_text)} characters from resume")
+        prefetch.guess(f"{pdf_text}\n{job_description or ''}")
         
         # Prepare initial state
         initial_state = {
@@ -148,6 +196,9 @@ async def analyze_resume(
             "role": "",
             "skill_gaps": [],
             "retrieved_docs": "",
+            "market_data": {},
+            "course_pool": {},
+            "branch_timings": {},
             "final_result": {}
         }
         
@@ -157,7 +208,8 @@ async def analyze_resume(
         
         # Invoke LangGraph workflow
         logger.info("Running LangGraph analysis...")
-        result = langgraph_app.invoke(initial_state)
+        result = await langgraph_app.ainvoke(initial_state)
+        prefetch.report(result.get("role", ""))
         
         # Extract final result
         final_result = result.get("final_result", {})
@@ -177,7 +229,7 @@ async def analyze_resume(
         logger.info(f"Detected role: {role_detected}")
         
         # Generate roadmap - either from LLM result or fallback  
-        from workflow import generate_fallback_roadmap, generate_fallback_jobs
+        from workflow import generate_fallback_roadmap, generate_fallback_jobs, run_blocking
         
         llm_roadmap = final_result.get("roadmap", [])
         llm_jobs = final_result.get("recommended_jobs", [])
@@ -185,7 +237,12 @@ async def analyze_resume(
         # Use LLM result if available, otherwise generate fallback
         if not llm_roadmap:
             logger.warning("LLM returned no roadmap, using fallback")
-            llm_roadmap = generate_fallback_roadmap(skill_gaps_for_fallback if skill_gaps_for_fallback else ["Python", "Cloud Computing", "DevOps"])
+            llm_roadmap = await run_blocking(
+                generate_fallback_roadmap,
+                skill_gaps_for_fallback if skill_gaps_for_fallback else ["Python", "Cloud Computing", "DevOps"],
+                result.get("course_pool"),
+                role_detected
+            )
         
         if not llm_jobs:
             logger.warning("LLM returned no jobs, using fallback")
@@ -251,7 +308,7 @@ async def root():
         "name": "ResuMatch API",
         "version": "2.0.0",
         "engine": "LangGraph",
-        "endpoints": ["/analyze", "/analyze-stream", "/health", "/docs"]
+        "endpoints": ["/analyze", "/analyze-stream", "/health", "/metrics", "/docs"]
     }
 
 
@@ -265,14 +322,17 @@ async def analyze_resume_stream(
     Returns real-time updates as each LangGraph node executes.
     """
     try:
+        # Start warming market data while the file is read and analyzed
+        prefetch = MarketPrefetch(max_jobs=MARKET_JOBS)
+        
         # Read resume file
         content = await resume.read()
         filename = resume.filename or "resume.pdf"
         
         logger.info(f"SSE: Received resume for streaming analysis: {filename}")
         
-        # Extract text from file
-        pdf_text = extract_text_from_file(content, filename)
+        # Extract text from file (off the event loop, so the prefetch keeps running)
+        pdf_text = await asyncio.to_thread(extract_text_from_file, content, filename)
         
         if not pdf_text or len(pdf_text) < 50:
             raise HTTPException(
@@ -283,6 +343,7 @@ async def analyze_resume_stream(
         # If job description provided, add it to context
         if job_description:
             pdf_text = f"{pdf_text}\n\nTARGET JOB DESCRIPTION:\n{job_description}"
+        prefetch.guess(pdf_text)
         
         # Return streaming response
         return StreamingResponse(
@@ -0,0 +1,124 @@
+"""
+Speculative Market Prefetch for ResuMatch
+Warms the job feed and likely role market views while a resume is still being read and analyzed
+"""
+
+import asyncio
+import re
+from collections import Counter
+from typing import List
+import logging
+
+from config import Config
+from fetch_market import aget_synced_job_store, awarm_role_view, get_title_terms, role_view_key
+from job_index import tokenize
+
+logger = logging.getLogger(__name__)
+
+# Head nouns of job titles; a guess is up to two capitalized modifiers ending in one
+ROLE_NOUNS = (
+    'Engineer', 'Developer', 'Scientist', 'Analyst', 'Manager', 'Designer', 'Architect',
+    'Consultant', 'Administrator', 'Specialist', 'Programmer', 'Researcher', 'Technician'
+)
+ROLE_RE = re.compile(r"\b((?:[A-Z][\w+#./-]*[ \t]+){0,2}(?:" + '|'.join(ROLE_NOUNS) + r"))s?\b")
+# Seniority words dropped from a guess, so it matches the role the LLM reports
+SENIORITY_WORDS = {'senior', 'sr', 'sr.', 'junior', 'jr', 'jr.', 'lead', 'staff', 'principal', 'intern', 'chief', 'head'}
+# Titles in the first characters (the resume headline) count extra
+HEADLINE_CHARS = 600
+HEADLINE_WEIGHT = 3
+
+# Prefetch tasks in flight; referenced so they are not garbage collected mid-run
+_tasks = set()
+
+
+def guess_roles(text: str, limit: int = 2, title_terms: frozenset = frozenset()) -> List[str]:
+    """
+    Cheap local guess of the role a resume targets, most likely first.
+
+    Counts title-cased job titles ("Data Scientist", "Senior Python
+    Developer"), weighting the headline, with seniority words removed.
+    Leading words that occur in no job title ("Jane Smith Data Scientist",
+    "Acme Backend Developer") are dropped too.
+
+    Args:
+        text: Resume text (optionally followed by a job description)
+        limit: Maximum guesses
+        title_terms: Words of the feed's job titles; no trimming when empty
+
+    Returns:
+        Distinct role guesses (by role_view_key), possibly empty
+    """
+    scores = Counter()
+    names = {}
+    for match in ROLE_RE.finditer(text):
+        words = match.group(1).split()
+        while len(words) > 1 and words[0].lower() in SENIORITY_WORDS:
+            words = words[1:]
+        while title_terms and len(words) > 1 and not set(tokenize(words[0])) <= title_terms:
+            words = words[1:]
+        role = ' '.join(words)
+        key = role_view_key(role)
+        if not key:
+            continue
+        names.setdefault(key, role)
+        scores[key] += HEADLINE_WEIGHT if match.start() < HEADLINE_CHARS else 1
+    return [names[key] for key, _ in scores.most_common(limit)]
+
+
+def _spawn(coro, what: str) -> asyncio.Task:
+    task = asyncio.ensure_future(coro)
+    _tasks.add(task)
+
+    def done(task: asyncio.Task) -> None:
+        _tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Speculative prefetch of {what} failed: {task.exception()}")
+
+    task.add_done_callback(done)
+    return task
+
+
+class MarketPrefetch:
+    """
+    Speculative market-data warm-up for one analysis request.
+
+    Created as soon as an upload arrives: the feed snapshot and job store
+    start syncing right away, concurrently with reading and extracting the
+    file. Once the text is known, guess() starts building the market views
+    of the likely roles while the first LLM call runs. Results land in the
+    shared role view cache, and a market fetch for the same role that
+    starts while a warm-up is still running joins it (role_flights), so
+    when the LLM's role matches a guess its market data is already there.
+    Warm-ups are not counted as requests for a view, so a wrong guess only
+    costs a local view computation and never becomes a popular view.
+    """
+
+    def __init__(self, max_jobs: int):
+        self.max_jobs = max_jobs
+        self.guesses = []
+        self.title_terms = frozenset()
+        self.enabled = Config.MARKET_PREFETCH_ENABLED
+        if self.enabled:
+            _spawn(self._load_feed(), "the job feed")
+
+    async def _load_feed(self) -> None:
+        store = await aget_synced_job_store()
+        self.title_terms = await asyncio.to_thread(get_title_terms, store)
+
+    def guess(self, text: str) -> List[str]:
+        """Start warming the market views of the roles guessed from the resume text."""
+        if not self.enabled:
+            return []
+        self.guesses = guess_roles(text, Config.MARKET_PREFETCH_ROLES, self.title_terms)
+        for role in self.guesses:
+            _spawn(awarm_role_view(role, self.max_jobs), f"'{role}' market view")
+        if self.guesses:
+            logger.info(f"Prefetching market data for guessed roles: {self.guesses}")
+        return self.guesses
+
+    def report(self, role: str) -> bool:
+        """Log whether the role the analysis settled on was among the guesses."""
+        hit = role_view_key(role) in {role_view_key(guess) for guess in self.guesses}
+        if self.guesses:
+            logger.info(f"Market prefetch {'hit' if hit else 'miss'}: role '{role}', guessed {self.guesses}")
+        return hit
@@ -0,0 +1,90 @@
+"""
+Single-Flight Call Coalescing for ResuMatch
+Concurrent lookups for the same key share one in-flight upstream call and its result
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Deduplicates concurrent calls by key.
+
+    The first caller for a key (the leader) runs the call; every caller that
+    arrives while it is in flight waits for the leader's result (or
+    exception) instead of issuing its own. Nothing is cached: once the call
+    finishes the next caller starts a new one. Threads and asyncio tasks
+    share the same flights, so a request coroutine and a worker thread
+    asking for the same key still make one call.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._flights = {}  # key -> concurrent.futures.Future
+        self._lock = threading.Lock()
+
+    def begin(self, key: Hashable) -> Tuple[Future, bool]:
+        """
+        Join the flight for a key, starting it if there is none.
+
+        Returns:
+            (future, leader): the leader must call finish() for the key
+        """
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._flights[key] = future
+            return future, True
+
+    def finish(self, key: Hashable, result: Any = None, error: BaseException = None) -> None:
+        """Publish the leader's outcome to every waiter and close the flight."""
+        with self._lock:
+            future = self._flights.pop(key)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def do(self, key: Hashable, fn: Callable, *args, **kwargs) -> Any:
+        """Call fn(*args, **kwargs) unless the same key is already in flight, then share its result."""
+        future, leader = self.begin(key)
+        if not leader:
+            logger.debug(f"{self.name}: joined in-flight call for {key}")
+            return future.result()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            self.finish(key, error=e)
+            raise
+        self.finish(key, result=result)
+        return result
+
+    async def ado(self, key: Hashable, fn: Callable[..., Awaitable], *args, **kwargs) -> Any:
+        """
+        Asyncio counterpart of do(). The leader's call runs as its own task,
+        so cancelling the leading caller does not abort it for the others.
+        """
+        future, leader = self.begin(key)
+        if leader:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+
+            def publish(task: asyncio.Task) -> None:
+                if task.cancelled():
+                    self.finish(key, error=asyncio.CancelledError())
+                elif task.exception() is not None:
+                    self.finish(key, error=task.exception())
+                else:
+                    self.finish(key, result=task.result())
+
+            task.add_done_callback(publish)
+        else:
+            logger.debug(f"{self.name}: joined in-flight call for {key}")
+        return await asyncio.shield(asyncio.wrap_future(future))
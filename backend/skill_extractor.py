@@ -0,0 +1,89 @@
+"""
+Multi-Pattern Skill Extractor for ResuMatch
+Finds every known skill in a text in a single pass using an Aho-Corasick automaton
+"""
+
+from collections import Counter, deque
+from typing import Iterable, List, Tuple
+
+from job_index import tokenize
+
+
+class SkillExtractor:
+    """
+    Aho-Corasick automaton over word tokens.
+
+    Skills are compiled into a trie of token sequences ("machine learning" is
+    the two-token path machine -> learning) with failure links, so a text is
+    scanned once no matter how many skills are known. Because the alphabet is
+    whole tokens, matches always start and end on word boundaries: "go" does
+    not match inside "good" and "lean" does not match inside "clean".
+    Overlapping skills are all reported, e.g. "sql server" counts both
+    "sql server" and "sql".
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self._goto = [{}]   # state -> {token: next_state}
+        self._fail = [0]
+        self._output = [[]]  # state -> skills ending at this state
+
+        for skill in skills:
+            tokens = tokenize(skill)
+            if not tokens:
+                continue
+            state = 0
+            for token in tokens:
+                next_state = self._goto[state].get(token)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[state][token] = next_state
+                state = next_state
+            self._output[state].append(skill)
+
+        self._build_failure_links()
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and token not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(token, 0)
+                # Inherit matches that end at the failure state (shorter suffix skills)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def count_tokens(self, tokens: Iterable[str]) -> Counter:
+        """Count skill occurrences in an already-tokenized text."""
+        goto, fail, output = self._goto, self._fail, self._output
+        counts = Counter()
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if output[state]:
+                counts.update(output[state])
+        return counts
+
+    def count(self, text: str) -> Counter:
+        """Count skill occurrences in raw text (HTML tags are ignored)."""
+        return self.count_tokens(tokenize(text))
+
+    def extract(self, texts: Iterable[str]) -> Tuple[List[Counter], Counter]:
+        """
+        Count skills in several texts.
+
+        Returns:
+            Tuple of (per-text counts, aggregate counts across all texts)
+        """
+        per_text = [self.count(text) for text in texts]
+        total = Counter()
+        for counts in per_text:
+            total.update(counts)
+        return per_text, total
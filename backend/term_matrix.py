@@ -0,0 +1,153 @@
+"""
+Job x Term Matrix for ResuMatch
+Sparse skill/keyword counts of every stored job, scored per role with vectorized log-odds
+"""
+
+from typing import Iterable, List, Sequence
+import logging
+
+import numpy as np
+from scipy import sparse
+
+logger = logging.getLogger(__name__)
+
+# Strength of the feed-wide prior, as a fraction of the feed's total term count.
+# Smaller values trust the role's own counts more.
+PRIOR_WEIGHT = 0.1
+
+
+class TermMatrix:
+    """
+    Sparse job x term count matrix for one feed version.
+
+    Columns are the KNOWN_SKILLS found in the feed followed by the remaining
+    non-stopword keywords. A role is scored by summing the rows of its
+    matched jobs and comparing that distribution to the whole feed with the
+    log-odds ratio under an informative Dirichlet prior (Monroe et al., 2008),
+    so terms that are merely common everywhere ("team", "data") rank below
+    terms that distinguish the role. Many roles are scored at once with one
+    sparse (roles x jobs) @ (jobs x terms) product.
+    """
+
+    def __init__(self, feed_version: int, rowids: Sequence[int], terms: Sequence[str],
+                 skill_terms: int, matrix: sparse.csr_matrix):
+        self.feed_version = feed_version
+        self.terms = list(terms)
+        self.skill_terms = skill_terms  # columns [0, skill_terms) are KNOWN_SKILLS
+        self.matrix = matrix
+        self.row_of = {rowid: i for i, rowid in enumerate(rowids)}
+
+        totals = np.asarray(matrix.sum(axis=0), dtype=np.float64).ravel()
+        self._totals = totals
+        self._total = totals.sum()
+        self._prior = PRIOR_WEIGHT * totals
+        self._prior_total = self._prior.sum()
+
+    @classmethod
+    def from_store(cls, store, stopwords: Iterable[str]) -> 'TermMatrix':
+        """Build the matrix from the per-job counts written at ingest."""
+        version, rowids, skill_rows, keyword_rows = store.term_counts()
+        row_of = {rowid: i for i, rowid in enumerate(rowids)}
+        stopwords = set(stopwords)
+
+        skills = sorted({skill for _, skill, _ in skill_rows})
+        skill_set = set(skills)
+        keywords = sorted({word for _, word, _ in keyword_rows if word not in stopwords and word not in skill_set})
+        terms = skills + keywords
+        column_of = {term: i for i, term in enumerate(terms)}
+
+        rows, cols, counts = [], [], []
+        for rowid, term, count in skill_rows:
+            if rowid in row_of:
+                rows.append(row_of[rowid])
+                cols.append(column_of[term])
+                counts.append(count)
+        for rowid, term, count in keyword_rows:
+            col = column_of.get(term)
+            if col is not None and col >= len(skills) and rowid in row_of:
+                rows.append(row_of[rowid])
+                cols.append(col)
+                counts.append(count)
+
+        matrix = sparse.csr_matrix(
+            (np.asarray(counts, dtype=np.float64), (rows, cols)), shape=(len(rowids), len(terms))
+        )
+        logger.info(f"Built job x term matrix: {matrix.shape[0]} jobs, {matrix.shape[1]} terms, {matrix.nnz} entries")
+        return cls(version, rowids, terms, len(skills), matrix)
+
+    def role_counts(self, rowid_groups: List[List[int]]) -> np.ndarray:
+        """Summed term counts for each group of jobs, as a dense (groups x terms) array."""
+        rows, cols = [], []
+        for group, rowids in enumerate(rowid_groups):
+            for rowid in set(rowids):
+                row = self.row_of.get(rowid)
+                if row is not None:
+                    rows.append(group)
+                    cols.append(row)
+        selector = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=(len(rowid_groups), self.matrix.shape[0])
+        )
+        return np.asarray((selector @ self.matrix).todense())
+
+    def log_odds(self, counts: np.ndarray) -> np.ndarray:
+        """
+        z-scored log-odds of each term in each role versus the rest of the feed.
+
+        Args:
+            counts: (roles x terms) counts from role_counts
+
+        Returns:
+            (roles x terms) array; positive values are over-represented in the role
+        """
+        prior, prior_total = self._prior, self._prior_total
+        role_total = counts.sum(axis=1, keepdims=True)
+        rest = np.maximum(self._totals - counts, 0.0)
+        rest_total = np.maximum(self._total - role_total, 0.0)
+
+        role_odds = (counts + prior) / (role_total + prior_total - counts - prior)
+        rest_odds = (rest + prior) / (rest_total + prior_total - rest - prior)
+        delta = np.log(role_odds) - np.log(rest_odds)
+        variance = 1.0 / (counts + prior) + 1.0 / (rest + prior)
+        return delta / np.sqrt(variance)
+
+    def market_skills(self, rowid_groups: List[List[int]], limit: int = 12, max_words: int = 20) -> List[List[dict]]:
+        """
+        Rank the market skills of several roles in one pass.
+
+        KNOWN_SKILLS mentioned by a role's jobs come first, followed by other
+        keywords that appear at least twice and are over-represented in the
+        role; each group is ordered by distinctiveness.
+
+        Args:
+            rowid_groups: Matched job rowids, one list per role
+            limit: Skills returned per role
+            max_words: Non-KNOWN_SKILLS keywords considered per role
+
+        Returns:
+            One list of {'skill', 'count', 'score'} dicts per role
+        """
+        if not rowid_groups:
+            return []
+        if not self.terms:
+            return [[] for _ in rowid_groups]
+
+        counts = self.role_counts(rowid_groups)
+        scores = self.log_odds(counts)
+        n_skills = self.skill_terms
+
+        results = []
+        for role_counts, role_scores in zip(counts, scores):
+            skill_cols = np.flatnonzero(role_counts[:n_skills] > 0)
+            skill_cols = skill_cols[np.argsort(-role_scores[skill_cols], kind='stable')]
+
+            word_cols = n_skills + np.flatnonzero(
+                (role_counts[n_skills:] >= 2) & (role_scores[n_skills:] > 0)
+            )
+            word_cols = word_cols[np.argsort(-role_scores[word_cols], kind='stable')][:max_words]
+
+            ranked = [
+                {'skill': self.terms[col].title(), 'count': int(role_counts[col]), 'score': round(float(role_scores[col]), 3)}
+                for col in np.concatenate([skill_cols, word_cols])[:limit]
+            ]
+            results.append(ranked)
+        return results
@@ -0,0 +1,12 @@
+"""
+Test Configuration for ResuMatch
+Makes the flat backend modules importable from the tests directory
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# workflow builds its LLM clients at import time; no request is ever sent in tests
+os.environ.setdefault('GROQ_API_KEY', 'test')
@@ -0,0 +1,79 @@
+"""
+Cassette Tests for ResuMatch
+Cassette keys, batch body normalization and record/replay
+"""
+
+import httpx
+import pytest
+
+from cassette import Cassette, CassetteMissError, CassetteTransport
+
+
+def batch_body(boundary: str, uuid: str, key: str) -> bytes:
+    parts = []
+    for i, query in enumerate(['python', 'docker'], start=1):
+        parts.append(
+            f"--{boundary}\r\n"
+            "Content-Type: application/http\r\n"
+            "Content-Transfer-Encoding: binary\r\n"
+            f"Content-ID: <{uuid} + {i}>\r\n"
+            "\r\n"
+            f"GET /youtube/v3/search?part=snippet&q={query}&key={key}&alt=json HTTP/1.1\r\n"
+            "\r\n"
+        )
+    return ''.join(parts).encode('ascii') + f"--{boundary}--".encode('ascii')
+
+
+def test_clean_url_strips_keys_and_sorts_the_query():
+    url = 'https://www.googleapis.com/youtube/v3/search?q=python&key=SECRET&part=snippet#frag'
+
+    assert Cassette.clean_url(url) == 'https://www.googleapis.com/youtube/v3/search?part=snippet&q=python'
+    assert Cassette.clean_url(url) == Cassette.clean_url(url.replace('SECRET', 'OTHER'))
+
+
+def test_clean_body_normalizes_batch_bodies():
+    first = batch_body('===============123==', '1b7c8f1e-aaaa', 'SECRET')
+    second = batch_body('===============456==', '9f0e2d3c-bbbb', 'OTHER')
+
+    cleaned = Cassette.clean_body(first)
+
+    assert cleaned == Cassette.clean_body(second)
+    for secret in (b'SECRET', b'123', b'1b7c8f1e'):
+        assert secret not in cleaned
+    assert b'Content-ID: < + 2>' in cleaned
+    assert b'?part=snippet&q=docker&alt=json ' in cleaned
+
+
+def test_clean_body_keeps_other_bodies():
+    body = b'{"messages": [{"role": "user", "content": "--not a boundary"}]}'
+
+    assert Cassette.clean_body(body) == body
+
+
+def test_batch_requests_share_a_cassette_across_runs(tmp_path):
+    cassette = Cassette(str(tmp_path), 'record')
+    url = 'https://www.googleapis.com/batch/youtube/v3?key=SECRET'
+    recorded = batch_body('===============111==', 'u1', 'SECRET')
+    cassette.save('POST', url, recorded, 200, {'Content-Type': 'multipart/mixed'}, b'ok', 0.1)
+
+    replay = Cassette(str(tmp_path), 'replay')
+    later_run = batch_body('===============222==', 'u2', 'OTHER')
+    interaction = replay.load('post', url.replace('SECRET', 'OTHER'), later_run)
+
+    assert interaction['body'] == b'ok'
+    assert interaction['headers'] == {'content-type': 'multipart/mixed'}
+    with pytest.raises(CassetteMissError):
+        replay.load('POST', url, b'different body')
+
+
+def test_httpx_transport_replays_a_recording(tmp_path):
+    upstream = httpx.MockTransport(lambda request: httpx.Response(200, json={'jobs': [1, 2]}))
+    with httpx.Client(transport=CassetteTransport(upstream, Cassette(str(tmp_path), 'record'))) as client:
+        client.get('https://remoteok.com/api?api_key=SECRET')
+
+    offline = httpx.MockTransport(lambda request: pytest.fail('replay must not reach the network'))
+    with httpx.Client(transport=CassetteTransport(offline, Cassette(str(tmp_path), 'replay'))) as client:
+        response = client.get('https://remoteok.com/api')
+        assert response.json() == {'jobs': [1, 2]}
+        with pytest.raises(CassetteMissError):
+            client.get('https://remoteok.com/api?page=2')
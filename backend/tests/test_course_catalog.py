@@ -0,0 +1,95 @@
+"""
+Course Catalog Tests for ResuMatch
+Offline course search over past results and the curated file
+"""
+
+import json
+
+from course_catalog import CourseCatalog
+
+
+def course(video_id, title, channel='Channel', description=''):
+    return {
+        'video_id': video_id, 'title': title, 'url': f'https://www.youtube.com/watch?v={video_id}',
+        'channel': channel, 'description': description
+    }
+
+
+def titles(courses):
+    return [c['title'] for c in courses]
+
+
+def test_search_requires_every_query_term():
+    catalog = CourseCatalog()
+    catalog.add(course('1', 'Machine Learning Basics'))
+    catalog.add(course('2', 'Deep Learning with PyTorch'))
+
+    assert titles(catalog.search('Machine Learning')) == ['Machine Learning Basics']
+    assert catalog.search('Machine Learning Rust') == []
+
+
+def test_stopwords_do_not_narrow_the_search():
+    catalog = CourseCatalog()
+    catalog.add(course('1', 'Docker Crash Course'))
+
+    assert titles(catalog.search('Docker Course for Beginners')) == ['Docker Crash Course']
+    assert catalog.search('Complete Course') == []
+
+
+def test_title_and_skill_matches_outrank_description_mentions():
+    catalog = CourseCatalog()
+    catalog.add(course('1', 'Cooking at Home', description='no kubernetes here, just kubernetes jokes'))
+    catalog.add(course('2', 'Kubernetes Explained'))
+    catalog.add(course('3', 'Cluster Operations'), skills=['Kubernetes'])
+
+    ranked = titles(catalog.search('kubernetes'))
+
+    assert ranked[-1] == 'Cooking at Home'
+    assert set(ranked[:2]) == {'Kubernetes Explained', 'Cluster Operations'}
+    assert len(catalog.search('kubernetes', limit=1)) == 1
+
+
+def test_known_courses_only_gain_skills():
+    catalog = CourseCatalog()
+
+    assert catalog.add_many([course('1', 'Systems Programming'), course('2', 'Intro')], skill='Rust') == 2
+    assert catalog.add_many([course('1', 'Systems Programming')], skill='C++') == 0
+
+    assert len(catalog) == 2
+    assert titles(catalog.search('C++')) == ['Systems Programming']
+    assert set(titles(catalog.search('Rust'))) == {'Systems Programming', 'Intro'}
+
+
+def test_courses_without_title_or_url_are_skipped():
+    catalog = CourseCatalog()
+
+    assert not catalog.add({'video_id': '1', 'title': 'No URL'})
+    assert not catalog.add({'video_id': '2', 'url': 'https://example.com'})
+    assert len(catalog) == 0
+
+
+def test_results_are_copies_with_default_fields():
+    catalog = CourseCatalog()
+    catalog.add({'title': 'SQL Basics', 'url': 'https://example.com/sql'})
+
+    result = catalog.search('sql')[0]
+    result['title'] = 'changed'
+
+    assert result['channel'] == 'Unknown' and result['is_educational']
+    assert titles(catalog.search('sql')) == ['SQL Basics']
+
+
+def test_load_jsonl_skips_bad_lines(tmp_path):
+    path = tmp_path / 'catalog.jsonl'
+    path.write_text('\n'.join([
+        json.dumps({**course('1', 'Terraform Fundamentals'), 'skills': ['Infrastructure as Code']}),
+        '{not json',
+        '',
+        json.dumps(['not', 'a', 'course']),
+        json.dumps(course('2', 'Ansible Basics')),
+    ]), encoding='utf-8')
+    catalog = CourseCatalog()
+
+    assert catalog.load_jsonl(str(path)) == 2
+    assert titles(catalog.search('infrastructure code')) == ['Terraform Fundamentals']
+    assert 'skills' not in catalog.search('terraform')[0]
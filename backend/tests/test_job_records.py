@@ -0,0 +1,17 @@
+"""
+Job Record Tests for ResuMatch
+Skill counting at ingest time
+"""
+
+from job_records import normalize_job
+from skill_extractor import SkillExtractor
+
+
+def test_skill_phrases_do_not_span_fields():
+    extractor = SkillExtractor(['Machine Learning', 'Python'])
+    record = normalize_job(
+        {'id': '1', 'position': 'Engineer Machine', 'description': 'Learning Python', 'tags': ['machine', 'learning']},
+        extractor
+    )
+
+    assert record.skill_counts == {'Python': 1}
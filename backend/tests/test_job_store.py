@@ -0,0 +1,79 @@
+"""
+Job Store Tests for ResuMatch
+Role search ranking over the SQLite/FTS5 job store
+"""
+
+from job_records import normalize_job
+from job_store import JobStore
+
+
+def make_store(tmp_path, jobs):
+    store = JobStore(str(tmp_path / 'market.db'))
+    records = [normalize_job(job) for job in jobs]
+    store.sync({record.id: record for record in records})
+    return store
+
+
+def test_title_hit_outranks_common_skill_in_description(tmp_path):
+    # "python" is in more than half the postings, where FTS5's own IDF bottoms out
+    jobs = [{'id': 'py-dev', 'position': 'Python Developer', 'description': 'Build APIs in Python.'}]
+    jobs += [
+        {'id': f'backend-{i}', 'position': 'Backend Engineer', 'description': 'Services in Python and Go.'}
+        for i in range(3)
+    ]
+    jobs += [
+        {'id': f'other-{i}', 'position': 'Data Analyst', 'description': 'Python, SQL and dashboards.'}
+        for i in range(3)
+    ]
+    jobs += [
+        {'id': f'web-{i}', 'position': 'Frontend Designer', 'description': 'React and CSS.'}
+        for i in range(3)
+    ]
+    store = make_store(tmp_path, jobs)
+
+    ranked = store.search('Python Engineer', max_jobs=3)
+
+    assert ranked[0][1]['title'] == 'Python Developer'
+    assert ranked[0][0] > 5 * ranked[1][0]
+    assert [job['title'] for _, job in ranked[1:]] == ['Backend Engineer', 'Backend Engineer']
+
+
+def test_generic_terms_alone_match_nothing(tmp_path):
+    store = make_store(tmp_path, [{'id': '1', 'position': 'Senior Engineer', 'description': 'Python'}])
+
+    assert store.search('Senior Engineer') == []
+
+
+def test_role_views_are_pruned(tmp_path):
+    store = JobStore(str(tmp_path / 'market.db'), max_role_views=3, keep_role_views=1)
+    store.put_role_views([('popular', 10, 'Popular', 1, {})])
+    for _ in range(5):
+        store.get_role_view('popular', 10)
+    store.put_role_views([(f'old-{i}', 10, f'Old {i}', 1, {}) for i in range(2)])
+
+    store.put_role_views([('fresh', 10, 'Fresh', 2, {})])
+    stored = store.get_role_views([(key, 10) for key in ('popular', 'old-0', 'old-1', 'fresh')], count_hit=False)
+    assert set(stored) == {('popular', 10), ('fresh', 10)}
+
+    for i in range(4):
+        store.put_role_views([(f'new-{i}', 10, f'New {i}', 2, {})])
+    keys = [('popular', 10), ('fresh', 10)] + [(f'new-{i}', 10) for i in range(4)]
+    assert len(store.get_role_views(keys, count_hit=False)) == 3
+    assert store.popular_role_views(1) == [('Popular', 10)]
+
+
+def test_repeated_role_lookups_count_hits(tmp_path, monkeypatch):
+    import fetch_market
+
+    monkeypatch.chdir(tmp_path)  # role matching appends to debug_role.txt
+    store = make_store(tmp_path, [{'id': '1', 'position': 'Python Developer', 'description': 'Python'}])
+    fetch_market._role_view_cache.clear()
+    for _ in range(3):
+        fetch_market.get_role_view(store, 'Python Developer', 5)
+    fetch_market.get_role_view(store, 'Go Developer', 5)
+    fetch_market.get_role_view(store, 'Python Developer', 5, count_hit=False)
+    store.flush_role_view_hits()
+
+    hits = dict(store._connect().execute("SELECT role_key, hits FROM role_views").fetchall())
+    assert hits == {'developer python': 3, 'developer go': 1}
+    assert store.popular_role_views(1) == [('Python Developer', 5)]
@@ -0,0 +1,115 @@
+"""
+JSON Stream Tests for ResuMatch
+Incremental parsing of top-level JSON arrays split across chunks
+"""
+
+import json
+
+import pytest
+
+from json_stream import JsonArrayParser, iter_json_array
+
+
+def parse_in_chunks(payload: bytes, size: int):
+    parser = JsonArrayParser()
+    items = []
+    for i in range(0, len(payload), size):
+        items.extend(parser.feed(payload[i:i + size]))
+    items.extend(parser.close())
+    return items
+
+
+DOC = json.dumps([
+    {"title": "Data \"Scientist\"", "company": "Café ☕", "tags": ["ml", {"level": [1, 2]}]},
+    12345.678e-2,
+    "back\\slash é",
+    [],
+    {},
+    True,
+    None,
+    -0.5,
+], ensure_ascii=False).encode('utf-8')
+
+
+@pytest.mark.parametrize('size', range(1, 12))
+def test_any_chunk_split_matches_json_loads(size):
+    # Small chunks cut strings, escapes, numbers and multibyte characters
+    assert parse_in_chunks(DOC, size) == json.loads(DOC)
+
+
+def test_escaped_unicode_split_across_chunks():
+    parser = JsonArrayParser()
+
+    assert parser.feed(b'["caf\\u00') == []
+    assert parser.feed(b'e9", "a\\') == ['café']
+    assert parser.feed(b'"b"]') == ['a"b']
+    assert parser.done
+
+
+def test_number_is_held_until_a_delimiter_follows():
+    parser = JsonArrayParser()
+
+    assert parser.feed(b'[12') == []
+    assert parser.feed(b'34') == []
+    assert parser.feed(b'5, 6') == [12345]
+    assert parser.feed(b']') == [6]
+
+
+def test_nested_values_are_yielded_whole():
+    parser = JsonArrayParser()
+
+    assert parser.feed(b'[{"a": [1, [2, {"b": ') == []
+    assert parser.feed(b'"]"}]]}, [[]]') == [{"a": [1, [2, {"b": "]"}]]}, [[]]]
+    assert parser.feed(b']') == []
+    assert parser.done
+
+
+def test_empty_array():
+    assert parse_in_chunks(b' [ ] ', 1) == []
+
+
+@pytest.mark.parametrize('payload', [
+    b'[1,,2]',
+    b'[,1]',
+    b'[1,]',
+    b'[1 2]',
+    b'[,]',
+    b'[1, }',
+])
+def test_malformed_input_raises(payload):
+    with pytest.raises(ValueError):
+        json.loads(payload)
+    for size in (1, len(payload)):
+        with pytest.raises(ValueError):
+            parse_in_chunks(payload, size)
+
+
+@pytest.mark.parametrize('payload', [b'{"a": 1}', b'"text"'])
+def test_non_array_raises(payload):
+    with pytest.raises(ValueError):
+        parse_in_chunks(payload, 1)
+
+
+def test_empty_element_is_rejected_across_a_chunk_boundary():
+    parser = JsonArrayParser()
+    assert parser.feed(b'[1,') == [1]
+
+    with pytest.raises(ValueError):
+        parser.feed(b' ]')
+
+
+@pytest.mark.parametrize('payload', [b'', b'[', b'[1, 2', b'[1,', b'[{"a": 1', b'["abc'])
+def test_truncated_input_raises_on_close(payload):
+    with pytest.raises(ValueError):
+        parse_in_chunks(payload, 1)
+
+
+def test_iter_json_array_stops_at_the_closing_bracket():
+    chunks = iter([b'[1, {"a"', b': 2}]', b'this is never read'])
+
+    assert list(iter_json_array(chunks)) == [1, {"a": 2}]
+
+
+def test_iter_json_array_raises_on_truncated_stream():
+    with pytest.raises(ValueError):
+        list(iter_json_array([b'[1, 2']))
@@ -0,0 +1,82 @@
+"""
+Market Prefetch Tests for ResuMatch
+Role guesses from resume text, speculative warm-ups and how they are counted
+"""
+
+import asyncio
+
+import fetch_market
+from job_records import normalize_job
+from job_store import JobStore
+from market_prefetch import HEADLINE_CHARS, guess_roles
+
+
+def make_store(tmp_path, monkeypatch):
+    store = JobStore(str(tmp_path / 'market.db'))
+    record = normalize_job({'id': '1', 'position': 'Data Scientist', 'description': 'Python and SQL'})
+    store.sync({record.id: record})
+
+    async def synced_store():
+        return store
+
+    monkeypatch.chdir(tmp_path)  # role matching appends to debug_role.txt
+    monkeypatch.setattr(fetch_market, 'get_job_store', lambda: store)
+    monkeypatch.setattr(fetch_market, 'aget_synced_job_store', synced_store)
+    fetch_market._role_view_cache.clear()
+    return store
+
+
+def role_hits(store):
+    store.flush_role_view_hits()
+    return dict(store._connect().execute("SELECT role_key, hits FROM role_views").fetchall())
+
+
+def test_warm_up_is_not_a_hit_but_requests_using_it_are(tmp_path, monkeypatch):
+    store = make_store(tmp_path, monkeypatch)
+
+    async def main():
+        warm = asyncio.ensure_future(fetch_market.awarm_role_view('Data Scientist', 5))
+        await asyncio.sleep(0)  # the warm-up leads the flight
+        # Joins the warm-up's flight
+        joined = await fetch_market.afetch_jobs_by_role('Data Scientist', 5)
+        await warm
+        assert role_hits(store) == {'data scientist': 1}
+        # Served from the process cache
+        cached = await fetch_market.afetch_jobs_by_role('Data Scientist', 5)
+        return joined, cached
+
+    joined, cached = asyncio.run(main())
+
+    assert joined['jobs'] and cached['jobs'] == joined['jobs']
+    assert role_hits(store) == {'data scientist': 2}
+
+
+def test_warm_up_alone_records_no_hit(tmp_path, monkeypatch):
+    store = make_store(tmp_path, monkeypatch)
+
+    asyncio.run(fetch_market.awarm_role_view('Data Scientist', 5))
+
+    assert role_hits(store) == {'data scientist': 0}
+
+
+def test_guess_roles_takes_at_most_two_modifiers_and_drops_seniority():
+    text = 'Experienced Senior Backend Python Engineer. Worked as Jr. Data Analyst.'
+
+    assert guess_roles(text, limit=5) == ['Backend Python Engineer', 'Data Analyst']
+
+
+def test_guess_roles_trims_words_outside_job_titles():
+    title_terms = frozenset({'data', 'scientist', 'engineer'})
+
+    assert guess_roles('Jane Smith Data Scientist', title_terms=title_terms) == ['Data Scientist']
+    # Without title terms nothing is trimmed
+    assert guess_roles('Jane Smith Data Scientist') == ['Smith Data Scientist']
+
+
+def test_guess_roles_weights_the_headline_and_merges_variants():
+    filler = 'x ' * HEADLINE_CHARS
+    text = f'Machine Learning Engineer\n{filler}Data Analyst, Data Analyst, Learning Machine Engineer'
+
+    assert guess_roles(text) == ['Machine Learning Engineer', 'Data Analyst']
+    assert guess_roles(text, limit=1) == ['Machine Learning Engineer']
+    assert guess_roles('no titles here, just an engineer') == []
@@ -0,0 +1,145 @@
+"""
+Single-Flight Tests for ResuMatch
+Coalescing of concurrent calls across threads and asyncio tasks
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from single_flight import SingleFlight
+
+
+class TrackedFlight(SingleFlight):
+    """Records every begin() so a test can wait until callers have joined."""
+
+    def __init__(self):
+        super().__init__('test')
+        self.joined = []
+
+    def begin(self, key):
+        future, leader = super().begin(key)
+        self.joined.append(leader)
+        return future, leader
+
+    def wait_for(self, callers):
+        while len(self.joined) < callers:
+            time.sleep(0.001)
+
+
+def test_concurrent_threads_share_one_call():
+    flights = TrackedFlight()
+    release = threading.Event()
+    calls = []
+
+    def slow_lookup(key):
+        calls.append(key)
+        release.wait(5)
+        return key.upper()
+
+    with ThreadPoolExecutor(4) as pool:
+        leader = pool.submit(flights.do, 'k', slow_lookup, 'k')
+        flights.wait_for(1)
+        followers = [pool.submit(flights.do, 'k', slow_lookup, 'k') for _ in range(3)]
+        flights.wait_for(4)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert calls == ['k']
+    assert results == ['K'] * 4
+    assert flights.joined == [True, False, False, False]
+
+
+def test_leader_exception_reaches_every_waiter():
+    flights = TrackedFlight()
+    release = threading.Event()
+
+    def failing_lookup():
+        release.wait(5)
+        raise RuntimeError('upstream down')
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flights.do, 'k', failing_lookup)
+        flights.wait_for(1)
+        follower = pool.submit(flights.do, 'k', failing_lookup)
+        flights.wait_for(2)
+        release.set()
+
+        for future in (leader, follower):
+            with pytest.raises(RuntimeError, match='upstream down'):
+                future.result()
+
+
+def test_results_are_not_cached_after_the_call_finishes():
+    flights = SingleFlight('test')
+    calls = []
+
+    def lookup():
+        calls.append(1)
+        return len(calls)
+
+    assert flights.do('k', lookup) == 1
+    assert flights.do('k', lookup) == 2
+    assert not flights._flights
+
+
+def test_tasks_share_one_async_call():
+    flights = SingleFlight('test')
+    calls = []
+
+    async def lookup(key):
+        calls.append(key)
+        await asyncio.sleep(0.01)
+        return key.upper()
+
+    async def main():
+        return await asyncio.gather(*(flights.ado('k', lookup, 'k') for _ in range(5)))
+
+    assert asyncio.run(main()) == ['K'] * 5
+    assert calls == ['k']
+
+
+def test_cancelled_leader_does_not_abort_the_call_for_others():
+    flights = SingleFlight('test')
+    calls = []
+
+    async def lookup():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'done'
+
+    async def main():
+        leader = asyncio.ensure_future(flights.ado('k', lookup))
+        await asyncio.sleep(0)  # the leader starts the flight
+        follower = asyncio.ensure_future(flights.ado('k', lookup))
+        await asyncio.sleep(0)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await follower
+
+    assert asyncio.run(main()) == 'done'
+    assert calls == [1]
+    assert not flights._flights
+
+
+def test_thread_joins_an_async_flight():
+    flights = SingleFlight('test')
+    calls = []
+
+    async def lookup():
+        calls.append('async')
+        await asyncio.sleep(0.05)
+        return 'shared'
+
+    async def main():
+        task = asyncio.ensure_future(flights.ado('k', lookup))
+        await asyncio.sleep(0)
+        from_thread = await asyncio.to_thread(flights.do, 'k', lambda: calls.append('thread'))
+        return await task, from_thread
+
+    assert asyncio.run(main()) == ('shared', 'shared')
+    assert calls == ['async']
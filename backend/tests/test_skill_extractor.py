@@ -0,0 +1,47 @@
+"""
+Skill Extractor Tests for ResuMatch
+Single-pass multi-skill matching on word boundaries
+"""
+
+from skill_extractor import SkillExtractor
+
+
+def test_matches_only_whole_tokens():
+    extractor = SkillExtractor(['Go', 'Lean', 'C++', 'C#'])
+
+    assert extractor.count('Good clean code in Go, C++ and C#') == {'Go': 1, 'C++': 1, 'C#': 1}
+
+
+def test_overlapping_skills_are_all_counted():
+    extractor = SkillExtractor(['SQL', 'SQL Server', 'Server'])
+
+    assert extractor.count('We run SQL Server and plain SQL') == {'SQL Server': 1, 'SQL': 2, 'Server': 1}
+
+
+def test_failure_links_recover_after_a_partial_match():
+    extractor = SkillExtractor(['Machine Learning', 'Learning Rate', 'Deep Learning'])
+
+    counts = extractor.count('machine deep learning rate machine learning')
+
+    assert counts == {'Deep Learning': 1, 'Learning Rate': 1, 'Machine Learning': 1}
+
+
+def test_html_and_case_are_ignored():
+    extractor = SkillExtractor(['Python', 'Machine Learning'])
+
+    assert extractor.count('<p>PYTHON</p><b>machine</b> <i>learning</i>') == {'Python': 1, 'Machine Learning': 1}
+
+
+def test_skills_without_tokens_are_skipped():
+    extractor = SkillExtractor(['', '!!', 'Rust'])
+
+    assert extractor.count('rust !!') == {'Rust': 1}
+
+
+def test_extract_returns_per_text_and_total_counts():
+    extractor = SkillExtractor(['Python', 'Docker'])
+
+    per_text, total = extractor.extract(['python docker', 'python', 'nothing here'])
+
+    assert per_text == [{'Python': 1, 'Docker': 1}, {'Python': 1}, {}]
+    assert total == {'Python': 2, 'Docker': 1}
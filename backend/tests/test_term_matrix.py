@@ -0,0 +1,91 @@
+"""
+Term Matrix Tests for ResuMatch
+Sparse job x term counts and per-role log-odds skill ranking
+"""
+
+import numpy as np
+
+from term_matrix import TermMatrix
+
+
+class FakeStore:
+    """Serves term_counts() rows the way JobStore does."""
+
+    def __init__(self, skill_rows, keyword_rows, rowids=(1, 2, 3, 4), version=7):
+        self.rows = (version, list(rowids), skill_rows, keyword_rows)
+
+    def term_counts(self):
+        return self.rows
+
+
+def make_matrix():
+    # Jobs 1-2 are data roles, jobs 3-4 are frontend roles; 'team' is everywhere
+    skill_rows = [
+        (1, 'python', 3), (2, 'python', 2), (3, 'python', 1),
+        (1, 'sql', 1), (2, 'sql', 2),
+        (3, 'react', 4), (4, 'react', 3),
+        (99, 'python', 5),  # job no longer in the store
+    ]
+    keyword_rows = [
+        (1, 'pipelines', 2), (2, 'pipelines', 1),
+        (1, 'team', 2), (2, 'team', 2), (3, 'team', 2), (4, 'team', 2),
+        (3, 'the', 9), (4, 'the', 9),
+        (3, 'python', 7),  # keywords that are also skills stay skill columns
+        (4, 'css', 3),
+    ]
+    return TermMatrix.from_store(FakeStore(skill_rows, keyword_rows), stopwords={'the'})
+
+
+def test_from_store_puts_skills_first_and_drops_stopwords():
+    matrix = make_matrix()
+
+    assert matrix.feed_version == 7
+    assert matrix.terms == ['python', 'react', 'sql', 'css', 'pipelines', 'team']
+    assert matrix.skill_terms == 3
+    assert matrix.matrix.shape == (4, 6)
+    # Unknown rowids and skill names repeated as keywords add nothing
+    assert matrix.matrix[:, matrix.terms.index('python')].sum() == 6
+
+
+def test_role_counts_sum_each_group_once():
+    matrix = make_matrix()
+
+    counts = matrix.role_counts([[1, 2, 2], [4, 404]])
+
+    python, react, team = (matrix.terms.index(t) for t in ('python', 'react', 'team'))
+    assert counts.shape == (2, 6)
+    assert counts[0, python] == 5 and counts[0, team] == 4
+    assert counts[1, react] == 3 and counts[1, python] == 0
+
+
+def test_log_odds_favours_distinctive_terms():
+    matrix = make_matrix()
+
+    scores = matrix.log_odds(matrix.role_counts([[1, 2]]))[0]
+
+    assert scores[matrix.terms.index('sql')] > 0
+    assert scores[matrix.terms.index('sql')] > scores[matrix.terms.index('team')]
+    assert scores[matrix.terms.index('react')] < 0
+    assert np.isfinite(scores).all()
+
+
+def test_market_skills_ranks_known_skills_then_keywords():
+    matrix = make_matrix()
+
+    data, frontend = matrix.market_skills([[1, 2], [3, 4]])
+
+    assert [s['skill'] for s in data] == ['Python', 'Sql', 'Pipelines']
+    assert [s['skill'] for s in frontend][:2] == ['React', 'Python']
+    assert 'Css' in [s['skill'] for s in frontend]
+    assert data[0]['count'] == 5 and data[0]['score'] > 0
+    # Keywords must occur at least twice and be over-represented
+    assert 'Team' not in [s['skill'] for s in data + frontend]
+
+
+def test_market_skills_limits_and_empty_inputs():
+    matrix = make_matrix()
+
+    assert matrix.market_skills([]) == []
+    assert matrix.market_skills([[], [1, 2]], limit=1) == [[], [matrix.market_skills([[1, 2]])[0][0]]]
+    empty = TermMatrix.from_store(FakeStore([], [], rowids=()), stopwords=())
+    assert empty.market_skills([[1]]) == [[]]
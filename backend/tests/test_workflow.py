@@ -0,0 +1,25 @@
+"""
+Workflow Tests for ResuMatch
+Fallback roadmaps built from the request's course pool
+"""
+
+import workflow
+
+
+def course(title):
+    return {'title': title, 'url': f'https://www.youtube.com/watch?v={title}', 'thumbnail': '', 'video_id': title}
+
+
+def test_fallback_roadmap_reuses_a_full_course_pool(monkeypatch):
+    def no_search(*args, **kwargs):
+        raise AssertionError("fallback searched YouTube although the pool had every query")
+
+    monkeypatch.setattr(workflow, 'fetch_courses_for_skill_gaps', no_search)
+    for skill_gaps in (['Docker'], ['Docker', 'Kubernetes', 'Terraform'], [f'Skill {i}' for i in range(8)]):
+        queries = workflow.course_search_queries_for_roadmap('DevOps Engineer', skill_gaps)
+        pool = {query: [course(query)] for query in queries}
+
+        roadmap = workflow.generate_fallback_roadmap(skill_gaps, pool, 'DevOps Engineer')
+
+        assert len(roadmap) == 6
+        assert [month['course_title'] for month in roadmap] == [queries[i % len(queries)] for i in range(6)]
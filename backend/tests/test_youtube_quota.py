@@ -0,0 +1,73 @@
+"""
+YouTube Quota Tests for ResuMatch
+Daily unit budget reservations, refunds and exhaustion
+"""
+
+from youtube_quota import QuotaAccountant, is_quota_error
+
+
+def make_accountant(tmp_path, budget=300):
+    return QuotaAccountant(str(tmp_path / 'quota.db'), budget)
+
+
+def test_spends_until_the_budget_is_used(tmp_path):
+    quota = make_accountant(tmp_path)
+
+    assert [quota.try_spend(100) for _ in range(4)] == [True, True, True, False]
+    assert quota.usage()['used'] == 300
+    assert quota.remaining() == 0
+
+
+def test_reserve_leaves_headroom(tmp_path):
+    quota = make_accountant(tmp_path)
+
+    assert quota.try_spend(100, reserve=200)
+    assert not quota.try_spend(100, reserve=200)
+    # A refused background request does not close the day for user-facing ones
+    assert quota.try_spend(100)
+
+
+def test_request_that_does_not_fit_leaves_the_day_open(tmp_path):
+    quota = make_accountant(tmp_path)
+    assert quota.try_spend(250)
+
+    assert not quota.try_spend(100)
+    assert quota.try_spend(50)
+
+
+def test_refund_reopens_a_spent_day(tmp_path):
+    quota = make_accountant(tmp_path)
+    for _ in range(3):
+        quota.try_spend(100)
+    assert not quota.try_spend(100)
+
+    quota.refund(100)
+
+    assert quota.remaining() == 100
+    assert quota.try_spend(100)
+
+
+def test_refund_does_not_reopen_an_exhausted_day(tmp_path):
+    quota = make_accountant(tmp_path)
+    quota.try_spend(100)
+    quota.exhaust()
+
+    quota.refund(100)
+
+    assert not quota.try_spend(100)
+    assert quota.usage()['exhausted']
+    # Shared through SQLite with every other worker
+    assert not make_accountant(tmp_path).try_spend(100)
+
+
+def test_is_quota_error():
+    class Resp:
+        status = 403
+
+    class Error(Exception):
+        resp = Resp()
+        reason = 'quotaExceeded'
+        content = b''
+
+    assert is_quota_error(Error())
+    assert not is_quota_error(ValueError())
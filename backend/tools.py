@@ -7,7 +7,9 @@ This module now focuses on job search from the RAG vector store.
 """
 
 from langchain_core.tools import Tool
-from fetch_market import fetch_jobs_by_role
+from typing import Dict, List
+
+from fetch_market import fetch_jobs_by_role, afetch_jobs_by_role, fetch_jobs_by_roles, afetch_jobs_by_roles
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,6 +29,59 @@ def search_career_resources(query: str) -> str:
     
     # Fetch live jobs
     result = fetch_jobs_by_role(query, max_jobs=5)
+    return format_job_results(query, result)
+
+
+async def asearch_career_resources(query: str) -> str:
+    """
+    Async version of search_career_resources; awaits the job search instead of blocking.
+    
+    Args:
+        query: The search query (skill or role to search for, e.g. "Python Developer")
+    
+    Returns:
+        String containing relevant live jobs
+    """
+    logger.info(f"Tool searching for live jobs with query: {query}")
+    
+    result = await afetch_jobs_by_role(query, max_jobs=5)
+    return format_job_results(query, result)
+
+
+def search_career_resources_many(queries: List[str]) -> Dict[str, str]:
+    """
+    Run search_career_resources for several queries in one batched job search.
+    
+    Args:
+        queries: Search queries, e.g. one "{skill} {role}" per skill gap
+    
+    Returns:
+        Dict mapping each query to its tool output
+    """
+    logger.info(f"Tool searching for live jobs with {len(queries)} queries")
+    
+    results = fetch_jobs_by_roles(queries, max_jobs=5)
+    return {query: format_job_results(query, results[query]) for query in queries}
+
+
+async def asearch_career_resources_many(queries: List[str]) -> Dict[str, str]:
+    """
+    Async version of search_career_resources_many.
+    
+    Args:
+        queries: Search queries, e.g. one "{skill} {role}" per skill gap
+    
+    Returns:
+        Dict mapping each query to its tool output
+    """
+    logger.info(f"Tool searching for live jobs with {len(queries)} queries")
+    
+    results = await afetch_jobs_by_roles(queries, max_jobs=5)
+    return {query: format_job_results(query, results[query]) for query in queries}
+
+
+def format_job_results(query: str, result: dict) -> str:
+    """Render a fetch_jobs_by_role result as the text the tool returns."""
     jobs = result.get('jobs', [])
     
     if not jobs:
@@ -51,7 +106,8 @@ def search_career_resources(query: str) -> str:
 career_resources_tool = Tool(
     name="search_career_resources",
     description="Search for relevant Live Jobs matching specific skills or roles.",
-    func=search_career_resources
+    func=search_career_resources,
+    coroutine=asearch_career_resources
 )
 
 # Export tools list
@@ -3,21 +3,31 @@ LangGraph Workflow for ResuMatch
 Core logic for resume analysis using a multi-agent system
 """
 
-from typing import TypedDict, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, TypedDict, Dict, List, Optional
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.runnables import RunnableLambda
 from dotenv import load_dotenv
+import asyncio
+import contextvars
+import functools
 import json
+import operator
 import os
+import threading
+import time
 import logging
 
 from datetime import datetime
-from tools import tools
-from logger import log_message_sync, send_node_status_sync, send_result_sync
-from fetch_market import fetch_jobs_by_role
-from youtube_courses import fetch_courses_for_skill_gaps, format_courses_for_llm, generate_search_url_fallback
+from config import Config
+from tools import search_career_resources_many, asearch_career_resources_many
+from logger import log_message_sync, send_node_status_sync
+from fetch_market import fetch_jobs_by_role, afetch_jobs_by_role
+from youtube_courses import fetch_courses_for_skill_gaps, format_courses_for_llm, generate_search_url_fallback, is_search_fallback
+from course_cache import skill_key
 
 # Load environment variables
 load_dotenv()
@@ -42,6 +52,10 @@ class GraphState(TypedDict):
     role: str
     skill_gaps: List[str]
     retrieved_docs: str  # Context from Vector DB
+    market_data: dict  # Live market view for the role (fetch_jobs_by_role)
+    course_pool: Dict[str, List[dict]]  # Courses fetched for this request, by search query
+    # Seconds spent in each parallel fetch branch; merged across branches
+    branch_timings: Annotated[Dict[str, float], operator.or_]
     final_result: dict
 
 
@@ -50,12 +64,15 @@ class GraphState(TypedDict):
 # =============================================================================
 
 from langchain_groq import ChatGroq
+from http_client import get_http_client, get_async_http_client
 
 # Use Groq API (FREE tier available)
 llm = ChatGroq(
     model="llama-3.3-70b-versatile",
     api_key=os.getenv("GROQ_API_KEY"),
-    temperature=0.3
+    temperature=0.3,
+    http_client=get_http_client(),
+    http_async_client=get_async_http_client()
 )
 
 # Debug: Print loaded API keys (masked) to console
@@ -130,28 +147,64 @@ def retrieve_nodes(state: GraphState) -> GraphState:
     except:
         pass
 
+    started = time.perf_counter()
     log_message_sync("[INFO] Retrieving relevant courses...", step="retrieve")
     send_node_status_sync("retrieve", "running", "Searching course database...")
     
     role = state.get("role", "")
     skill_gaps = state.get("skill_gaps", [])
+    queries = _retrieval_queries(role, skill_gaps)
     
-    # Get the retriever tool
-    retriever_tool = tools[0]
+    # One batched job search covers every skill gap
+    try:
+        results = search_career_resources_many(queries)
+    except Exception as e:
+        log_message_sync(f"[ERROR] Failed to fetch resources: {str(e)}", step="fetch")
+        logger.error(f"Error fetching resources for {skill_gaps}: {e}")
+        results = {}
+    
+    return _retrieved_state(skill_gaps, queries, results, started)
+
+
+async def aretrieve_nodes(state: GraphState) -> GraphState:
+    """
+    Node 2 (async): same as retrieve_nodes, but awaits the job search so the
+    event loop stays free while RemoteOK is queried.
+    """
+    started = time.perf_counter()
+    log_message_sync("[INFO] Retrieving relevant courses...", step="retrieve")
+    send_node_status_sync("retrieve", "running", "Searching course database...")
+    
+    role = state.get("role", "")
+    skill_gaps = state.get("skill_gaps", [])
+    queries = _retrieval_queries(role, skill_gaps)
+    
+    try:
+        results = await asearch_career_resources_many(queries)
+    except Exception as e:
+        log_message_sync(f"[ERROR] Failed to fetch resources: {str(e)}", step="fetch")
+        logger.error(f"Error fetching resources for {skill_gaps}: {e}")
+        results = {}
     
+    return _retrieved_state(skill_gaps, queries, results, started)
+
+
+def _retrieval_queries(role: str, skill_gaps: List[str]) -> List[str]:
+    queries = []
+    for skill in skill_gaps:
+        log_message_sync(f"[GET] ChromaDB: Searching for '{skill}'...", step="fetch")
+        queries.append(f"{skill} {role}")
+    return queries
+
+
+def _retrieved_state(skill_gaps: List[str], queries: List[str], results: dict, started: float) -> dict:
     all_docs = []
     
-    # Search for each skill gap
-    for i, skill in enumerate(skill_gaps):
-        try:
-            log_message_sync(f"[GET] ChromaDB: Searching for '{skill}'...", step="fetch")
-            query = f"{skill} {role}"
-            results = retriever_tool.invoke(query)
-            all_docs.append(f"### Resources for {skill}:\n{results}")
+    for i, (skill, query) in enumerate(zip(skill_gaps, queries)):
+        if query in results:
+            all_docs.append(f"### Resources for {skill}:\n{results[query]}")
             log_message_sync(f"[INFO] Found resources for {skill} ({i+1}/{len(skill_gaps)})", step="fetch")
-        except Exception as e:
-            log_message_sync(f"[ERROR] Failed to fetch {skill}: {str(e)}", step="fetch")
-            print(f"Error fetching resources for {skill}: {e}")
+        else:
             all_docs.append(f"### Resources for {skill}:\nNo results found.")
     
     # Concatenate all results
@@ -160,10 +213,72 @@ def retrieve_nodes(state: GraphState) -> GraphState:
     log_message_sync(f"[INFO] Retrieved {len(all_docs)} resource sections", step="fetch")
     send_node_status_sync("fetch", "complete", f"Found resources for {len(skill_gaps)} skills")
     
-    return {
-        **state,
-        "retrieved_docs": retrieved_docs
-    }
+    return _branch_update("retrieve", started, retrieved_docs=retrieved_docs)
+
+
+def _branch_update(branch: str, started: float, **values) -> dict:
+    """State update of one parallel fetch branch, with its wall time."""
+    elapsed = time.perf_counter() - started
+    logger.info(f"Branch '{branch}' finished in {elapsed:.2f}s")
+    return {**values, "branch_timings": {branch: round(elapsed, 3)}}
+
+
+# Live jobs fetched per analysis for the market branch (and its speculative prefetch)
+MARKET_JOBS = 15
+
+
+def market_node(state: GraphState) -> dict:
+    """
+    Branch node: live job market data for the detected role
+    """
+    started = time.perf_counter()
+    role = state.get("role", "")
+    log_message_sync(f"[INFO] Fetching live job market data for: {role}", step="fetch")
+    market_data = fetch_jobs_by_role(role, max_jobs=MARKET_JOBS)
+    log_message_sync(f"[INFO] Found {len(market_data.get('jobs', []))} live jobs for {role}", step="fetch")
+    return _branch_update("market", started, market_data=market_data)
+
+
+async def amarket_node(state: GraphState) -> dict:
+    """Branch node (async): market_node on the non-blocking market fetch."""
+    started = time.perf_counter()
+    role = state.get("role", "")
+    log_message_sync(f"[INFO] Fetching live job market data for: {role}", step="fetch")
+    market_data = await afetch_jobs_by_role(role, max_jobs=MARKET_JOBS)
+    log_message_sync(f"[INFO] Found {len(market_data.get('jobs', []))} live jobs for {role}", step="fetch")
+    return _branch_update("market", started, market_data=market_data)
+
+
+def course_search_queries_for_roadmap(role: str, skill_gaps: List[str]) -> List[str]:
+    """The (up to 6) course searches that fill a 6-month roadmap."""
+    # Create expanded search queries to ensure we have enough content for 6 months
+    search_queries = list(skill_gaps)
+    
+    # If fewer than 6, add "Advanced" and "Project" variations to fill the roadmap
+    needed = 6 - len(search_queries)
+    if needed > 0:
+        for gap in skill_gaps[:needed]:
+            search_queries.append(f"Advanced {gap} Course")
+            
+    # If still short (e.g. only 1 gap), add role-based topics
+    if len(search_queries) < 6:
+        search_queries.append(f"{role} Full Course")
+        search_queries.append(f"{role} Capstone Project")
+        search_queries.append(f"{role} Interview Preparation")
+        
+    return search_queries[:6]  # Cap at 6 distinct topics
+
+
+def courses_node(state: GraphState) -> dict:
+    """
+    Branch node: YouTube courses for the skill gaps
+    """
+    started = time.perf_counter()
+    search_queries = course_search_queries_for_roadmap(state.get("role", ""), state.get("skill_gaps", []))
+    log_message_sync(f"[INFO] Fetching YouTube courses for: {search_queries}", step="fetch")
+    youtube_courses = fetch_courses_for_skill_gaps(search_queries, max_per_skill=2)
+    log_message_sync(f"[INFO] Found YouTube courses for {len(youtube_courses)} skills", step="fetch")
+    return _branch_update("courses", started, course_pool=youtube_courses)
 
 
 def synthesize_roadmap(state: GraphState) -> GraphState:
@@ -188,9 +303,16 @@ def synthesize_roadmap(state: GraphState) -> GraphState:
     log_message_sync(f"[INFO] Context length: {len(retrieved_docs)} characters", step="synthesize")
     log_message_sync(f"[INFO] Target role: {role}", step="synthesize")
     
-    # Fetch LIVE market data for the detected role
-    log_message_sync(f"[INFO] Fetching live job market data for: {role}", step="synthesize")
-    market_data = fetch_jobs_by_role(role, max_jobs=15)
+    # Branch timings from the parallel fetch stage
+    timings = state.get("branch_timings") or {}
+    if timings:
+        log_message_sync(
+            "[INFO] Parallel fetch: " + ", ".join(f"{branch} {seconds:.2f}s" for branch, seconds in sorted(timings.items())),
+            step="synthesize"
+        )
+    
+    # LIVE market data for the detected role, fetched by the market branch
+    market_data = state.get("market_data") or market_node(state)["market_data"]
     market_skills = market_data.get('market_skills', [])
     market_jobs = market_data.get('jobs', [])
     
@@ -202,32 +324,10 @@ def synthesize_roadmap(state: GraphState) -> GraphState:
         # Basic fallback to ensure radar chart works. The LLM will refine this.
         market_skills = ["Technical Knowledge", "Problem Solving", "Project Management", "Communication", "Data Analysis", "Industry Tools"]
         
-    # Fetch LIVE YouTube courses for skill gaps - Ensure 6 months of content
-    log_message_sync(f"[INFO] Generatng search queries for 6-month roadmap...", step="synthesize")
-    
-    # Create expanded search queries to ensure we have enough content for 6 months
-    search_queries = list(skill_gaps)
-    
-    # If fewer than 6, add "Advanced" and "Project" variations to fill the roadmap
-    needed = 6 - len(search_queries)
-    if needed > 0:
-        for gap in skill_gaps[:needed]:
-            search_queries.append(f"Advanced {gap} Course")
-            
-    # If still short (e.g. only 1 gap), add role-based topics
-    if len(search_queries) < 6:
-        search_queries.append(f"{role} Full Course")
-        search_queries.append(f"{role} Capstone Project")
-        search_queries.append(f"{role} Interview Preparation")
-        
-    search_queries = search_queries[:6]  # Cap at 6 distinct topics
-    
-    log_message_sync(f"[INFO] Fetching YouTube courses for: {search_queries}", step="synthesize")
-    youtube_courses = fetch_courses_for_skill_gaps(search_queries, max_per_skill=2)
+    # LIVE YouTube courses for skill gaps (6 months of content), fetched by the courses branch
+    youtube_courses = state.get("course_pool") or courses_node(state)["course_pool"]
     youtube_courses_context = format_courses_for_llm(youtube_courses)
     
-    log_message_sync(f"[INFO] Found YouTube courses for {len(youtube_courses)} skills", step="synthesize")
-    
     # Format live job data for the prompt
     live_jobs_context = ""
     for job in market_jobs[:5]:
@@ -352,7 +452,6 @@ Return ONLY valid JSON in this exact schema:
         
         logger.info(f"Synthesizing roadmap for role: {role} with {len(skill_gaps)} gaps and {len(market_skills)} market skills")
         
-        import time
         max_retries = 3
         result = None
         
@@ -403,7 +502,7 @@ Return ONLY valid JSON in this exact schema:
         if not result.get("roadmap") or len(result.get("roadmap", [])) == 0:
             logger.warning("LLM returned empty roadmap, adding fallback courses")
             log_message_sync("[INFO] Generating fallback course recommendations...", step="synthesize")
-            result["roadmap"] = generate_fallback_roadmap(skill_gaps)
+            result["roadmap"] = generate_fallback_roadmap(skill_gaps, youtube_courses, role)
         
         # robust check for valid jobs
         jobs = result.get("recommended_jobs", [])
@@ -422,6 +521,7 @@ Return ONLY valid JSON in this exact schema:
         
         return {
             **state,
+            "course_pool": youtube_courses,
             "final_result": result
         }
     except Exception as e:
@@ -436,11 +536,12 @@ Return ONLY valid JSON in this exact schema:
         logger.error(f"Error in synthesize_roadmap: {type(e).__name__}: {e}")
         
         # Generate fallback result on error
-        fallback_roadmap = generate_fallback_roadmap(skill_gaps)
+        fallback_roadmap = generate_fallback_roadmap(skill_gaps, youtube_courses, role)
         fallback_jobs = generate_fallback_jobs(role, skill_gaps)
         
         return {
             **state,
+            "course_pool": youtube_courses,
             "final_result": {
                 "match_score": 50,
                 "heatmap": [{"skill": gap, "status": "gap", "score": 30} for gap in skill_gaps],
@@ -451,39 +552,43 @@ Return ONLY valid JSON in this exact schema:
         }
 
 
-def generate_fallback_roadmap(skill_gaps: List[str]) -> List[dict]:
+def generate_fallback_roadmap(skill_gaps: List[str], course_pool: Optional[Dict[str, List[dict]]] = None,
+                              role: str = "") -> List[dict]:
     """Generate fallback course recommendations using YouTube API or search URLs.
     
     This function is called when the LLM fails to generate a roadmap.
-    It fetches real YouTube courses or provides search URLs as fallback.
+    The months follow the same searches as the courses branch
+    (course_search_queries_for_roadmap), so courses already fetched for this
+    request (course_pool, the graph's per-request pool keyed by search
+    query) are reused; only the queries missing from it are looked up, all
+    in one fetch_courses_for_skill_gaps call, and added to the pool for
+    later callers.
     """
-    from youtube_courses import search_youtube_courses, generate_search_url_fallback
-    
     roadmap = []
     month = 1
     
-    # Fetch real YouTube courses for each skill gap
-    # Fetch real YouTube courses for each skill gap - Ensure 6 months
-    # We loop 6 times, cycling through gaps if needed but adding variety
-    
-    extended_gaps = skill_gaps[:]
-    while len(extended_gaps) < 6:
-        extended_gaps.extend([f"Advanced {g}" for g in skill_gaps])
-        extended_gaps.append("Capstone Project")
-    
-    for i in range(6):  # Exactly 6 months
-        query = extended_gaps[i] if i < len(extended_gaps) else skill_gaps[0]
+    # Exactly 6 months, repeating topics if the roadmap searches are fewer
+    queries = course_search_queries_for_roadmap(role, skill_gaps)
+    queries = [queries[i % len(queries)] for i in range(6)]
+    
+    course_pool = {} if course_pool is None else course_pool
+    pooled = {skill_key(query): courses for query, courses in course_pool.items() if courses}
+    missing = [query for query in dict.fromkeys(queries) if skill_key(query) not in pooled]
+    if missing:
+        logger.info(f"Fallback: Fetching YouTube courses for: {missing}")
+        fetched = fetch_courses_for_skill_gaps(missing, max_per_skill=1)
+        course_pool.update(fetched)
+        pooled.update((skill_key(query), courses) for query, courses in fetched.items() if courses)
+    logger.info(f"Fallback: Reused {len(set(queries)) - len(missing)} course searches from this request")
+    
+    for i, query in enumerate(queries):
+        courses = pooled.get(skill_key(query))
         
-        logger.info(f"Fallback: Fetching YouTube course for: {query}")
-        
-        # Try to get real YouTube courses
-        courses = search_youtube_courses(query, max_results=1)
-        
-        if courses and len(courses) > 0:
+        if courses and not is_search_fallback(courses[0]):
             course = courses[0]
             roadmap.append({
                 "month": month,
-                "skill": query.replace("Advanced ", "").replace("Capstone Project", "Project"),
+                "skill": query.replace("Advanced ", "").replace(" Course", "").replace("Capstone Project", "Project"),
                 "priority": "foundation" if i < 2 else "intermediate" if i < 4 else "advanced",
                 "course_title": course["title"],
                 "course_url": course["url"],
@@ -538,6 +643,53 @@ def generate_fallback_jobs(role: str, skill_gaps: List[str]) -> List[dict]:
 
 
 
+# =============================================================================
+# Async Execution
+# =============================================================================
+
+_node_executor = None
+_node_executor_lock = threading.Lock()
+
+
+def _get_node_executor() -> ThreadPoolExecutor:
+    global _node_executor
+    if _node_executor is None:
+        with _node_executor_lock:
+            if _node_executor is None:
+                _node_executor = ThreadPoolExecutor(
+                    max_workers=Config.WORKFLOW_NODE_WORKERS, thread_name_prefix="workflow-node"
+                )
+    return _node_executor
+
+
+async def run_blocking(func, *args):
+    """
+    Run a blocking node (LLM calls, HTTP, retry sleeps) on the bounded node
+    executor so the event loop keeps serving other streams and requests.
+
+    The caller's context is copied to the worker thread, so the node's
+    log_message_sync/send_node_status_sync calls still reach this
+    request's SSE queue (delivered thread-safely, see logger._deliver).
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_node_executor(), functools.partial(contextvars.copy_context().run, func, *args))
+
+
+async def aanalyze_profile(state: GraphState) -> GraphState:
+    """Node 1 (async): analyze_profile on the node executor."""
+    return await run_blocking(analyze_profile, state)
+
+
+async def acourses_node(state: GraphState) -> dict:
+    """Branch node (async): courses_node on the node executor."""
+    return await run_blocking(courses_node, state)
+
+
+async def asynthesize_roadmap(state: GraphState) -> GraphState:
+    """Node 3 (async): synthesize_roadmap on the node executor."""
+    return await run_blocking(synthesize_roadmap, state)
+
+
 # =============================================================================
 # Build Graph
 # =============================================================================
@@ -546,17 +698,22 @@ def generate_fallback_jobs(role: str, skill_gaps: List[str]) -> List[dict]:
 workflow = StateGraph(GraphState)
 
 # Add nodes
-# Add nodes
-workflow.add_node("analyze", analyze_profile)
-workflow.add_node("retrieve", retrieve_nodes)
-workflow.add_node("synthesize", synthesize_roadmap)
+# app.invoke() runs the sync nodes; app.ainvoke() awaits the async variants
+workflow.add_node("analyze", RunnableLambda(analyze_profile, afunc=aanalyze_profile, name="analyze"))
+workflow.add_node("retrieve", RunnableLambda(retrieve_nodes, afunc=aretrieve_nodes, name="retrieve"))
+workflow.add_node("market", RunnableLambda(market_node, afunc=amarket_node, name="market"))
+workflow.add_node("courses", RunnableLambda(courses_node, afunc=acourses_node, name="courses"))
+workflow.add_node("synthesize", RunnableLambda(synthesize_roadmap, afunc=asynthesize_roadmap, name="synthesize"))
 
 # Set entry point
 workflow.set_entry_point("analyze")
 
-# Define edges: analyze -> retrieve -> synthesize -> END
-workflow.add_edge("analyze", "retrieve")
-workflow.add_edge("retrieve", "synthesize")
+# Define edges: analyze fans out to the independent fetch branches, which
+# run in parallel and all join before synthesize
+FETCH_BRANCHES = ["retrieve", "market", "courses"]
+for branch in FETCH_BRANCHES:
+    workflow.add_edge("analyze", branch)
+workflow.add_edge(FETCH_BRANCHES, "synthesize")
 workflow.add_edge("synthesize", END)
 
 # Compile the graph
@@ -582,6 +739,9 @@ def run_analysis(resume_text: str) -> dict:
         "role": "",
         "skill_gaps": [],
         "retrieved_docs": "",
+        "market_data": {},
+        "course_pool": {},
+        "branch_timings": {},
         "final_result": {}
     }
     
@@ -602,7 +762,6 @@ async def run_analysis_streaming(resume_text: str):
     Yields:
         SSE formatted strings with node status updates and logs
     """
-    import asyncio
     from logger import set_log_queue, event_generator
     
     # Create a queue for this analysis session
@@ -616,26 +775,31 @@ async def run_analysis_streaming(resume_text: str):
         "role": "",
         "skill_gaps": [],
         "retrieved_docs": "",
+        "market_data": {},
+        "course_pool": {},
+        "branch_timings": {},
         "final_result": {}
     }
     
     async def run_workflow():
         """Run the workflow in a way that allows yielding logs."""
         try:
-            # Run each node sequentially, allowing logs to be sent
+            # Run each node sequentially; blocking nodes run on the node executor
+            # and their logs reach the queue while they are still working
             current_state = initial_state.copy()
             
             # Run analyze_profile
-            current_state = analyze_profile(current_state)
-            await asyncio.sleep(0.1)  # Allow queue to flush
+            current_state = await aanalyze_profile(current_state)
             
-            # Run retrieve_nodes
-            current_state = retrieve_nodes(current_state)
-            await asyncio.sleep(0.1)  # Allow queue to flush
+            # Run the fetch branches concurrently (same fan-out as the graph)
+            updates = await asyncio.gather(aretrieve_nodes(current_state), amarket_node(current_state), acourses_node(current_state))
+            current_state = {**current_state, "branch_timings": {}}
+            for update in updates:
+                timings = {**current_state["branch_timings"], **update.get("branch_timings", {})}
+                current_state = {**current_state, **update, "branch_timings": timings}
             
             # Run synthesize_roadmap
-            current_state = synthesize_roadmap(current_state)
-            await asyncio.sleep(0.1)  # Allow queue to flush
+            current_state = await asynthesize_roadmap(current_state)
             
             # --- Result Processing & Fallback Logic (Matching main.py) ---
             final_result = current_state.get("final_result", {})
@@ -662,7 +826,10 @@ async def run_analysis_streaming(resume_text: str):
             
             if not llm_roadmap:
                 log_message_sync("[WARN] LLM returned no roadmap, generating fallback...", step="synthesize")
-                llm_roadmap = generate_fallback_roadmap(skill_gaps if skill_gaps else ["Python", "Cloud Computing"])
+                llm_roadmap = await run_blocking(
+                    generate_fallback_roadmap, skill_gaps if skill_gaps else ["Python", "Cloud Computing"],
+                    current_state.get("course_pool"), role
+                )
                 
             if not llm_jobs:
                 log_message_sync("[WARN] LLM returned no jobs, generating fallback...", step="synthesize")
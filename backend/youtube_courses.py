@@ -4,10 +4,20 @@ Fetches educational courses from YouTube Data API v3 based on skill gaps
 """
 
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from typing import List, Dict, Optional
 from dotenv import load_dotenv
 import logging
 
+from config import Config
+from course_cache import CourseCache, skill_key
+from course_catalog import CourseCatalog
+from http_client import get_httplib2_http
+from single_flight import SingleFlight
+from youtube_quota import QuotaAccountant, is_quota_error
+
 # Load environment variables
 load_dotenv()
 
@@ -15,33 +25,328 @@ logger = logging.getLogger(__name__)
 
 # YouTube API configuration
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")
+# Requests per batch HTTP call
+YOUTUBE_BATCH_LIMIT = 50
+YOUTUBE_SEARCH_URL = "https://www.youtube.com/results?search_query="
+
+
+_youtube_service = None
+_youtube_error = None
+_youtube_lock = threading.Lock()
 
 
 def get_youtube_service():
-    """Initialize YouTube API service."""
-    try:
-        from googleapiclient.discovery import build
+    """
+    Process-wide YouTube API client, built on first use.
+
+    The discovery document bundled with google-api-python-client is used,
+    so building needs no network. The resulting service object is only read
+    after build; requests made from it are executed with the calling
+    thread's own HTTP connection (see execute_youtube_request), which makes
+    one client safe to share across worker threads.
+    """
+    global _youtube_service, _youtube_error
+    if _youtube_service is not None:
+        return _youtube_service
+    
+    with _youtube_lock:
+        if _youtube_service is not None:
+            return _youtube_service
         
         if not YOUTUBE_API_KEY:
+            _youtube_error = "YOUTUBE_API_KEY not set"
             logger.warning("YOUTUBE_API_KEY not found in environment variables")
             return None
+        
+        try:
+            from googleapiclient.discovery import build
             
-        return build('youtube', 'v3', developerKey=YOUTUBE_API_KEY)
-    except ImportError:
-        logger.error("google-api-python-client not installed. Run: pip install google-api-python-client")
+            _youtube_service = build(
+                'youtube', 'v3', developerKey=YOUTUBE_API_KEY, static_discovery=True, cache_discovery=False
+            )
+            _youtube_error = None
+            logger.info("YouTube API client initialized")
+        except ImportError:
+            _youtube_error = "google-api-python-client not installed"
+            logger.error("google-api-python-client not installed. Run: pip install google-api-python-client")
+        except Exception as e:
+            _youtube_error = f"Failed to initialize YouTube service: {e}"
+            logger.error(_youtube_error)
+    return _youtube_service
+
+
+def execute_youtube_request(request) -> dict:
+    """Execute an API request on this thread's keep-alive HTTP connection."""
+    return request.execute(http=get_httplib2_http())
+
+
+def youtube_status() -> dict:
+    """Health summary of the YouTube integration for /health."""
+    if not YOUTUBE_API_KEY:
+        return {"status": "unavailable", "api_key_configured": False, "detail": "YOUTUBE_API_KEY not set; using search URL fallbacks"}
+    service = get_youtube_service()
+    if service is None:
+        return {"status": "unavailable", "api_key_configured": True, "detail": _youtube_error}
+    quota = get_quota_accountant().usage()
+    if quota['exhausted']:
+        return {"status": "quota_exhausted", "api_key_configured": True, "detail": "Serving cached courses and search URL fallbacks until the quota resets", "quota": quota}
+    return {"status": "ok", "api_key_configured": True, "detail": None, "quota": quota}
+
+
+# =============================================================================
+# Quota Budget
+# =============================================================================
+
+_quota_accountant = None
+
+
+def get_quota_accountant() -> QuotaAccountant:
+    """The daily YouTube unit budget, opened once per process."""
+    global _quota_accountant
+    if _quota_accountant is None:
+        with _youtube_lock:
+            if _quota_accountant is None:
+                _quota_accountant = QuotaAccountant(Config.YOUTUBE_QUOTA_PATH, Config.YOUTUBE_DAILY_BUDGET)
+    return _quota_accountant
+
+
+def admit_search(reserve: int = 0) -> bool:
+    """Reserve the cost of one search().list call; False means answer from the cache or fallback instead."""
+    return get_quota_accountant().try_spend(Config.YOUTUBE_SEARCH_COST, reserve)
+
+
+def note_api_error(error: Exception) -> None:
+    """Stop spending for the day if the API says the quota is gone."""
+    if is_quota_error(error):
+        get_quota_accountant().exhaust()
+
+
+# =============================================================================
+# Course Search Cache
+# =============================================================================
+
+_course_cache = None
+_course_cache_lock = threading.Lock()
+_refreshing = set()  # (skill_key, max_results) being refreshed in the background
+# In-flight API searches, keyed by (skill_key, max_results)
+course_flights = SingleFlight("course-search")
+
+
+def get_course_cache() -> CourseCache:
+    """Open the persistent course search cache once per process."""
+    global _course_cache
+    if _course_cache is None:
+        with _course_cache_lock:
+            if _course_cache is None:
+                _course_cache = CourseCache(
+                    Config.COURSE_CACHE_PATH, Config.COURSE_CACHE_TTL, Config.COURSE_CACHE_MAX_ENTRIES
+                )
+    return _course_cache
+
+
+_course_catalog = None
+
+
+def get_course_catalog() -> CourseCatalog:
+    """
+    The local course catalog, built once per process from the curated
+    COURSE_CATALOG_PATH file (if any) and every cached API search.
+    """
+    global _course_catalog
+    if _course_catalog is None:
+        cache = get_course_cache()
+        with _course_cache_lock:
+            if _course_catalog is None:
+                catalog = CourseCatalog()
+                if Config.COURSE_CATALOG_PATH:
+                    try:
+                        catalog.load_jsonl(Config.COURSE_CATALOG_PATH)
+                    except OSError as e:
+                        logger.warning(f"Could not read course catalog {Config.COURSE_CATALOG_PATH}: {e}")
+                for skill, courses in cache.searches():
+                    catalog.add_many(courses, skill)
+                logger.info(f"Course catalog ready with {len(catalog)} courses")
+                _course_catalog = catalog
+    return _course_catalog
+
+
+def local_courses(skill: str, max_results: int) -> Optional[List[dict]]:
+    """
+    Courses for a skill without any external call: the fresh cached search
+    for that skill, else the catalog's matches if it has at least max_results.
+    """
+    courses = cached_courses(skill, max_results)
+    if courses is not None:
+        return courses
+    courses = get_course_catalog().search(skill, max_results)
+    if len(courses) >= max_results:
+        return courses
+    return None
+
+
+def search_youtube_courses(skill: str, max_results: int = 5) -> List[dict]:
+    """
+    Search YouTube for educational courses on a specific skill, through the course cache.
+
+    Fresh cached results are returned without touching the API (or quota).
+    Entries close to expiry are re-fetched in the background, and if the API
+    fails, an expired entry is still better than no courses.
+    
+    Args:
+        skill: The skill to search for (e.g., "Python programming", "Machine Learning")
+        max_results: Maximum number of results to return (default: 5)
+    
+    Returns:
+        List of course dictionaries (see search_youtube_api)
+    """
+    courses = cached_courses(skill, max_results)
+    if courses is not None:
+        return courses
+    # Concurrent searches for the same skill share one API call
+    return course_flights.do(
+        (skill_key(skill), max_results),
+        lambda: _store_search_results({skill: search_youtube_api(skill, max_results)}, max_results)[skill]
+    )
+
+
+def search_youtube_courses_batch(skills: List[str], max_results: int = 5) -> Dict[str, List[dict]]:
+    """
+    search_youtube_courses for several skills, with every cache miss sent in one batched API call.
+
+    Skills another caller is already searching are not sent again; their
+    results are taken from that in-flight search.
+    
+    Args:
+        skills: Skills to search for
+        max_results: Maximum number of results per skill
+    
+    Returns:
+        Dictionary mapping each skill to its course list (empty if nothing was found)
+    """
+    results = {}
+    missing = []
+    for skill in dict.fromkeys(skills):
+        courses = cached_courses(skill, max_results)
+        if courses is not None:
+            results[skill] = courses
+        else:
+            missing.append(skill)
+    
+    joined = []
+    led = []
+    for skill in missing:
+        future, leader = course_flights.begin((skill_key(skill), max_results))
+        (led if leader else joined).append((skill, future))
+    
+    if led:
+        skills = [skill for skill, _ in led]
+        try:
+            found = _store_search_results(search_youtube_api_batch(skills, max_results), max_results)
+        except BaseException as e:
+            for skill in skills:
+                course_flights.finish((skill_key(skill), max_results), error=e)
+            raise
+        for skill in skills:
+            course_flights.finish((skill_key(skill), max_results), result=found[skill])
+        results.update(found)
+    for skill, future in joined:
+        results[skill] = future.result()
+    return results
+
+
+def cached_courses(skill: str, max_results: int) -> Optional[List[dict]]:
+    """Courses cached within the TTL, or None; entries close to expiry are refreshed in the background."""
+    cache = get_course_cache()
+    entry = cache.lookup(skill, max_results)
+    if entry is None:
         return None
-    except Exception as e:
-        logger.error(f"Failed to initialize YouTube service: {e}")
+    age = time.time() - entry[0]
+    if age > cache.ttl:
         return None
+    if age > cache.ttl - Config.COURSE_CACHE_REFRESH_AHEAD:
+        refresh_course_search_in_background(skill, max_results)
+    return entry[1]
 
 
-def search_youtube_courses(skill: str, max_results: int = 5) -> List[dict]:
+def _store_search_results(results: Dict[str, List[dict]], max_results: int) -> Dict[str, List[dict]]:
+    """Cache fresh API results; skills the API returned nothing for fall back to an expired entry if any."""
+    cache = get_course_cache()
+    for skill, courses in results.items():
+        if courses:
+            cache.put(skill, max_results, courses)
+            get_course_catalog().add_many(courses, skill)
+        else:
+            stale = cache.get_stale(skill, max_results)
+            if stale:
+                logger.info(f"Serving expired cached courses for '{skill}'")
+                results[skill] = stale
+    return results
+
+
+def refresh_course_search(skill: str, max_results: int) -> bool:
+    """
+    Re-fetch one cached skill from the API; returns True if the cache was updated.
+
+    Refreshes only spend quota while more than YOUTUBE_REFRESH_RESERVE units
+    are left, so user-facing searches keep priority.
+    """
+    courses = search_youtube_api(skill, max_results, reserve=Config.YOUTUBE_REFRESH_RESERVE)
+    if courses:
+        get_course_cache().put(skill, max_results, courses)
+        get_course_catalog().add_many(courses, skill)
+    return bool(courses)
+
+
+def refresh_course_search_in_background(skill: str, max_results: int) -> None:
+    """Refresh a cache entry on a daemon thread unless that entry is already being refreshed."""
+    key = (skill_key(skill), max_results)
+    with _course_cache_lock:
+        if key in _refreshing:
+            return
+        _refreshing.add(key)
+    
+    def run():
+        try:
+            refresh_course_search(skill, max_results)
+        finally:
+            with _course_cache_lock:
+                _refreshing.discard(key)
+    
+    threading.Thread(target=run, name="course-cache-refresh", daemon=True).start()
+
+
+def refresh_hot_course_searches(limit: int = 20) -> int:
+    """
+    Keep the most used skills warm: re-fetch those expiring within
+    COURSE_CACHE_REFRESH_AHEAD. Run at startup and every
+    COURSE_CACHE_REFRESH_INTERVAL seconds by the app (main.py).
+
+    Returns:
+        Number of entries refreshed
+    """
+    due = get_course_cache().due_for_refresh(limit, Config.COURSE_CACHE_REFRESH_AHEAD)
+    refreshed = sum(1 for skill, max_results in due if refresh_course_search(skill, max_results))
+    if due:
+        logger.info(f"Refreshed {refreshed}/{len(due)} hot course searches")
+    return refreshed
+
+
+def search_youtube_api(skill: str, max_results: int = 5, reserve: int = 0) -> List[dict]:
     """
     Search YouTube for educational courses on a specific skill.
     
+    The first query variant usually fills max_results on its own; only when
+    it falls short are the remaining variants sent, together in one batch
+    call. Results keep the variant order and are de-duplicated by
+    video/playlist id.
+    Every call is admitted against the daily quota budget first; once the
+    budget is spent nothing is sent and [] is returned. A variant that
+    fails gives its units back without losing the other variants' results.
+    
     Args:
         skill: The skill to search for (e.g., "Python programming", "Machine Learning")
         max_results: Maximum number of results to return (default: 5)
+        reserve: Quota units that must remain unspent (see admit_search)
     
     Returns:
         List of course dictionaries with:
@@ -59,103 +364,261 @@ def search_youtube_courses(skill: str, max_results: int = 5) -> List[dict]:
         logger.warning(f"YouTube service unavailable, returning empty results for '{skill}'")
         return []
     
+    # Search query optimized for educational content
+    search_queries = course_search_queries(skill)
+    
+    all_results = []
+    seen_ids = set()
+    
+    if not admit_search(reserve):
+        logger.info(f"YouTube quota budget spent, not searching for '{skill}'")
+        return []
     try:
-        # Search query optimized for educational content
-        search_queries = [
-            f"{skill} full course tutorial",
-            f"learn {skill} for beginners complete",
-            f"{skill} programming tutorial"
-        ]
+        collect_course_items(search_youtube_variant(youtube, search_queries[0], max_results), all_results, seen_ids, max_results)
+    except Exception as e:
+        note_api_error(e)
+        get_quota_accountant().refund(Config.YOUTUBE_SEARCH_COST)
+        logger.error(f"YouTube API search failed for '{skill}': {e}")
+        return []
+    
+    if len(all_results) < max_results:
+        admitted = [query for query in search_queries[1:] if admit_search(reserve)]
+        if admitted:
+            # One batch call on this thread's keep-alive connection
+            responses = execute_youtube_batch(youtube, [search_youtube_request(youtube, query, max_results) for query in admitted])
+            for items in responses:
+                # Keep what the other variants found
+                collect_course_items(items or [], all_results, seen_ids, max_results)
+            unanswered = sum(1 for items in responses if items is None)
+            get_quota_accountant().refund(unanswered * Config.YOUTUBE_SEARCH_COST)
+    
+    logger.info(f"Found {len(all_results)} YouTube courses for skill: {skill}")
+    return all_results[:max_results]
+
+
+def course_search_queries(skill: str) -> List[str]:
+    """Query variants tried for a skill, best first."""
+    return [
+        f"{skill} full course tutorial",
+        f"learn {skill} for beginners complete",
+        f"{skill} programming tutorial"
+    ]
+
+
+def search_youtube_request(youtube, query: str, max_results: int):
+    """search().list request for one query variant."""
+    # Long videos/playlists (high quality)
+    return youtube.search().list(
+        part="snippet",
+        q=query,
+        type="video,playlist",
+        maxResults=max_results,
+        order="relevance",
+        relevanceLanguage="en",
+        safeSearch="strict"
+    )
+
+
+def search_youtube_variant(youtube, query: str, max_results: int) -> List[dict]:
+    """Raw search items for one query variant."""
+    response = execute_youtube_request(search_youtube_request(youtube, query, max_results))
+    return response.get('items', [])
+
+
+def collect_course_items(items: List[dict], all_results: List[dict], seen_ids: set, max_results: int) -> None:
+    """Append search items as course dicts, skipping ids already seen, up to max_results."""
+    for item in items:
+        if len(all_results) >= max_results:
+            return
         
-        all_results = []
-        seen_ids = set()
+        id_data = item['id']
+        if 'videoId' in id_data:
+            video_id = id_data['videoId']
+            url = f"https://www.youtube.com/watch?v={video_id}"
+        elif 'playlistId' in id_data:
+            video_id = id_data['playlistId']
+            url = f"https://www.youtube.com/playlist?list={video_id}"
+        else:
+            continue
         
-        for query in search_queries:
-            if len(all_results) >= max_results:
-                break
-                
-            # First try: Long videos/playlists (high quality)
-            request = youtube.search().list(
-                part="snippet",
-                q=query,
-                type="video,playlist",
-                maxResults=max_results,
-                order="relevance",
-                relevanceLanguage="en",
-                safeSearch="strict"
-            )
-            
-            response = request.execute()
-            items = response.get('items', [])
-            
-            # If no results, retry without duration filter or specific type
-            if not items:
-                continue
-            
-            for item in items:
-                id_data = item['id']
-                if 'videoId' in id_data:
-                    video_id = id_data['videoId']
-                    url = f"https://www.youtube.com/watch?v={video_id}"
-                elif 'playlistId' in id_data:
-                    video_id = id_data['playlistId']
-                    url = f"https://www.youtube.com/playlist?list={video_id}"
-                else:
-                    continue
-                
-                # Skip duplicates
-                if video_id in seen_ids:
-                    continue
-                seen_ids.add(video_id)
-                
-                snippet = item['snippet']
-                
-                # Check if it looks like educational content
-                title_lower = snippet['title'].lower()
-                is_educational = True # Trust the query
-                
-                course = {
-                    'video_id': video_id,
-                    'title': snippet['title'],
-                    'description': snippet.get('description', '')[:200],
-                    'url': url,
-                    'thumbnail': snippet['thumbnails'].get('high', snippet['thumbnails'].get('default', {})).get('url', ''),
-                    'channel': snippet.get('channelTitle', 'Unknown'),
-                    'is_educational': is_educational
-                }
-                
-                all_results.append(course)
-                
-                if len(all_results) >= max_results:
-                    break
+        # Skip duplicates
+        if video_id in seen_ids:
+            continue
+        seen_ids.add(video_id)
         
-        logger.info(f"Found {len(all_results)} YouTube courses for skill: {skill}")
-        return all_results[:max_results]
+        snippet = item['snippet']
         
-    except Exception as e:
-        logger.error(f"YouTube API search failed for '{skill}': {e}")
-        return []
+        all_results.append({
+            'video_id': video_id,
+            'title': snippet['title'],
+            'description': snippet.get('description', '')[:200],
+            'url': url,
+            'thumbnail': snippet['thumbnails'].get('high', snippet['thumbnails'].get('default', {})).get('url', ''),
+            'channel': snippet.get('channelTitle', 'Unknown'),
+            'is_educational': True  # Trust the query
+        })
+
 
+def search_youtube_api_batch(skills: List[str], max_results: int = 5) -> Dict[str, List[dict]]:
+    """
+    search_youtube_api for several skills using the API's batch HTTP endpoint.
+    
+    The first query variant of every skill goes out in a single batch
+    request; the remaining variants follow in one more batch only for the
+    skills still short of max_results. Each search in a batch is admitted
+    against the quota budget; searches over budget are left out. If a
+    batch call fails, the units of its searches are refunded and the
+    skills that still have no results are searched with individual
+    requests instead.
+    
+    Args:
+        skills: Skills to search for
+        max_results: Maximum number of results per skill
+    
+    Returns:
+        Dictionary mapping each skill to its course list
+    """
+    youtube = get_youtube_service()
+    
+    if not youtube:
+        logger.warning(f"YouTube service unavailable, returning empty results for {len(skills)} skills")
+        return {skill: [] for skill in skills}
+    
+    collected = {skill: ([], set()) for skill in skills}
+    queries = {skill: course_search_queries(skill) for skill in skills}
+    batch_failed = False
+    
+    for variants in (slice(0, 1), slice(1, None)):
+        short = [skill for skill in skills if len(collected[skill][0]) < max_results]
+        if not short:
+            break
+        requests = [
+            (skill, search_youtube_request(youtube, query, max_results))
+            for skill in short for query in queries[skill][variants]
+        ]
+        requests = [(skill, request) for skill, request in requests if admit_search()]
+        if not requests:
+            logger.info(f"YouTube quota budget spent, not searching for {len(short)} skills")
+            break
+        responses = execute_youtube_batch(youtube, [request for _, request in requests])
+        unanswered = sum(1 for items in responses if items is None)
+        if unanswered:
+            # Searches in a failed batch call were never run; give their units back
+            get_quota_accountant().refund(unanswered * Config.YOUTUBE_SEARCH_COST)
+            batch_failed = True
+        for (skill, _), items in zip(requests, responses):
+            all_results, seen_ids = collected[skill]
+            collect_course_items(items or [], all_results, seen_ids, max_results)
+        if batch_failed:
+            break
+    
+    missing = [skill for skill in skills if not collected[skill][0]]
+    if batch_failed and missing:
+        logger.warning(f"Batched YouTube search failed; searching {len(missing)} skills individually")
+        with ThreadPoolExecutor(max_workers=min(len(missing), Config.COURSE_FETCH_WORKERS)) as executor:
+            for skill, results in zip(missing, executor.map(search_youtube_api, missing, [max_results] * len(missing))):
+                collected[skill] = (results, None)
+    
+    logger.info(f"Found YouTube courses for {sum(1 for r, _ in collected.values() if r)}/{len(skills)} skills in batch")
+    return {skill: all_results for skill, (all_results, _) in collected.items()}
 
-def fetch_courses_for_skill_gaps(skill_gaps: List[str], max_per_skill: int = 3) -> Dict[str, List[dict]]:
+
+def execute_youtube_batch(youtube, requests: list) -> List[List[dict]]:
+    """
+    Execute API requests as batch HTTP calls (YOUTUBE_BATCH_LIMIT per call).
+    
+    Returns:
+        Search items per request, in request order; a request that failed
+        inside the batch yields [], one whose batch call failed yields None
+    """
+    responses = {}
+    
+    def callback(request_id, response, exception):
+        if exception is not None:
+            note_api_error(exception)
+            logger.warning(f"YouTube batch request {request_id} failed: {exception}")
+            return
+        responses[request_id] = response.get('items', [])
+    
+    for start in range(0, len(requests), YOUTUBE_BATCH_LIMIT):
+        chunk = range(start, min(start + YOUTUBE_BATCH_LIMIT, len(requests)))
+        batch = youtube.new_batch_http_request(callback=callback)
+        for i in chunk:
+            batch.add(requests[i], request_id=str(i))
+        try:
+            batch.execute(http=get_httplib2_http())
+        except Exception as e:
+            note_api_error(e)
+            logger.warning(f"YouTube batch call for {len(chunk)} requests failed: {e}")
+            for i in chunk:
+                responses.setdefault(str(i), None)
+    return [responses.get(str(i), []) for i in range(len(requests))]
+
+
+_course_executor = None
+
+
+def _get_course_executor() -> ThreadPoolExecutor:
+    global _course_executor
+    if _course_executor is None:
+        with _course_cache_lock:
+            if _course_executor is None:
+                _course_executor = ThreadPoolExecutor(
+                    max_workers=Config.COURSE_FETCH_WORKERS, thread_name_prefix="course-fetch"
+                )
+    return _course_executor
+
+
+def fetch_courses_for_skill_gaps(skill_gaps: List[str], max_per_skill: int = 3, deadline: float = None) -> Dict[str, List[dict]]:
     """
     Fetch YouTube courses for multiple skill gaps.
     Falls back to search URLs if API quota is exceeded.
     
+    Skills the local tier can answer (their cached search, or enough
+    matches in the course catalog) need no external call. Only the rest are
+    searched, together in one batched API call on the course worker pool.
+    Skills that have no API results by the stage deadline get whatever the
+    catalog had, else the fallback search URL, so the stage never waits
+    longer than the deadline.
+    
     Args:
         skill_gaps: List of skills to find courses for
         max_per_skill: Maximum courses to fetch per skill (default: 3)
+        deadline: Seconds to wait for the whole stage (default: Config.COURSE_STAGE_DEADLINE)
     
     Returns:
         Dictionary mapping skill names to lists of course dictionaries
     """
+    deadline = Config.COURSE_STAGE_DEADLINE if deadline is None else deadline
+    found = {}
+    missing = []
+    for skill in dict.fromkeys(skill_gaps):
+        logger.info(f"Fetching YouTube courses for skill gap: {skill}")
+        courses = local_courses(skill, max_per_skill)
+        if courses is not None:
+            found[skill] = courses
+        else:
+            missing.append(skill)
+    if missing:
+        logger.info(f"Local course recall too low for {missing}; searching YouTube")
+    
+    if missing:
+        future = _get_course_executor().submit(search_youtube_courses_batch, missing, max_per_skill)
+        try:
+            found.update(future.result(timeout=deadline))
+        except FutureTimeoutError:
+            logger.warning(f"Course search for {missing} missed the {deadline}s deadline")
+        except Exception as e:
+            logger.error(f"Course search for {missing} failed: {e}")
+    
     courses_by_skill = {}
     
     for skill in skill_gaps:
-        logger.info(f"Fetching YouTube courses for skill gap: {skill}")
-        courses = search_youtube_courses(skill, max_results=max_per_skill)
+        courses = found.get(skill)
         
-        # If API failed or returned empty, use fallback search URLs
+        # If API failed or returned empty, use partial catalog matches, then fallback search URLs
+        if not courses:
+            courses = get_course_catalog().search(skill, max_per_skill)
         if not courses:
             logger.info(f"Using fallback search URLs for: {skill}")
             courses = [generate_search_url_fallback(skill)]
@@ -200,6 +663,11 @@ Description: {course['description']}
     return "\n".join(formatted_sections)
 
 
+def is_search_fallback(course: dict) -> bool:
+    """Whether a course entry is a generate_search_url_fallback placeholder rather than a real course."""
+    return course.get('url', '').startswith(YOUTUBE_SEARCH_URL)
+
+
 # Fallback function when YouTube API is not available
 def generate_search_url_fallback(skill: str) -> dict:
     """
@@ -216,7 +684,7 @@ def generate_search_url_fallback(skill: str) -> dict:
         'video_id': None,
         'title': f"Search YouTube for {skill} courses",
         'description': f"Find the best {skill} courses on YouTube",
-        'url': f"https://www.youtube.com/results?search_query={search_query}",
+        'url': f"{YOUTUBE_SEARCH_URL}{search_query}",
         'thumbnail': "https://i.ytimg.com/vi/default/hqdefault.jpg",
         'channel': "YouTube Search",
         'is_educational': True
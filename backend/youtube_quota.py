@@ -0,0 +1,150 @@
+"""
+YouTube Quota Accounting for ResuMatch
+Daily API unit budget shared by all workers, checked before every YouTube call
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Optional
+from zoneinfo import ZoneInfo
+import logging
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS youtube_quota (
+    day TEXT PRIMARY KEY,
+    used INTEGER NOT NULL DEFAULT 0,
+    exhausted INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# YouTube Data API quotas reset at midnight Pacific Time
+QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+
+
+def quota_day(now: Optional[datetime] = None) -> str:
+    """The quota day (Pacific date) a moment belongs to."""
+    return (now or datetime.now(QUOTA_TIMEZONE)).astimezone(QUOTA_TIMEZONE).date().isoformat()
+
+
+class QuotaAccountant:
+    """
+    Units spent against the YouTube Data API per quota day.
+
+    Units are reserved before a request is sent (try_spend), so concurrent
+    requests and workers sharing the SQLite file can never overshoot the
+    budget together. When the API itself reports the quota as exceeded the
+    day is marked exhausted and every further reservation is refused
+    without touching the network or the database until the day rolls over.
+    """
+
+    def __init__(self, path: str, budget: int):
+        self.path = path
+        self.budget = budget
+        self._exhausted_day = None
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._connect().executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def try_spend(self, units: int, reserve: int = 0) -> bool:
+        """
+        Reserve units for a request if the day's budget allows it.
+
+        Args:
+            units: Cost of the request
+            reserve: Units that must stay unspent afterwards (lets background
+                work leave headroom for user-facing requests)
+
+        Returns:
+            True if the request may be sent
+        """
+        day = quota_day()
+        if self._exhausted_day == day:
+            return False
+        conn = self._connect()
+        conn.execute("INSERT OR IGNORE INTO youtube_quota (day) VALUES (?)", (day,))
+        cursor = conn.execute(
+            "UPDATE youtube_quota SET used = used + ? WHERE day = ? AND exhausted = 0 AND used + ? <= ?",
+            (units, day, units, self.budget - reserve)
+        )
+        if cursor.rowcount:
+            return True
+        # Only a spent budget closes the day; a request that merely does not fit leaves it open
+        if self._check_exhausted(day):
+            logger.warning(f"YouTube quota budget of {self.budget} units used up for {day}")
+        return False
+
+    def _check_exhausted(self, day: str) -> bool:
+        """Re-read the day's row and remember whether nothing more can be spent."""
+        row = self._connect().execute(
+            "SELECT used, exhausted FROM youtube_quota WHERE day = ?", (day,)
+        ).fetchone()
+        exhausted = bool(row) and (bool(row[1]) or row[0] >= self.budget)
+        self._exhausted_day = day if exhausted else None
+        return exhausted
+
+    def refund(self, units: int) -> None:
+        """Give back units reserved for requests that were never sent or answered."""
+        if units <= 0:
+            return
+        day = quota_day()
+        self._connect().execute(
+            "UPDATE youtube_quota SET used = MAX(0, used - ?) WHERE day = ?", (units, day)
+        )
+        self._check_exhausted(day)
+
+    def exhaust(self) -> None:
+        """Record that the API refused a request for quota reasons; nothing more is sent today."""
+        day = quota_day()
+        if self._exhausted_day == day:
+            return
+        self._exhausted_day = day
+        self._connect().execute(
+            "INSERT INTO youtube_quota (day, exhausted) VALUES (?, 1) "
+            "ON CONFLICT(day) DO UPDATE SET exhausted = 1",
+            (day,)
+        )
+        logger.warning(f"YouTube API reported its quota exceeded for {day}; using cache and fallbacks until reset")
+
+    def usage(self) -> dict:
+        """Today's usage: {'day', 'budget', 'used', 'remaining', 'exhausted'}."""
+        day = quota_day()
+        row = self._connect().execute(
+            "SELECT used, exhausted FROM youtube_quota WHERE day = ?", (day,)
+        ).fetchone()
+        used, exhausted = row if row else (0, 0)
+        exhausted = bool(exhausted) or self._exhausted_day == day
+        return {
+            'day': day,
+            'budget': self.budget,
+            'used': used,
+            'remaining': 0 if exhausted else max(0, self.budget - used),
+            'exhausted': exhausted
+        }
+
+    def remaining(self) -> int:
+        return self.usage()['remaining']
+
+
+def is_quota_error(error: Exception) -> bool:
+    """Whether a googleapiclient error means the daily quota is gone."""
+    status = getattr(getattr(error, 'resp', None), 'status', None)
+    if status != 403:
+        return False
+    reason = getattr(error, 'reason', None) or ''
+    content = getattr(error, 'content', b'') or b''
+    if isinstance(content, bytes):
+        content = content.decode('utf-8', 'replace')
+    return any(marker in f"{reason} {content}" for marker in ('quotaExceeded', 'dailyLimitExceeded'))